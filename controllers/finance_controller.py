@@ -12,15 +12,8 @@ class FinanceController:
         return finance
 
     def get_finance(self, team_id):
-        finance_data = self.db_manager.get_finance_by_team_id(team_id)
-        if finance_data:
-            finance = Finance(
-                team_id=finance_data['team_id'],
-                budget=finance_data['budget'],
-                revenue=finance_data['revenue'],
-                expenses=finance_data['expenses']
-            )
-            finance.id = finance_data['id']
+        finance = self.db_manager.load_finance(team_id)
+        if finance:
             print(f"Retrieved Finance: {finance}.")
             return finance
         else:
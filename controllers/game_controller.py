@@ -1,4 +1,5 @@
 import pygame
+from functools import partial
 from views.menu_view import MenuView
 from views.team_view import TeamView
 from views.player_view import PlayerView
@@ -15,12 +16,10 @@ from controllers.league_controller import LeagueController
 from controllers.finance_controller import FinanceController
 from controllers.transfer_controller import TransferController
 from controllers.settings_controller import SettingsController
-from database.db_manager import DatabaseManager
+from database.db_manager import get_database_manager
+from database.async_db import AsyncDatabase
 from utils.logger import setup_logger
-from models.team import Team
-from models.player import Player
-from models.match import Match
-from models.league import League
+from utils.constants import SAVE_GAME_PATH, AUTOSAVE_INTERVAL, DATA_REFRESH_INTERVAL, LIST_PAGE_SIZE
 
 class GameController:
     def __init__(self):
@@ -34,8 +33,10 @@ class GameController:
         # Initialize Logger
         self.logger = setup_logger('game_controller_logger', 'logs/game_controller.log')
 
-        # Initialize DatabaseManager
-        self.db_manager = DatabaseManager()
+        # Initialize the shared DatabaseManager; the game runs against an in-memory copy of the save
+        self.db_manager = get_database_manager(SAVE_GAME_PATH, in_memory=True, autosave_interval=AUTOSAVE_INTERVAL)
+        # Queries for rendering run in the background so a slow one never stalls a frame
+        self.async_db = AsyncDatabase(self.db_manager)
 
         # Initialize Controllers
         self.team_controller = TeamController(self.db_manager)
@@ -48,14 +49,14 @@ class GameController:
 
         # Initialize Views
         self.menu_view = MenuView(self.screen)
-        self.team_view = TeamView(self.screen)
+        self.team_view = TeamView(self.screen, db_manager=self.db_manager)
         self.player_view = PlayerView(self.screen)
         self.match_view = MatchView(self.screen)
         self.league_view = LeagueView(self.screen)
         self.finance_view = FinanceView(self.screen)
         self.settings_view = SettingsView(self.screen)
         self.transfer_view = TransferView(self.screen)
-        self.team_selection_view = TeamSelectionView(self.screen)
+        self.team_selection_view = TeamSelectionView(self.screen, db_manager=self.db_manager)
 
         # Link SettingsController with SettingsView
         self.settings_controller.settings_view = self.settings_view
@@ -63,6 +64,9 @@ class GameController:
         # Set the initial view to the main menu
         self.current_view = self.menu_view
 
+        # after_id of every page visited in each paged list, so Previous Page can step back
+        self.list_pages = {'players': [0], 'matches': [0], 'available_players': [0]}
+
     def start_game(self):
         self.logger.info("Game started.")
         while self.running:
@@ -77,12 +81,15 @@ class GameController:
             if selected_option:
                 self.logger.info(f"Menu selection: {selected_option}")
                 self.handle_selection(selected_option)
+                # The selection may have changed data on screen
+                self.async_db.invalidate()
 
             self.update()
             self.render()
             self.clock.tick(60)  # Limit to 60 FPS
 
-        self.db_manager.close()
+        self.async_db.close()
+        self.db_manager.close()  # Flushes the in-memory save back to disk
         pygame.quit()
         self.logger.info("Game closed.")
 
@@ -92,13 +99,14 @@ class GameController:
             if self.current_view == self.menu_view:
                 if selection == "Start Game":
                     self.logger.info("Starting a new game...")
-                    self.db_manager.initialize_english_teams()  # Initialize English teams
-                    self.current_view = TeamSelectionView(self.screen, self.game_state)  # Set to team selection view
+                    self.db_manager.new_game_from_template()  # Clone the prebuilt starting world
+                    self.current_view = TeamSelectionView(self.screen, self.game_state, self.db_manager)  # Set to team selection view
                 elif selection == "Load Game":
                     self.logger.info("Loading game...")
                     self.current_view = self.team_view  # Example transition
                 elif selection == "Settings":
                     self.logger.info("Opening settings...")
+                    self.settings_controller.load_settings()
                     self.current_view = self.settings_view
                 elif selection == "Exit":
                     self.logger.info("Exiting game...")
@@ -135,7 +143,9 @@ class GameController:
                     self.logger.info("Viewing team players.")
                     self.current_view = self.player_view
             elif self.current_view == self.player_view:
-                if selection == "Back to Team Menu":
+                if selection in ("Next Page", "Previous Page"):
+                    self.turn_page('players', self.player_view.players, selection == "Next Page")
+                elif selection == "Back to Team Menu":
                     self.logger.info("Returning to team management from player view.")
                     self.current_view = self.team_view
                 elif selection == "View Player Details":
@@ -155,17 +165,33 @@ class GameController:
                     # Implement updating player contract
                     self.logger.info("Player contract updating not yet implemented.")
             elif self.current_view == self.match_view:
-                if selection == "Back to Main Menu":
+                if selection in ("Next Page", "Previous Page"):
+                    forward = selection == "Next Page"
+                    if self.turn_page('matches', self.match_view.matches, forward):
+                        # Stepping off either end of a page lands on the adjoining match
+                        self.match_view.match_index = 0 if forward else LIST_PAGE_SIZE - 1
+                elif selection == "Back to Main Menu":
                     self.logger.info("Returning to main menu from match view.")
                     self.current_view = self.menu_view
                 elif selection == "View Match Details":
                     self.logger.info("Viewing match details.")
-                    # Implement match details viewing
-                    self.logger.info("Match details viewing not yet implemented.")
+                    match = self.match_view.selected_match
+                    if match and match.home_score is not None:
+                        # Older matches have no stored log and are replayed from their seed
+                        self.match_view.show_details(match, self.match_controller.get_match_commentary(match.id))
+                    else:
+                        self.logger.info("The selected match has not been played yet.")
+                elif selection == "Back to Matches":
+                    self.match_view.close_details()
                 elif selection == "Simulate Match":
                     self.logger.info("Simulating a match.")
-                    # Implement match simulation
-                    self.logger.info("Match simulation not yet implemented.")
+                    match = self.match_view.selected_match
+                    events = self.match_controller.play_match(match.id) if match and match.home_score is None else None
+                    if events is not None:
+                        # The engine runs as the playback advances; the result is saved at full time
+                        self.match_view.start_playback(match, events)
+                    else:
+                        self.logger.info("The selected match has already been played.")
                 elif selection == "Delete Match":
                     self.logger.info("Deleting a match.")
                     # Implement match deletion
@@ -207,7 +233,9 @@ class GameController:
                     # Implement budget updating
                     self.logger.info("Budget updating not yet implemented.")
             elif self.current_view == self.transfer_view:
-                if selection == "Back to Main Menu":
+                if selection in ("Next Page", "Previous Page"):
+                    self.turn_page('available_players', self.transfer_view.available_players, selection == "Next Page")
+                elif selection == "Back to Main Menu":
                     self.logger.info("Returning to main menu from transfer view.")
                     self.current_view = self.menu_view
                 elif selection == "Buy Player":
@@ -227,7 +255,38 @@ class GameController:
 
     def update(self):
         # Update game state if needed
-        pass
+        self.async_db.pump()  # Collect background query results
+        if self.current_view == self.match_view:
+            self.match_view.advance_playback(self.clock.get_time() / 1000)
+        self.db_manager.maybe_autosave()
+
+    def _latest(self, key, fn, default=None):
+        """Return the last loaded data for key, refreshing it in the background when stale."""
+        return self.async_db.latest(key, fn, default=default, max_age=DATA_REFRESH_INTERVAL)
+
+    def turn_page(self, key, shown, forward):
+        """
+        Move the paged list key to the page after the last id in shown, or back one page.
+
+        Returns True if the page changed; a short page is the last one, and the
+        first page has nothing before it.
+        """
+        pages = self.list_pages[key]
+        if forward:
+            if len(shown) < LIST_PAGE_SIZE:
+                return False
+            pages.append(shown[-1].id)
+        elif len(pages) > 1:
+            pages.pop()
+        else:
+            return False
+        return True
+
+    def _latest_page(self, key, fn):
+        """Return the page of key the player has paged to, loaded with fn(after_id, LIST_PAGE_SIZE)."""
+        after_id = self.list_pages[key][-1]
+        return self._latest((key, after_id), partial(fn, after_id, LIST_PAGE_SIZE), default=[])
+
 
     def render(self):
         """Render the current view"""
@@ -237,15 +296,9 @@ class GameController:
             self.current_view.display_menu()
         elif isinstance(self.current_view, TeamView):
             try:
-                teams = self.team_controller.db_manager.get_all_teams()
+                teams = self._latest('team_models', self.team_controller.db_manager.load_teams)
                 if teams:
-                    team = Team(
-                        name=teams[0]['name'],
-                        formation=teams[0]['formation'],
-                        tactics=teams[0]['tactics']
-                    )
-                    team.id = teams[0]['id']
-                    self.team_view.display_team(team)
+                    self.team_view.display_team(teams[0])
                 else:
                     # No teams found, display empty state
                     self.team_view.display_empty_state()
@@ -253,44 +306,23 @@ class GameController:
                 self.logger.error(f"Error rendering team view: {str(e)}")
                 self.current_view = self.menu_view  # Fallback to menu if error
         elif isinstance(self.current_view, PlayerView):
-            # Example: Display all players
-            players = self.player_controller.db_manager.get_all_players()
-            player_objects = [Player(
-                name=p['name'],
-                position=p['position'],
-                skills=p['skills'],
-                morale=p['morale'],
-                contract_end=p['contract_end']
-            ) for p in players]
-            for player, p in zip(player_objects, players):
-                player.id = p['id']
+            # Only one page fits on screen, so only that page is queried
+            player_objects = self._latest_page('players', self.player_controller.db_manager.page_players)
             self.player_view.display_players(player_objects)
+        elif isinstance(self.current_view, MatchView) and self.match_view.playback is not None:
+            self.match_view.display_playback()
+        elif isinstance(self.current_view, MatchView) and self.match_view.details is not None:
+            self.match_view.display_match_details()
         elif isinstance(self.current_view, MatchView):
-            # Example: Display all matches
-            matches = self.match_controller.db_manager.get_all_matches()
-            match_objects = [Match(
-                home_team=match['home_team_id'],
-                away_team=match['away_team_id'],
-                date=match['date'],
-                home_score=match['home_score'],
-                away_score=match['away_score']
-            ) for match in matches]
-            for match, m in zip(match_objects, matches):
-                match.id = m['id']
+            match_objects = self._latest_page('matches', self.match_controller.list_all_matches)
             self.match_view.display_matches(match_objects)
         elif isinstance(self.current_view, LeagueView):
             # Example: Display all leagues
-            leagues = self.league_controller.db_manager.get_all_leagues()
-            league_objects = [League(
-                name=league['name'],
-                season=league['season']
-            ) for league in leagues]
-            for league, l in zip(league_objects, leagues):
-                league.id = l['id']
+            league_objects = self._latest('leagues', self.league_controller.db_manager.load_leagues, default=[])
             self.league_view.display_leagues(league_objects)
         elif isinstance(self.current_view, FinanceView):
             # Example: Display finance for first team
-            finances = self.finance_controller.db_manager.get_all_finances()
+            finances = self._latest('finances', self.finance_controller.db_manager.get_all_finances)
             if finances:
                 finance = finances[0]
                 self.finance_view.display_finances(finance)
@@ -299,8 +331,8 @@ class GameController:
             self.settings_view.display_settings()
         elif isinstance(self.current_view, TransferView):
             # Example: List available players and teams
-            available_players = self.transfer_controller.list_available_players()
-            teams = self.team_controller.db_manager.get_all_teams()
+            available_players = self._latest_page('available_players', self.transfer_controller.list_available_players)
+            teams = self._latest('teams', self.team_controller.db_manager.get_all_teams, default=[])
             self.transfer_view.display_transfers(available_players, teams)
         else:
             self.logger.warning(f"No render method defined for view: {self.current_view}")
@@ -310,6 +342,9 @@ class GameController:
     def initialize_new_game(self, selected_team):
         """Initialize a new game state"""
         try:
+            if 'id' in selected_team:
+                # The player's club always gets the full match engine
+                self.db_manager.set_managed_team_id(selected_team['id'])
             # Create the selected team
             self.team_controller.create_team(
                 name=selected_team['name'],
@@ -12,10 +12,8 @@ class LeagueController:
         return league
 
     def get_league(self, league_id):
-        league_data = self.db_manager.get_league_by_id(league_id)
-        if league_data:
-            league = League(league_data['name'], league_data['season'])
-            league.id = league_data['id']
+        league = self.db_manager.load_league(league_id)
+        if league:
             print(f"Retrieved League: {league}.")
             return league
         else:
@@ -34,12 +32,16 @@ class LeagueController:
         self.db_manager.delete_league(league_id)
         print(f"League ID {league_id} deleted successfully.")
 
+    def get_standings(self, country=None, division=None):
+        return self.db_manager.get_standings(country, division)
+
+    def end_season(self, season, end_date=None):
+        summary = self.db_manager.archive_season(season, end_date)
+        if summary is not None:
+            print(f"Season '{season}' archived: {summary['matches']} matches moved to the archive.")
+        return summary
+
     def list_all_leagues(self):
-        leagues_data = self.db_manager.get_all_leagues()
-        leagues = []
-        for data in leagues_data:
-            league = League(data['name'], data['season'])
-            league.id = data['id']
-            leagues.append(league)
+        leagues = self.db_manager.load_leagues()
         print(f"Retrieved {len(leagues)} leagues.")
         return leagues
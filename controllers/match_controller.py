@@ -1,11 +1,20 @@
 from models.match import Match
 from database.db_manager import DatabaseManager
-import random
+from engine import ENGINE_VERSION, MatchEngine, MatchEvent, final_score
+from engine.batch import quick_scores, simulate_scores
+from engine.event_log import commentary, describe
+from engine.parallel import SimulationPool, match_seed, simulate_fixtures
+from engine.policy import FULL, SimulationPolicy
+from engine.replay import ReplayError, load_snapshot, replay
+from utils.constants import EVENT_LOG_MATCHDAYS
 import datetime
 
 class MatchController:
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
+        self.engine = MatchEngine()
+        # Stored event logs kept after each matchday; None keeps them all
+        self.event_log_matchdays = EVENT_LOG_MATCHDAYS
 
     def create_match(self, home_team_id, away_team_id, date=None):
         if date is None:
@@ -17,51 +26,243 @@ class MatchController:
         return match
 
     def get_match(self, match_id):
-        match_data = self.db_manager.get_match_by_id(match_id)
-        if match_data:
-            match = Match(
-                home_team=match_data['home_team_id'],
-                away_team=match_data['away_team_id'],
-                date=match_data['date'],
-                home_score=match_data['home_score'],
-                away_score=match_data['away_score']
-            )
-            match.id = match_data['id']
+        match = self.db_manager.load_match(match_id)
+        if match:
             print(f"Retrieved {match}.")
             return match
         else:
             print(f"No match found with ID {match_id}.")
             return None
 
-    def simulate_match(self, match_id):
+    def rate_teams(self, team_ids):
+        """Return {team_id: TeamRatings}, served from the database's precomputed ratings."""
+        return self.db_manager.get_team_ratings(team_ids)
+
+    def match_seed(self, match_id):
+        """Return the engine seed for a match, derived from the save seed."""
+        return match_seed(self.db_manager.get_save_seed() or 0, match_id)
+
+    def simulate_match(self, match_id, seed=None):
         match = self.get_match(match_id)
         if match:
-            # Simple simulation logic: random scores
-            match.home_score = random.randint(0, 5)
-            match.away_score = random.randint(0, 5)
-            self.db_manager.update_match_score(match_id, match.home_score, match.away_score)
+            ratings = self.rate_teams([match.home_team, match.away_team])
+            for _ in self._play(match, ratings, seed):
+                pass
             print(f"Match ID {match_id} simulated: {match.home_score} - {match.away_score}.")
             return match
         else:
             print(f"Cannot simulate match. Match with ID {match_id} does not exist.")
             return None
 
-    def list_all_matches(self):
-        matches = self.db_manager.get_all_matches()
-        match_list = []
-        for match_data in matches:
-            match = Match(
-                home_team=match_data['home_team_id'],
-                away_team=match_data['away_team_id'],
-                date=match_data['date'],
-                home_score=match_data['home_score'],
-                away_score=match_data['away_score']
+    def play_match(self, match_id):
+        """
+        Play a match live, returning a generator of (event, commentary line) pairs.
+
+        Each event is produced by the engine only when the generator is advanced.
+        Once it is exhausted the result is saved exactly as simulate_match would.
+        Returns None if the match does not exist.
+        """
+        match = self.get_match(match_id)
+        if match is None:
+            return None
+        ratings = self.rate_teams([match.home_team, match.away_team])
+        team_names = self._team_names(match)
+        # Everyone who can appear in an event is in a starting eleven or on a bench
+        player_names = self._player_names(
+            player_id for team_id in (match.home_team, match.away_team)
+            for player_id in ratings[team_id].starters + ratings[team_id].bench
+        )
+        return ((event, describe(event, team_names, player_names)) for event in self._play(match, ratings))
+
+    def _play(self, match, ratings, seed=None):
+        """Yield match's events as they are played, then store the result on match and in the database."""
+        home, away = ratings[match.home_team], ratings[match.away_team]
+        # Only matches played on their derived seed can be replayed later
+        snapshot = None
+        if seed is None:
+            seed = self.match_seed(match.id)
+            snapshot = (ENGINE_VERSION, home, away)
+        events = []
+        for event in self.engine.iter_events(home, away, seed=seed):
+            events.append(event)
+            yield event
+        match.home_score, match.away_score = final_score(events)
+        self.db_manager.save_match_result(match.id, match.home_score, match.away_score, events, snapshot)
+
+    def simulation_policy(self):
+        """
+        Default policy: full engine for the managed club and its opponents,
+        quick-sim for the rest. Countries the player has opened with
+        activate_country() are fully simulated as well.
+        """
+        full_team_ids = [
+            team['id']
+            for country, simulation in self.db_manager.get_loaded_countries().items() if simulation == FULL
+            for team in self.db_manager.get_teams_by_country(country)
+        ]
+        return SimulationPolicy(self.db_manager.get_managed_team_id(), full_team_ids)
+
+    def simulate_matchday(self, date, workers=None, policy=None, pool=None):
+        """
+        Play every unplayed match on date and save all results in one transaction.
+
+        Matches that already have a result, e.g. one the player watched live,
+        are left as they are.
+
+        policy picks full or quick simulation per fixture. Full fixtures run
+        on the event engine across worker processes, each seeded from
+        (save seed, match id), so their results equal simulate_match and do not
+        depend on the worker count; pass a SimulationPool to reuse its workers
+        across matchdays. Quick fixtures get Poisson scores from the
+        teams' expected goals and no event log. Afterwards, logs older than
+        event_log_matchdays matchdays are dropped; those matches are replayed
+        from their seed when viewed.
+        """
+        matches = self.db_manager.load_unplayed_matches_on(date)
+        if not matches:
+            return []
+        if policy is None:
+            policy = self.simulation_policy()
+        ratings = self.rate_teams({team_id for match in matches for team_id in (match.home_team, match.away_team)})
+        save_seed = self.db_manager.get_save_seed() or 0
+        full = []
+        quick = []
+        for match in matches:
+            (full if policy.mode_for(match.home_team, match.away_team) == FULL else quick).append(match)
+
+        results = simulate_fixtures(
+            [(match.id, match_seed(save_seed, match.id), match.home_team, match.away_team) for match in full],
+            ratings,
+            workers=workers,
+            pool=pool
+        )
+        if quick:
+            home_scores, away_scores = quick_scores(
+                [ratings[match.home_team] for match in quick],
+                [ratings[match.away_team] for match in quick],
+                seed=[save_seed, *(match.id for match in quick)]
             )
-            match.id = match_data['id']
-            match_list.append(match)
+            results += [
+                (match.id, home_score, away_score, ())
+                for match, home_score, away_score in zip(quick, home_scores.tolist(), away_scores.tolist())
+            ]
+        scores = {match_id: (home_score, away_score) for match_id, home_score, away_score, _ in results}
+        for match in matches:
+            match.home_score, match.away_score = scores[match.id]
+        self.db_manager.save_match_results_many(
+            results, {match.id: (ENGINE_VERSION, ratings[match.home_team], ratings[match.away_team]) for match in full}
+        )
+        if self.event_log_matchdays is not None:
+            self.db_manager.prune_event_logs(self.event_log_matchdays)
+        print(f"Simulated {len(matches)} matches on {date} ({len(full)} full, {len(quick)} quick).")
+        return matches
+
+    def simulate_season(self, until=None, workers=None, policy=None):
+        """Play every unplayed matchday up to and including until, in date order."""
+        if policy is None:
+            policy = self.simulation_policy()
+        played = []
+        # One pool for the whole season, so workers start at most once
+        with SimulationPool(workers) as pool:
+            for date in self.db_manager.get_unplayed_match_dates(until):
+                played.extend(self.simulate_matchday(date, policy=policy, pool=pool))
+        return played
+
+    def simulate_matches(self, match_ids, seed=None):
+        """
+        Simulate many matches at once and save every score in one transaction.
+
+        Scores are drawn in a single vectorised call with the same distribution
+        as simulate_match, but no event log is recorded. Unknown ids are skipped.
+        """
+        matches = self.db_manager.load_matches_by_ids(match_ids)
+        if not matches:
+            return []
+        ratings = self.rate_teams({team_id for match in matches for team_id in (match.home_team, match.away_team)})
+        home_scores, away_scores = simulate_scores(
+            [ratings[match.home_team] for match in matches],
+            [ratings[match.away_team] for match in matches],
+            seed=seed
+        )
+        for match, home_score, away_score in zip(matches, home_scores.tolist(), away_scores.tolist()):
+            match.home_score = home_score
+            match.away_score = away_score
+        self.db_manager.save_match_results_many(
+            (match.id, match.home_score, match.away_score, ()) for match in matches
+        )
+        print(f"Simulated {len(matches)} matches.")
+        return matches
+
+    def replay_match(self, match_id):
+        """
+        Regenerate a fully simulated match from its seed and rating snapshots.
+
+        Returns the MatchResult, or None if the match has no replay keys.
+        Raises ReplayError if the engine cannot reproduce the recorded match.
+        """
+        info = self.db_manager.get_replay_info(match_id)
+        if info is None:
+            return None
+        return replay(
+            load_snapshot(*info['home_snapshot']),
+            load_snapshot(*info['away_snapshot']),
+            self.match_seed(match_id),
+            info['engine_version'],
+            expected_digest=info['events_digest'],
+            expected_score=(info['home_score'], info['away_score'])
+        )
+
+    def get_match_events(self, match_id):
+        """Return a match's events, replaying it when its stored log has been dropped."""
+        events = self.db_manager.get_match_events(match_id)
+        if events:
+            return [MatchEvent(**event) for event in events]
+        try:
+            result = self.replay_match(match_id)
+        except ReplayError as e:
+            print(f"Cannot replay Match ID {match_id}: {e}")
+            return []
+        return result.events if result else []
+
+    def get_match_commentary(self, match_id):
+        """Render a match's stored event log as commentary lines; quick-simmed matches have none."""
+        match = self.db_manager.load_match(match_id)
+        if match is None:
+            return []
+        events = self.get_match_events(match_id)
+        player_names = self._player_names(event.player_id for event in events if event.player_id is not None)
+        return list(commentary(events, self._team_names(match), player_names))
+
+    def _team_names(self, match):
+        return tuple(
+            (self.db_manager.get_team_by_id(team_id) or {}).get('name', f"Team {team_id}")
+            for team_id in (match.home_team, match.away_team)
+        )
+
+    def _player_names(self, player_ids):
+        player_names = {}
+        for player_id in set(player_ids):
+            player = self.db_manager.get_player_by_id(player_id)
+            if player:
+                player_names[player_id] = player['name']
+        return player_names
+
+    def list_all_matches(self, after_id=0, limit=None):
+        """
+        List matches ordered by id.
+        With a limit, return only the page of matches whose id follows after_id.
+        """
+        if limit is None:
+            match_list = list(self.db_manager.iter_matches())
+        else:
+            match_list = self.db_manager.page_matches(after_id, limit)
         print(f"Retrieved {len(match_list)} matches.")
         return match_list
 
+    def iter_matches(self, batch=500):
+        """Yield every match without materialising the whole table at once."""
+        return self.db_manager.iter_matches(batch=batch)
+
     def delete_match(self, match_id):
         self.db_manager.delete_match(match_id)
         print(f"Match ID {match_id} deleted successfully.")
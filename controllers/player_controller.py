@@ -19,16 +19,8 @@ class PlayerController:
 
     def get_player(self, player_id):
         try:
-            player_data = self.db_manager.get_player_by_id(player_id)
-            if player_data:
-                player = Player(
-                    name=player_data['name'],
-                    position=player_data['position'],
-                    skills=player_data['skills'],
-                    morale=player_data['morale'],
-                    contract_end=player_data['contract_end']
-                )
-                player.id = player_data['id']
+            player = self.db_manager.load_player(player_id)
+            if player:
                 self.logger.info(f"Retrieved player: {player}.")
                 return player
             else:
@@ -9,10 +9,17 @@ class SettingsController:
         self.settings_view = settings_view
         self.logger = setup_logger('settings_controller_logger', 'logs/settings_controller.log')
 
+    def load_settings(self):
+        """
+        Show the saved settings in the settings view.
+        """
+        self.settings_view.load_settings(self.db_manager.get_settings())
+
     def handle_settings(self):
         """
         Handle the settings menu loop.
         """
+        self.load_settings()
         running = True
         while running:
             selected_option = None
@@ -41,6 +48,10 @@ class SettingsController:
             self.logger.info("Audio setting adjusted.")
             # Audio is already adjusted in SettingsView
             pass
+        elif selection.startswith("Performance"):
+            self.logger.info("Performance profile adjusted.")
+            # Performance profile is already adjusted in SettingsView
+            pass
         elif selection == "Controls":
             self.logger.info("Opening controls settings.")
             self.display_controls()
@@ -64,9 +75,11 @@ class SettingsController:
         try:
             difficulty = self.settings_view.difficulty_levels[self.settings_view.current_difficulty]
             audio = self.settings_view.audio_settings[self.settings_view.current_audio]
+            performance = self.settings_view.performance_profiles[self.settings_view.current_performance]
             self.db_manager.set_setting('difficulty', difficulty)
             self.db_manager.set_setting('audio', audio)
-            self.logger.info(f"Settings applied: Difficulty={difficulty}, Audio={audio}")
+            self.db_manager.set_setting('performance_profile', performance)
+            self.logger.info(f"Settings applied: Difficulty={difficulty}, Audio={audio}, Performance={performance}")
             print("Settings have been applied successfully.")
         except Exception as e:
             self.logger.error(f"Error applying settings: {e}")
@@ -19,10 +19,8 @@ class TeamController:
 
     def get_team(self, team_id):
         try:
-            team_data = self.db_manager.get_team_by_id(team_id)
-            if team_data:
-                team = Team(team_data['name'], team_data['formation'], team_data['tactics'])
-                team.id = team_data['id']
+            team = self.db_manager.load_team(team_id)
+            if team:
                 self.logger.info(f"Retrieved team: {team}.")
                 return team
             else:
@@ -1,4 +1,3 @@
-from models.player import Player
 from models.team import Team
 from database.db_manager import DatabaseManager
 from utils.logger import setup_logger
@@ -13,15 +12,15 @@ class TransferController:
         Buy a player and add them to the specified team.
         """
         try:
-            finance = self.db_manager.get_finance_by_team_id(team_id)
-            if finance and finance['budget'] >= purchase_price:
-                self.db_manager.update_finance_budget(team_id, finance['budget'] - purchase_price)
-                self.db_manager.add_player_to_team(team_id, player_id)
-                self.logger.info(f"Player ID {player_id} bought by Team ID {team_id} for {purchase_price}.")
-                return True
-            else:
-                self.logger.warning(f"Insufficient budget for Team ID {team_id} to buy Player ID {player_id}.")
-                return False
+            with self.db_manager.transaction():
+                finance = self.db_manager.get_finance_by_team_id(team_id)
+                if finance and finance['budget'] >= purchase_price:
+                    self.db_manager.update_finance_budget(team_id, finance['budget'] - purchase_price)
+                    self.db_manager.add_player_to_team(team_id, player_id)
+                    self.logger.info(f"Player ID {player_id} bought by Team ID {team_id} for {purchase_price}.")
+                    return True
+            self.logger.warning(f"Insufficient budget for Team ID {team_id} to buy Player ID {player_id}.")
+            return False
         except Exception as e:
             self.logger.error(f"Error buying Player ID {player_id} for Team ID {team_id}: {e}")
             return False
@@ -31,15 +30,15 @@ class TransferController:
         Sell a player from the specified team.
         """
         try:
-            self.db_manager.remove_player_from_team(team_id, player_id)
-            finance = self.db_manager.get_finance_by_team_id(team_id)
-            if finance:
-                self.db_manager.update_finance_budget(team_id, finance['budget'] + sell_price)
-                self.logger.info(f"Player ID {player_id} sold by Team ID {team_id} for {sell_price}.")
-                return True
-            else:
-                self.logger.warning(f"No finance record found for Team ID {team_id} while selling Player ID {player_id}.")
-                return False
+            with self.db_manager.transaction():
+                self.db_manager.remove_player_from_team(team_id, player_id)
+                finance = self.db_manager.get_finance_by_team_id(team_id)
+                if finance:
+                    self.db_manager.update_finance_budget(team_id, finance['budget'] + sell_price)
+                    self.logger.info(f"Player ID {player_id} sold by Team ID {team_id} for {sell_price}.")
+                    return True
+            self.logger.warning(f"No finance record found for Team ID {team_id} while selling Player ID {player_id}.")
+            return False
         except Exception as e:
             self.logger.error(f"Error selling Player ID {player_id} from Team ID {team_id}: {e}")
             return False
@@ -49,14 +48,15 @@ class TransferController:
         Negotiate a new contract for a player.
         """
         try:
-            player = self.db_manager.get_player_by_id(player_id)
-            if player:
-                self.db_manager.update_player_contract(player_id, new_contract_end)
-                team_id = self.db_manager.get_team_of_player(player_id)
-                if team_id:
-                    self.db_manager.update_finance_expenses(team_id, salary_increase)
-                    self.logger.info(f"Contract for Player ID {player_id} updated to end on {new_contract_end} with a salary increase of {salary_increase}.")
-                    return True
+            with self.db_manager.transaction():
+                player = self.db_manager.get_player_by_id(player_id)
+                if player:
+                    self.db_manager.update_player_contract(player_id, new_contract_end)
+                    team_id = self.db_manager.get_team_of_player(player_id)
+                    if team_id:
+                        self.db_manager.update_finance_expenses(team_id, salary_increase)
+                        self.logger.info(f"Contract for Player ID {player_id} updated to end on {new_contract_end} with a salary increase of {salary_increase}.")
+                        return True
             self.logger.warning(f"Failed to negotiate contract for Player ID {player_id}.")
             return False
         except Exception as e:
@@ -74,13 +74,16 @@ class TransferController:
         except Exception as e:
             self.logger.error(f"Error handling transfer deadline for date {current_date}: {e}")
 
-    def list_available_players(self):
+    def list_available_players(self, after_id=0, limit=None):
         """
-        List all players not currently assigned to any team.
+        List players not currently assigned to any team.
+        With a limit, return only the page of players whose id follows after_id.
         """
         try:
-            players = self.db_manager.get_available_players()
-            available_players = [Player(p['name'], p['position'], p['skills'], p['morale'], p['contract_end']) for p in players]
+            if limit is None:
+                available_players = list(self.db_manager.iter_available_players())
+            else:
+                available_players = self.db_manager.page_available_players(after_id, limit)
             self.logger.info(f"Retrieved {len(available_players)} available players.")
             return available_players
         except Exception as e:
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from utils.logger import setup_logger
+
+
+class AsyncDatabase:
+    """
+    Asyncio facade that runs blocking data-access calls on worker threads.
+
+    The event loop is never run in the background: the game loop calls pump()
+    once per frame, which handles whatever queries have finished and returns
+    immediately. Views render from latest(), which hands back the last completed
+    result for a key and starts a refresh when that result is stale, so a slow
+    query never stalls a frame.
+    """
+
+    def __init__(self, db_manager, max_workers=2):
+        self.db_manager = db_manager
+        self.logger = setup_logger('async_db_logger', 'logs/async_db.log')
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db-worker')
+        self._results = {}
+        self._refreshed_at = {}
+        self._pending = {}
+
+    async def call(self, fn, *args):
+        """Await fn(*args) executed on the worker pool."""
+        return await self.loop.run_in_executor(self.executor, partial(fn, *args))
+
+    def submit(self, fn, *args):
+        """Schedule fn(*args) on the worker pool and return an asyncio task for it."""
+        return self.loop.create_task(self.call(fn, *args))
+
+    def pump(self):
+        """Run one non-blocking iteration of the event loop; call once per frame."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+
+    def latest(self, key, fn, *args, default=None, max_age=1.0):
+        """
+        Return the last completed result stored under key, or default.
+
+        If there is no result yet, or it is older than max_age seconds, and no
+        refresh is in flight, a new fn(*args) call is started in the background.
+        """
+        if key not in self._pending:
+            refreshed_at = self._refreshed_at.get(key)
+            if refreshed_at is None or time.monotonic() - refreshed_at >= max_age:
+                task = self.submit(fn, *args)
+                task.add_done_callback(partial(self._store_result, key))
+                self._pending[key] = task
+        return self._results.get(key, default)
+
+    def is_loading(self, key):
+        """Return True while a refresh for key is in flight."""
+        return key in self._pending
+
+    def invalidate(self, key=None):
+        """Mark one key, or every key, as stale so the next latest() call refreshes it."""
+        if key is None:
+            self._refreshed_at.clear()
+        else:
+            self._refreshed_at.pop(key, None)
+
+    def _store_result(self, key, task):
+        self._pending.pop(key, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        # Record the attempt either way so a failing query is not retried every frame
+        self._refreshed_at[key] = time.monotonic()
+        if error is not None:
+            self.logger.error(f"Background query '{key}' failed: {error}")
+            return
+        self._results[key] = task.result()
+
+    def close(self):
+        for task in list(self._pending.values()):
+            task.cancel()
+        self.pump()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.loop.close()
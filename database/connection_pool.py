@@ -0,0 +1,93 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+
+class ReadConnectionPool:
+    """
+    Fixed-size pool of read-only SQLite connections to one database file.
+
+    Connections are opened lazily with mode=ro and may be used from any thread,
+    one borrower at a time. With the database in WAL mode they read the last
+    committed state without blocking, or being blocked by, the writer connection.
+    """
+
+    def __init__(self, db_path, size=4, timeout=5.0):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._connections = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._initializer = None
+        self._generation = 0
+        self._synced = {}
+
+    def _open(self):
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            timeout=self.timeout
+        )
+        conn.row_factory = sqlite3.Row  # To access columns by name
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                try:
+                    conn = self._open()
+                except Exception:
+                    self._created -= 1
+                    raise
+                self._connections.append(conn)
+                return conn
+        # Every connection is borrowed; wait for one to come back
+        return self._idle.get(timeout=self.timeout)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a read-only connection for the duration of the block."""
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool is closed.")
+        conn = self._acquire()
+        try:
+            initializer, generation = self._initializer, self._generation
+            if initializer is not None and self._synced.get(id(conn)) != generation:
+                initializer(conn)
+                self._synced[id(conn)] = generation
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def set_initializer(self, initializer):
+        """
+        Run initializer(conn) on each connection before its next use.
+
+        Connections are brought up to date lazily as they are borrowed, so
+        this is cheap to call whenever per-connection state such as attached
+        databases changes.
+        """
+        with self._lock:
+            self._initializer = initializer
+            self._generation += 1
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+            self._created = 0
+            self._synced = {}
+            self._idle = queue.LifoQueue()
@@ -1,148 +1,763 @@
+import json
+import os
+import random
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
 from sqlite3 import Error
+from database.connection_pool import ReadConnectionPool
+from database.identity_map import IdentityMap
+from database.league_packs import DEFAULT_REPUTATION, available_countries, read_pack
+from database.sharding import (
+    SHARDED_TABLES, shard_alias, create_shard_schema, upgrade_shard_schema, drop_views, sync_connection
+)
+from database.migrations import migrate, get_schema_version
+from database.row_factories import (
+    PLAYER_COLUMNS, TEAM_COLUMNS, MATCH_COLUMNS, LEAGUE_COLUMNS, FINANCE_COLUMNS,
+    player_factory, team_factory, match_factory, league_factory, finance_factory
+)
+from models.player import Player
+from models.team import Team
+from models.finance import Finance
+from engine.event_log import events_digest, iter_events, pack_events
+from engine.replay import encode_snapshot, snapshot_digest
+from engine.ratings import RATINGS_VERSION, TeamRatings, rate_team
+from utils.constants import LEAGUE_PACK_DIR, TEMPLATE_DB_PATH
 from utils.logger import setup_logger
 
+# SQLite tuning applied per connection. cache_size is in KiB when negative,
+# mmap_size in bytes. WAL keeps readers unblocked and turns most commits into
+# sequential appends; 'synchronous' trades durability on power loss for speed.
+PERFORMANCE_PROFILES = {
+    'safe': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'temp_store': 'MEMORY',
+        'mmap_size': 0,
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -16000,
+        'temp_store': 'MEMORY',
+        'mmap_size': 64 * 1024 * 1024,
+    },
+    'fast-sim': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+        'mmap_size': 256 * 1024 * 1024,
+    },
+}
+DEFAULT_PERFORMANCE_PROFILE = 'balanced'
+
+# League table aggregated from played matches in {source}; 3 points for a win, 1 for a draw
+STANDINGS_SQL = """
+    SELECT team_id,
+           COUNT(*) AS played,
+           SUM(goals_for > goals_against) AS won,
+           SUM(goals_for = goals_against) AS drawn,
+           SUM(goals_for < goals_against) AS lost,
+           SUM(goals_for) AS goals_for,
+           SUM(goals_against) AS goals_against,
+           SUM(CASE WHEN goals_for > goals_against THEN 3 WHEN goals_for = goals_against THEN 1 ELSE 0 END) AS points
+    FROM (
+        SELECT home_team_id AS team_id, home_score AS goals_for, away_score AS goals_against
+        FROM {source} WHERE home_score IS NOT NULL AND away_score IS NOT NULL
+        UNION ALL
+        SELECT away_team_id, away_score, home_score
+        FROM {source} WHERE home_score IS NOT NULL AND away_score IS NOT NULL
+    )
+    GROUP BY team_id
+"""
+STANDINGS_ORDER = "ORDER BY points DESC, goals_for - goals_against DESC, goals_for DESC"
+
+# Settings that belong to one world and are not carried into a new game
+GAME_SETTINGS = ('save_seed', 'managed_team_id')
+
+# Identity map kinds whose rows are also cached as model objects, keyed by model class
+_MODEL_KINDS = {'player': Player, 'team': Team, 'finance': Finance}
+
+# Open managers shared across views and controllers, keyed by db_path
+_shared_managers = {}
+
+
+def get_database_manager(db_path='savegames/game.db', **kwargs):
+    """
+    Return the process-wide DatabaseManager for db_path, creating it on first use.
+
+    kwargs are only used when the manager is created, so the first caller (normally
+    GameController) decides the mode and the views simply receive the same instance.
+    """
+    manager = _shared_managers.get(db_path)
+    if manager is None or manager.conn is None:
+        manager = DatabaseManager(db_path, **kwargs)
+        _shared_managers[db_path] = manager
+    return manager
+
 class DatabaseManager:
-    def __init__(self, db_path='savegames/game.db'):
+    def __init__(self, db_path='savegames/game.db', performance_profile=None, in_memory=False, autosave_interval=None,
+                 cache_size=2048, read_connections=4):
+        """
+        Open the savegame at db_path.
+
+        With in_memory=True the save is copied into a private :memory: database and
+        all reads and writes run there; save() (and autosave/close) write it back
+        to db_path. autosave_interval is in seconds, None disables autosave.
+        cache_size bounds the identity map used by the get_*_by_id lookups.
+
+        Writes go through a single connection guarded by a lock and may come from
+        any thread. For an on-disk save, reads outside a transaction are served by
+        a pool of read_connections read-only connections so worker threads can
+        query in parallel with the writer.
+        """
         self.logger = setup_logger('db_manager_logger', 'logs/db_manager.log')
         self.db_path = db_path
+        self.in_memory = in_memory
+        self.autosave_interval = autosave_interval
         self.conn = None
+        self.read_pool = None
+        self.read_connections = read_connections
+        self._write_lock = threading.RLock()
+        self._lock_owner = None
+        self._transaction_depth = 0
+        self._last_save = time.monotonic()
+        self.identity_map = IdentityMap(max_size=cache_size)
+        self.team_ratings = {}  # In-memory mirror of the clean team_ratings rows
+        self._loaded_countries = None  # Names of imported countries, read on first use
+        self._shard_aliases = []  # Attached shard schemas, searched by writes to sharded tables
+        self.performance_profile = None
         self.connect()
         self.setup_tables()
+        self._sync_shards()
+        if performance_profile is None:
+            settings = self.get_settings() or {}
+            performance_profile = settings.get('performance_profile') or DEFAULT_PERFORMANCE_PROFILE
+        self.apply_performance_profile(performance_profile)
 
     def connect(self):
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            if self.in_memory:
+                # Load the whole save into RAM with the online backup API
+                self.conn = sqlite3.connect(':memory:', check_same_thread=False)
+                disk_conn = sqlite3.connect(self.db_path)
+                try:
+                    disk_conn.backup(self.conn)
+                finally:
+                    disk_conn.close()
+                self.logger.info(f"Loaded database from {self.db_path} into memory")
+            else:
+                self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                if self.db_path != ':memory:' and self.read_connections > 0:
+                    self.read_pool = ReadConnectionPool(self.db_path, size=self.read_connections)
+                self.logger.info(f"Connected to database at {self.db_path}")
             self.conn.row_factory = sqlite3.Row  # To access columns by name
-            self.logger.info(f"Connected to database at {self.db_path}")
+            self.conn.execute("PRAGMA foreign_keys = ON")
         except Error as e:
             self.logger.error(f"Error connecting to database: {e}")
 
+    @contextmanager
+    def _writer(self):
+        """Hold the write lock and yield the writer connection."""
+        with self._write_lock:
+            previous_owner = self._lock_owner
+            self._lock_owner = threading.get_ident()
+            try:
+                yield self.conn
+            finally:
+                self._lock_owner = previous_owner
+
+    @contextmanager
+    def _reader(self):
+        """
+        Yield a connection for a read query.
+
+        Inside this thread's own transaction the writer connection is used so
+        uncommitted writes are visible; otherwise a pooled read-only connection
+        is borrowed when one is available.
+        """
+        if self.read_pool is None or self._lock_owner == threading.get_ident():
+            with self._writer() as conn:
+                yield conn
+        else:
+            with self.read_pool.connection() as conn:
+                yield conn
+
+    def save(self):
+        """
+        Persist the working database to db_path.
+
+        In on-disk mode every write is already durable, so this only flushes a
+        pending implicit transaction. In in-memory mode the whole database is
+        copied back with the backup API.
+        """
+        try:
+            with self._writer() as conn:
+                if self._transaction_depth > 0:
+                    self.logger.warning("Cannot save while a transaction is open.")
+                    return False
+                conn.commit()
+                if self.in_memory:
+                    disk_conn = sqlite3.connect(self.db_path)
+                    try:
+                        conn.backup(disk_conn)
+                    finally:
+                        disk_conn.close()
+                    self.logger.info(f"In-memory database saved to {self.db_path}.")
+            self._last_save = time.monotonic()
+            return True
+        except Error as e:
+            self.logger.error(f"Error saving database to {self.db_path}: {e}")
+            return False
+
+    def maybe_autosave(self):
+        """Save the in-memory database if the autosave interval has elapsed."""
+        if not self.in_memory or self.autosave_interval is None:
+            return False
+        if time.monotonic() - self._last_save < self.autosave_interval:
+            return False
+        return self.save()
+
     def setup_tables(self):
+        """Bring the schema up to date by running any pending migrations."""
         try:
-            cursor = self.conn.cursor()
-            
-            # Check if necessary columns exist in teams table
-            cursor.execute("PRAGMA table_info(teams)")
-            columns = cursor.fetchall()
-            columns_dict = {column[1]: column for column in columns}
-            
-            # Add missing 'country' column if it doesn't exist
-            if 'country' not in columns_dict:
-                cursor.execute("ALTER TABLE teams ADD COLUMN country TEXT DEFAULT 'England'")
-            # Add missing 'division' column if it doesn't exist
-            if 'division' not in columns_dict:
-                cursor.execute("ALTER TABLE teams ADD COLUMN division INTEGER DEFAULT 1")
-            
-            # Create 'teams' table if it does not exist
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS teams (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    formation TEXT,
-                    tactics TEXT,
-                    country TEXT DEFAULT 'England',
-                    division INTEGER DEFAULT 1
-                );
-            """)
-            # Players table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS players (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    position TEXT,
-                    skills INTEGER,
-                    morale INTEGER,
-                    contract_end INTEGER
-                );
-            """)
-            # Team_Players join table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS team_players (
-                    team_id INTEGER,
-                    player_id INTEGER,
-                    PRIMARY KEY (team_id, player_id),
-                    FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE CASCADE,
-                    FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE
-                );
-            """)
-            # Matches table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS matches (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    home_team_id INTEGER,
-                    away_team_id INTEGER,
-                    date TEXT,
-                    home_score INTEGER,
-                    away_score INTEGER,
-                    FOREIGN KEY (home_team_id) REFERENCES teams (id),
-                    FOREIGN KEY (away_team_id) REFERENCES teams (id)
-                );
-            """)
-            # Leagues table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS leagues (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    season TEXT
-                );
-            """)
-            # Finances table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS finances (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    team_id INTEGER,
-                    budget INTEGER,
-                    revenue INTEGER,
-                    expenses INTEGER,
-                    FOREIGN KEY (team_id) REFERENCES teams (id)
-                );
-            """)
-            # Settings table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS settings (
-                    id INTEGER PRIMARY KEY CHECK (id = 1),
-                    difficulty TEXT DEFAULT 'Easy',
-                    audio TEXT DEFAULT 'On'
-                );
-            """)
-            # Insert default settings if not exist
-            cursor.execute("SELECT COUNT(*) FROM settings WHERE id = 1")
-            if cursor.fetchone()[0] == 0:
-                cursor.execute("""
-                    INSERT INTO settings (id, difficulty, audio)
-                    VALUES (1, 'Easy', 'On')
-                """)
-            # Commit the changes
-            self.conn.commit()
+            applied = migrate(self.conn, self.logger)
+            if applied:
+                self.logger.info(f"Database schema migrated to version {applied[-1]}.")
             self.logger.info("Database tables have been set up successfully.")
         except Error as e:
             self.logger.error(f"Error setting up tables: {e}")
 
+    def get_schema_version(self):
+        """Return the schema version of the open database."""
+        return get_schema_version(self.conn)
+
+    def apply_performance_profile(self, name):
+        """Apply one of PERFORMANCE_PROFILES to the open connection."""
+        profile = PERFORMANCE_PROFILES.get(name)
+        if profile is None:
+            self.logger.error(f"Unknown performance profile: {name}")
+            return False
+        try:
+            with self._writer() as conn:
+                if conn.in_transaction:
+                    # journal_mode and synchronous cannot change inside a transaction
+                    self.logger.error(f"Cannot apply performance profile '{name}' inside a transaction.")
+                    return False
+                for pragma, value in profile.items():
+                    conn.execute(f"PRAGMA {pragma} = {value}")
+            # Changing temp_store discards the TEMP schema, and with it the all_* views
+            self._sync_shards()
+            self.performance_profile = name
+            self.logger.info(f"Performance profile '{name}' applied.")
+            return True
+        except Error as e:
+            self.logger.error(f"Error applying performance profile '{name}': {e}")
+            return False
+
+    def get_performance_profile(self):
+        """Return the active profile name and the pragma values SQLite actually reports."""
+        try:
+            active = {'name': self.performance_profile}
+            with self._writer() as conn:
+                for pragma in PERFORMANCE_PROFILES[DEFAULT_PERFORMANCE_PROFILE]:
+                    # mmap_size reports nothing for an in-memory database
+                    row = conn.execute(f"PRAGMA {pragma}").fetchone()
+                    active[pragma] = row[0] if row is not None else None
+            return active
+        except Error as e:
+            self.logger.error(f"Error reading performance profile: {e}")
+            return {'name': self.performance_profile}
+
+    def reset_world(self):
+        """
+        Delete every country, team, player, match, league and finance row,
+        archived seasons included, in one transaction.
+
+        Settings are kept. Dependent tables are cleared before the tables they
+        reference, and id counters restart so a new world numbers from 1.
+        """
+        world_tables = [
+            'archived_matches', 'season_standings', 'season_finances', 'team_ratings', 'rating_snapshots',
+            'team_players', 'matches', 'finances', 'leagues', 'teams', 'players', 'divisions', 'countries'
+        ]
+        with self.transaction():
+            for table in world_tables:
+                self.conn.execute(f"DELETE FROM {table}")
+            # Shards cannot be detached inside a transaction; empty them instead
+            for alias in self._get_shard_files():
+                for table in SHARDED_TABLES:
+                    self.conn.execute(f"DELETE FROM {alias}.{table}")
+            self.conn.execute("DELETE FROM shards")
+            # A new world gets its own random stream
+            self.set_save_seed()
+            self.conn.execute(
+                f"DELETE FROM sqlite_sequence WHERE name IN ({', '.join('?' * len(world_tables))})",
+                world_tables
+            )
+        self.identity_map.clear()
+        self.team_ratings.clear()
+        self._loaded_countries = None
+        self.logger.info("World data reset.")
+
+    def new_game_from_template(self, template_path=TEMPLATE_DB_PATH):
+        """
+        Replace the world with a copy of the prebuilt template database.
+
+        The template is cloned page by page with the backup API, then migrated
+        in case it predates the current schema. Settings are carried over from
+        the previous game. Falls back to initialize_english_teams() when no
+        template is available. Returns True if the template was used.
+        """
+        if not os.path.exists(template_path):
+            self.logger.warning(f"No template database at {template_path}; building the world instead.")
+            self.initialize_english_teams()
+            return False
+        try:
+            with self._writer() as conn:
+                if self._transaction_depth > 0:
+                    self.logger.warning("Cannot start a new game while a transaction is open.")
+                    return False
+                conn.commit()
+                settings = dict(conn.execute("SELECT * FROM settings WHERE id = 1").fetchone())
+                # Views over main would block any migration the template still needs
+                drop_views(conn)
+                template = sqlite3.connect(f"file:{template_path}?mode=ro", uri=True)
+                try:
+                    template.backup(conn)
+                finally:
+                    template.close()
+                migrate(conn, self.logger)
+                # The backup copied the template's own settings row; restore the player's
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(settings)")}
+                kept = {
+                    name: value for name, value in settings.items()
+                    if name in columns and name != 'id' and name not in GAME_SETTINGS
+                }
+                conn.execute(
+                    f"UPDATE settings SET {', '.join(f'{name} = ?' for name in kept)} WHERE id = 1",
+                    list(kept.values())
+                )
+                conn.commit()
+            # Every game cloned from the template must not share its seed
+            self.set_save_seed()
+            self.identity_map.clear()
+            self.team_ratings.clear()
+            self._loaded_countries = None
+            # The template has no shards, so this detaches the previous game's
+            self._sync_shards()
+            # The clone brings the template's file header, so re-apply this save's pragmas
+            self.apply_performance_profile(self.performance_profile)
+            self.logger.info(f"New game created from template {template_path}.")
+            return True
+        except Error as e:
+            self.logger.error(f"Error creating new game from template {template_path}: {e}")
+            return False
+
+    def _shard_dir(self):
+        return f"{os.path.splitext(self.db_path)[0]}_shards"
+
+    def _get_shard_files(self):
+        """Return {alias: path} for every country registered as sharded."""
+        with self._writer() as conn:
+            rows = conn.execute("SELECT country, path FROM shards ORDER BY slot").fetchall()
+        return {shard_alias(row[0]): row[1] for row in rows}
+
+    def _sync_shards(self):
+        """Attach every registered shard and rebuild the all_* views on every connection."""
+        try:
+            shards = self._get_shard_files()
+            with self._writer() as conn:
+                for alias, path in shards.items():
+                    if not os.path.exists(path):
+                        self.logger.error(f"Shard file {path} is missing; its country will be empty.")
+                sync_connection(conn, shards)
+                for alias in shards:
+                    upgrade_shard_schema(conn, alias)
+            self._shard_aliases = list(shards)
+            if self.read_pool is not None:
+                self.read_pool.set_initializer(partial(sync_connection, shards=shards, read_only=True))
+        except Error as e:
+            self.logger.error(f"Error attaching shards: {e}")
+
+    def get_sharded_countries(self):
+        """Return {country: shard file path} for every country stored in its own file."""
+        try:
+            with self._reader() as conn:
+                rows = conn.execute("SELECT country, path FROM shards ORDER BY slot").fetchall()
+            return {row[0]: row[1] for row in rows}
+        except Error as e:
+            self.logger.error(f"Error retrieving shards: {e}")
+            return {}
+
+    def shard_country(self, country):
+        """
+        Move country's teams, their squads, matches and finances into a file of its own.
+
+        The shard is attached to every connection and joins the all_* views, so
+        reads are unchanged, and this manager's writes to the country's rows are
+        routed to the shard. Another process can also write the shard directly
+        through database.sharding.open_shard(path), leaving the main file's
+        write lock to the rest of the game.
+        Countries with matches against other countries cannot be sharded.
+        Returns True once the country lives in its shard.
+        """
+        if self.in_memory or self.db_path == ':memory:':
+            self.logger.error("Sharding needs an on-disk savegame.")
+            return False
+        if country in self.get_sharded_countries():
+            return True
+        if not self.ensure_country_loaded(country):
+            return False
+        alias = shard_alias(country)
+        os.makedirs(self._shard_dir(), exist_ok=True)
+        path = os.path.join(self._shard_dir(), f"{alias[len('shard_'):]}.db")
+        try:
+            with self._writer() as conn:
+                if conn.in_transaction:
+                    self.logger.warning("Cannot shard a country while a transaction is open.")
+                    return False
+                crossing = conn.execute("""
+                    SELECT COUNT(*) FROM matches m
+                    JOIN teams h ON h.id = m.home_team_id
+                    JOIN teams a ON a.id = m.away_team_id
+                    WHERE (h.country = ?) != (a.country = ?)
+                """, (country, country)).fetchone()[0]
+                if crossing:
+                    self.logger.error(f"Cannot shard {country}: {crossing} matches involve other countries.")
+                    return False
+                slot = conn.execute("SELECT COALESCE(MAX(slot), 0) + 1 FROM shards").fetchone()[0]
+                # ATTACH is not allowed inside a transaction, so it happens first
+                if alias not in {row[1] for row in conn.execute("PRAGMA database_list")}:
+                    conn.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+                conn.execute(f"PRAGMA {alias}.journal_mode = WAL")
+                with self.transaction():
+                    create_shard_schema(conn, alias, slot)
+                    # A reused shard file may still hold an earlier game's rows
+                    for table in SHARDED_TABLES:
+                        conn.execute(f"DELETE FROM {alias}.{table}")
+                    conn.execute("""
+                        CREATE TEMP TABLE moving_teams AS SELECT id FROM teams WHERE country = ?
+                    """, (country,))
+                    conn.execute(f"""
+                        INSERT INTO {alias}.teams SELECT * FROM main.teams WHERE id IN moving_teams
+                    """)
+                    conn.execute(f"""
+                        INSERT INTO {alias}.players SELECT * FROM main.players
+                        WHERE id IN (SELECT player_id FROM main.team_players WHERE team_id IN moving_teams)
+                    """)
+                    for table, column in (('team_players', 'team_id'), ('matches', 'home_team_id'), ('finances', 'team_id')):
+                        conn.execute(f"""
+                            INSERT INTO {alias}.{table} SELECT * FROM main.{table} WHERE {column} IN moving_teams
+                        """)
+                    # Deleting the players and teams cascades to squads, matches and finances
+                    conn.execute(f"DELETE FROM main.players WHERE id IN (SELECT id FROM {alias}.players)")
+                    conn.execute("DELETE FROM main.teams WHERE id IN moving_teams")
+                    conn.execute("DROP TABLE temp.moving_teams")
+                    conn.execute(
+                        "INSERT INTO shards (country, slot, path) VALUES (?, ?, ?)", (country, slot, path)
+                    )
+            self.identity_map.clear()
+            self.team_ratings.clear()
+            self._sync_shards()
+            self.logger.info(f"{country} moved to shard {path}.")
+            return True
+        except Error as e:
+            self.logger.error(f"Error sharding {country}: {e}")
+            return False
+
+    def _schemas_of(self, conn, table, row_ids):
+        """
+        Return {schema: [ids]} grouping row ids of a sharded table by the schema
+        that holds them, 'main' or a shard alias.
+
+        Rows keep their ids when a country is sharded, so the owner is looked
+        up rather than derived from the id. Ids not found in any shard are main's.
+        """
+        row_ids = list(dict.fromkeys(row_ids))
+        groups = {}
+        remaining = set(row_ids)
+        for alias in self._shard_aliases:
+            for start in range(0, len(row_ids), 900):
+                chunk = row_ids[start:start + 900]
+                found = [row[0] for row in conn.execute(
+                    f"SELECT id FROM {alias}.{table} WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                )]
+                if found:
+                    groups.setdefault(alias, []).extend(found)
+                    remaining.difference_update(found)
+        main_ids = [row_id for row_id in row_ids if row_id in remaining]
+        if main_ids:
+            groups['main'] = main_ids
+        return groups
+
+    def _schema_of(self, conn, table, row_id):
+        """Return the schema holding row_id of a sharded table."""
+        return next(iter(self._schemas_of(conn, table, [row_id])), 'main')
+
+    def _move_players_to(self, conn, schema, player_ids):
+        """
+        Move players stored outside schema into it, keeping their ids.
+
+        A squad's foreign key only sees players in its own file, so a club
+        signing a player from another file takes the player's row with it.
+        Leaving the old file also drops the player from any squad there.
+        Players this manager creates take main's ids, which sit below every
+        shard's block, so a move never advances the target's id counter; a
+        player created directly in a shard can only move to higher blocks.
+        """
+        for source, ids in self._schemas_of(conn, 'players', player_ids).items():
+            if source == schema:
+                continue
+            seq = conn.execute(f"SELECT seq FROM {schema}.sqlite_sequence WHERE name = 'players'").fetchone()
+            stray = [player_id for player_id in ids if player_id > (seq[0] if seq else 0)]
+            if stray:
+                raise sqlite3.IntegrityError(f"Players {stray} would take ids from {schema}'s own block")
+            placeholders = ', '.join('?' * len(ids))
+            self._mark_ratings_dirty(conn, [
+                row[0] for row in conn.execute(
+                    f"SELECT team_id FROM {source}.team_players WHERE player_id IN ({placeholders})", ids
+                )
+            ])
+            conn.execute(f"INSERT INTO {schema}.players SELECT * FROM {source}.players WHERE id IN ({placeholders})", ids)
+            conn.execute(f"DELETE FROM {source}.players WHERE id IN ({placeholders})", ids)
+
+    def _database_size(self, conn):
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_size * conn.execute("PRAGMA page_count").fetchone()[0]
+
+    def compact(self):
+        """
+        Return free pages to the filesystem and report the bytes reclaimed.
+
+        Saves already in incremental auto_vacuum mode only truncate their free
+        list; older saves are converted with a full VACUUM the first time.
+        Returns None if compaction could not run.
+        """
+        try:
+            with self._writer() as conn:
+                if conn.in_transaction:
+                    self.logger.warning("Cannot compact while a transaction is open.")
+                    return None
+                before = self._database_size(conn)
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:  # INCREMENTAL
+                    # Each step frees one page; executescript runs it to completion
+                    conn.executescript("PRAGMA incremental_vacuum;")
+                else:
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                after = self._database_size(conn)
+                if not self.in_memory:
+                    # Fold the WAL back in so the file on disk actually shrinks
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+            if self.in_memory:
+                self.save()
+            reclaimed = before - after
+            self.logger.info(f"Compacted {self.db_path}: {reclaimed} bytes reclaimed.")
+            return reclaimed
+        except Error as e:
+            self.logger.error(f"Error compacting database: {e}")
+            return None
+
+    def compact_into(self, target_path):
+        """
+        Write a compacted copy of the database to target_path with VACUUM INTO.
+
+        The open database is left untouched. Returns the bytes saved compared
+        with the current database, or None on failure.
+        """
+        try:
+            with self._writer() as conn:
+                if conn.in_transaction:
+                    self.logger.warning("Cannot compact while a transaction is open.")
+                    return None
+                before = self._database_size(conn)
+                conn.execute("VACUUM INTO ?", (target_path,))
+            copy = sqlite3.connect(target_path)
+            try:
+                after = self._database_size(copy)
+            finally:
+                copy.close()
+            self.logger.info(f"Compacted copy written to {target_path}: {before - after} bytes smaller.")
+            return before - after
+        except Error as e:
+            self.logger.error(f"Error writing compacted copy to {target_path}: {e}")
+            return None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single unit of work.
+
+        The outermost block opens a transaction and commits once on exit; nested
+        blocks use savepoints so an inner failure only rolls back its own writes.
+        Any exception rolls back the innermost block and is re-raised.
+        The write lock is held for the whole block, so other threads' writes wait.
+        """
+        with self._writer():
+            depth = self._transaction_depth
+            savepoint = f"sp_{depth}"
+            if depth == 0:
+                if not self.conn.in_transaction:
+                    self.conn.execute("BEGIN")
+            else:
+                self.conn.execute(f"SAVEPOINT {savepoint}")
+            self._transaction_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._transaction_depth -= 1
+                # Cached objects may reflect writes that were just undone
+                self.identity_map.clear()
+                self.team_ratings.clear()
+                self._loaded_countries = None
+                if depth == 0:
+                    self.conn.rollback()
+                    self.logger.warning("Transaction rolled back.")
+                else:
+                    self.conn.execute(f"ROLLBACK TO {savepoint}")
+                    self.conn.execute(f"RELEASE {savepoint}")
+                    self.logger.warning(f"Savepoint {savepoint} rolled back.")
+                raise
+            else:
+                self._transaction_depth -= 1
+                if depth == 0:
+                    self.conn.commit()
+                else:
+                    self.conn.execute(f"RELEASE {savepoint}")
+
+    def in_transaction(self):
+        """Return True while a transaction() block is open."""
+        return self._transaction_depth > 0
+
+    def get_cache_stats(self):
+        """Return identity map hit/miss counters and occupancy."""
+        return self.identity_map.stats()
+
+    def _cache_update(self, kind, key_id, **fields):
+        """Apply a write to both the cached row dict and the cached model object."""
+        self.identity_map.update((kind, key_id), **fields)
+        self.identity_map.update((_MODEL_KINDS[kind], key_id), **fields)
+
+    def _cache_invalidate(self, kind, key_id):
+        self.identity_map.invalidate((kind, key_id))
+        self.identity_map.invalidate((_MODEL_KINDS[kind], key_id))
+
+    def _fetch_models(self, factory, sql, params=(), one=False):
+        """Run a query whose rows are turned into model objects by factory."""
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = factory
+            cursor.execute(sql, params)
+            return cursor.fetchone() if one else cursor.fetchall()
+
+    def _cache_generation(self):
+        """
+        Return the identity map generation to fill the map with after a read,
+        or None if the read must not be cached.
+
+        While another thread's transaction is open, a pooled read only sees the
+        last committed rows, which that transaction may be about to replace.
+        """
+        if self._transaction_depth > 0 and self._lock_owner != threading.get_ident():
+            return None
+        return self.identity_map.generation
+
+    def _cache_fill(self, key, value, generation):
+        if generation is not None:
+            self.identity_map.put(key, value, generation)
+
+    def _load_cached_model(self, kind, key_id, factory, sql):
+        model_class = _MODEL_KINDS[kind]
+        cached = self.identity_map.get((model_class, key_id))
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
+        model = self._fetch_models(factory, sql, (key_id,), one=True)
+        if model is not None:
+            self._cache_fill((model_class, key_id), model, generation)
+        return model
+
+    def _raise_in_transaction(self, error):
+        """Re-raise a logged write error inside transaction() so the whole block rolls back."""
+        if self._transaction_depth > 0 and self._lock_owner == threading.get_ident():
+            raise error
+
+    def _commit(self):
+        """Commit the current write unless it belongs to an open transaction() block."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
+    def _insert_many(self, sql, rows):
+        """Run an INSERT for every row in one executemany call and return the new row ids."""
+        rows = list(rows)
+        if not rows:
+            return []
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.executemany(sql, rows)
+            # Rows inserted by one executemany inside a transaction get consecutive ids
+            last_id = self.conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
     def close(self):
         if self.conn:
+            if self.in_memory:
+                self.save()
+            if self.read_pool is not None:
+                self.read_pool.close()
+                self.read_pool = None
             self.conn.close()
+            self.conn = None
+            if _shared_managers.get(self.db_path) is self:
+                del _shared_managers[self.db_path]
             self.logger.info("Database connection closed.")
 
     # Player methods
     def add_player(self, name, position, skills, morale, contract_end):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO players (name, position, skills, morale, contract_end)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (name, position, skills, morale, contract_end))
+                self._commit()
+                self.logger.info(f"Player '{name}' added successfully.")
+                return cursor.lastrowid
+        except Error as e:
+            self.logger.error(f"Error adding player: {e}")
+            self._raise_in_transaction(e)
+
+    def add_players_many(self, players):
+        """
+        Insert many players at once.
+
+        players is an iterable of (name, position, skills, morale, contract_end) tuples.
+        Returns the new player ids in input order.
+        """
+        try:
+            player_ids = self._insert_many("""
                 INSERT INTO players (name, position, skills, morale, contract_end)
                 VALUES (?, ?, ?, ?, ?)
-            """, (name, position, skills, morale, contract_end))
-            self.conn.commit()
-            self.logger.info(f"Player '{name}' added successfully.")
-            return cursor.lastrowid
+            """, players)
+            self.logger.info(f"Added {len(player_ids)} players.")
+            return player_ids
         except Error as e:
-            self.logger.error(f"Error adding player: {e}")
+            self.logger.error(f"Error adding players: {e}")
+            self._raise_in_transaction(e)
+            return []
 
     def get_all_players(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM players")
-            players = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_players")
+                players = cursor.fetchall()
             self.logger.info(f"Retrieved {len(players)} players.")
             return players
         except Error as e:
@@ -150,10 +765,15 @@ class DatabaseManager:
             return []
 
     def get_player_by_id(self, player_id):
+        cached = self.identity_map.get(('player', player_id))
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
-            player = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_players WHERE id = ?", (player_id,))
+                player = cursor.fetchone()
             if player:
                 player_dict = {
                     'id': player['id'],
@@ -163,6 +783,7 @@ class DatabaseManager:
                     'morale': player['morale'],
                     'contract_end': player['contract_end']
                 }
+                self._cache_fill(('player', player_id), player_dict, generation)
                 self.logger.info(f"Retrieved player: {player_dict}")
                 return player_dict
             else:
@@ -174,74 +795,120 @@ class DatabaseManager:
 
     def update_player_skills(self, player_id, new_skills):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE players
-                SET skills = ?
-                WHERE id = ?
-            """, (new_skills, player_id))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} skills updated to {new_skills}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'players', player_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.players
+                    SET skills = ?
+                    WHERE id = ?
+                """, (new_skills, player_id))
+                self._mark_ratings_dirty(conn, player_id=player_id)
+                self._commit()
+                self._cache_update('player', player_id, skills=new_skills)
+                self.logger.info(f"Player ID {player_id} skills updated to {new_skills}.")
         except Error as e:
             self.logger.error(f"Error updating player skills: {e}")
+            self._raise_in_transaction(e)
 
     def update_player_morale(self, player_id, new_morale):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE players
-                SET morale = ?
-                WHERE id = ?
-            """, (new_morale, player_id))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} morale updated to {new_morale}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'players', player_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.players
+                    SET morale = ?
+                    WHERE id = ?
+                """, (new_morale, player_id))
+                self._mark_ratings_dirty(conn, player_id=player_id)
+                self._commit()
+                self._cache_update('player', player_id, morale=new_morale)
+                self.logger.info(f"Player ID {player_id} morale updated to {new_morale}.")
         except Error as e:
             self.logger.error(f"Error updating player morale: {e}")
+            self._raise_in_transaction(e)
 
     def update_player_contract(self, player_id, new_contract_end):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE players
-                SET contract_end = ?
-                WHERE id = ?
-            """, (new_contract_end, player_id))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} contract end updated to {new_contract_end}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'players', player_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.players
+                    SET contract_end = ?
+                    WHERE id = ?
+                """, (new_contract_end, player_id))
+                self._commit()
+                self._cache_update('player', player_id, contract_end=new_contract_end)
+                self.logger.info(f"Player ID {player_id} contract end updated to {new_contract_end}.")
         except Error as e:
             self.logger.error(f"Error updating player contract end: {e}")
+            self._raise_in_transaction(e)
 
     def delete_player(self, player_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM players
-                WHERE id = ?
-            """, (player_id,))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} deleted successfully.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                self._mark_ratings_dirty(conn, player_id=player_id)
+                schema = self._schema_of(conn, 'players', player_id)
+                cursor.execute(f"""
+                    DELETE FROM {schema}.players
+                    WHERE id = ?
+                """, (player_id,))
+                self._commit()
+                self._cache_invalidate('player', player_id)
+                self.logger.info(f"Player ID {player_id} deleted successfully.")
         except Error as e:
             self.logger.error(f"Error deleting player: {e}")
+            self._raise_in_transaction(e)
 
     # Team methods
     def add_team(self, name, formation, tactics, division=1):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO teams (name, formation, tactics, division)
-                VALUES (?, ?, ?, ?)
-            """, (name, formation, tactics, division))
-            self.conn.commit()
-            self.logger.info(f"Team '{name}' added successfully.")
-            return cursor.lastrowid
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO teams (name, formation, tactics, division)
+                    VALUES (?, ?, ?, ?)
+                """, (name, formation, tactics, division))
+                self._commit()
+                self.logger.info(f"Team '{name}' added successfully.")
+                return cursor.lastrowid
         except Error as e:
             self.logger.error(f"Error adding team: {e}")
+            self._raise_in_transaction(e)
+
+    def add_teams_many(self, teams):
+        """
+        Insert many teams at once.
+
+        teams is an iterable of (name, formation, tactics, country, division)
+        tuples, optionally followed by a reputation.
+        Returns the new team ids in input order.
+        """
+        try:
+            team_ids = self._insert_many("""
+                INSERT INTO teams (name, formation, tactics, country, division, reputation)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (team if len(team) == 6 else (*team, DEFAULT_REPUTATION) for team in teams))
+            self.logger.info(f"Added {len(team_ids)} teams.")
+            return team_ids
+        except Error as e:
+            self.logger.error(f"Error adding teams: {e}")
+            self._raise_in_transaction(e)
+            return []
 
     def get_team_by_id(self, team_id):
+        cached = self.identity_map.get(('team', team_id))
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM teams WHERE id = ?", (team_id,))
-            team = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_teams WHERE id = ?", (team_id,))
+                team = cursor.fetchone()
             if team:
                 team_dict = {
                     'id': team['id'],
@@ -251,6 +918,7 @@ class DatabaseManager:
                     'country': team['country'],
                     'division': team['division']
                 }
+                self._cache_fill(('team', team_id), team_dict, generation)
                 self.logger.info(f"Retrieved team: {team_dict}")
                 return team_dict
             else:
@@ -262,172 +930,252 @@ class DatabaseManager:
 
     def add_player_to_team(self, team_id, player_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO team_players (team_id, player_id)
-                VALUES (?, ?)
-            """, (team_id, player_id))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} added to Team ID {team_id}.")
+            # Moving the player and linking them to the squad succeed or fail together
+            with self.transaction():
+                conn = self.conn
+                # Squads live with their team, so the player joins the team's file
+                schema = self._schema_of(conn, 'teams', team_id)
+                self._move_players_to(conn, schema, [player_id])
+                conn.execute(f"""
+                    INSERT INTO {schema}.team_players (team_id, player_id)
+                    VALUES (?, ?)
+                """, (team_id, player_id))
+                self._mark_ratings_dirty(conn, [team_id])
+                self.logger.info(f"Player ID {player_id} added to Team ID {team_id}.")
         except Error as e:
             self.logger.error(f"Error adding player to team: {e}")
+            self._raise_in_transaction(e)
+
+    def assign_players_many(self, assignments):
+        """
+        Add many players to teams at once.
+
+        assignments is an iterable of (team_id, player_id) tuples.
+        Returns the number of assignments written.
+        """
+        try:
+            assignments = list(assignments)
+            with self.transaction():
+                team_schemas = self._schemas_of(self.conn, 'teams', [team_id for team_id, _ in assignments])
+                schema_of_team = {team_id: schema for schema, ids in team_schemas.items() for team_id in ids}
+                for schema in team_schemas:
+                    self._move_players_to(self.conn, schema, [
+                        player_id for team_id, player_id in assignments if schema_of_team[team_id] == schema
+                    ])
+                    self.conn.executemany(f"""
+                        INSERT INTO {schema}.team_players (team_id, player_id)
+                        VALUES (?, ?)
+                    """, [assignment for assignment in assignments if schema_of_team[assignment[0]] == schema])
+                self._mark_ratings_dirty(self.conn, {team_id for team_id, _ in assignments})
+            self.logger.info(f"Assigned {len(assignments)} players to teams.")
+            return len(assignments)
+        except Error as e:
+            self.logger.error(f"Error assigning players to teams: {e}")
+            self._raise_in_transaction(e)
+            return 0
 
     def remove_player_from_team(self, team_id, player_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM team_players
-                WHERE team_id = ? AND player_id = ?
-            """, (team_id, player_id))
-            self.conn.commit()
-            self.logger.info(f"Player ID {player_id} removed from Team ID {team_id}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    DELETE FROM {schema}.team_players
+                    WHERE team_id = ? AND player_id = ?
+                """, (team_id, player_id))
+                self._mark_ratings_dirty(conn, [team_id])
+                self._commit()
+                self.logger.info(f"Player ID {player_id} removed from Team ID {team_id}.")
         except Error as e:
             self.logger.error(f"Error removing player from team: {e}")
+            self._raise_in_transaction(e)
 
     def update_team_formation(self, team_id, new_formation):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE teams
-                SET formation = ?
-                WHERE id = ?
-            """, (new_formation, team_id))
-            self.conn.commit()
-            self.logger.info(f"Team ID {team_id} formation updated to '{new_formation}'.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.teams
+                    SET formation = ?
+                    WHERE id = ?
+                """, (new_formation, team_id))
+                self._mark_ratings_dirty(conn, [team_id])
+                self._commit()
+                self._cache_update('team', team_id, formation=new_formation)
+                self.logger.info(f"Team ID {team_id} formation updated to '{new_formation}'.")
         except Error as e:
             self.logger.error(f"Error updating team formation: {e}")
+            self._raise_in_transaction(e)
 
     def update_team_tactics(self, team_id, new_tactics):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE teams
-                SET tactics = ?
-                WHERE id = ?
-            """, (new_tactics, team_id))
-            self.conn.commit()
-            self.logger.info(f"Team ID {team_id} tactics updated to '{new_tactics}'.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.teams
+                    SET tactics = ?
+                    WHERE id = ?
+                """, (new_tactics, team_id))
+                self._mark_ratings_dirty(conn, [team_id])
+                self._commit()
+                self._cache_update('team', team_id, tactics=new_tactics)
+                self.logger.info(f"Team ID {team_id} tactics updated to '{new_tactics}'.")
         except Error as e:
             self.logger.error(f"Error updating team tactics: {e}")
+            self._raise_in_transaction(e)
 
     def get_english_teams(self):
         """Get all English teams from the database"""
+        return self.get_teams_by_country('England')
+
+    def initialize_english_teams(self):
+        """Replace the world with a fresh copy of the English league pack"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, formation, tactics, division
-                FROM teams 
-                WHERE country = 'England'
-            ''')
-            teams = cursor.fetchall()
-            # Convert to list of dictionaries for easier handling
+            with self.transaction():
+                self.reset_world()
+                # Quick until the player opens it; the managed club is fully simulated regardless
+                self.load_league_pack('England')
+            self.logger.info("English teams initialized successfully.")
+        except Error as e:
+            self.logger.error(f"Error initializing English teams: {e}")
+            self._raise_in_transaction(e)
+
+    def load_league_pack(self, country, simulation='quick', pack_dir=LEAGUE_PACK_DIR):
+        """
+        Import the league pack for country in one transaction.
+
+        Any clubs already loaded for the country are replaced, along with the
+        matches, finances and squad links that cascade from them. simulation is
+        'full' for countries the player follows and 'quick' for the rest.
+        Returns the new team ids.
+        """
+        try:
+            divisions, teams = read_pack(country, pack_dir)
+        except (OSError, ValueError, KeyError) as e:
+            self.logger.error(f"Error reading league pack for {country}: {e}")
+            return []
+        try:
+            with self.transaction():
+                replaced = self.conn.execute("DELETE FROM teams WHERE country = ?", (country,)).rowcount
+                self.conn.execute("DELETE FROM countries WHERE name = ?", (country,))
+                self.conn.execute(
+                    "INSERT INTO countries (name, simulation) VALUES (?, ?)", (country, simulation)
+                )
+                self.conn.executemany(
+                    "INSERT INTO divisions (country, level, name) VALUES (?, ?, ?)", divisions
+                )
+                team_ids = self.add_teams_many(teams)
+            if replaced:
+                self.identity_map.clear()
+                self.team_ratings.clear()
+            if self._loaded_countries is not None:
+                self._loaded_countries.add(country)
+            self.logger.info(f"Loaded {len(team_ids)} clubs from the {country} league pack.")
+            return team_ids
+        except Error as e:
+            self.logger.error(f"Error loading league pack for {country}: {e}")
+            self._raise_in_transaction(e)
+            return []
+
+    def ensure_country_loaded(self, country, simulation='quick'):
+        """Import country's league pack the first time it is needed. Returns True if it is loaded."""
+        if self._loaded_countries is None:
+            with self._reader() as conn:
+                self._loaded_countries = {row[0] for row in conn.execute("SELECT name FROM countries")}
+        if country in self._loaded_countries:
+            return True
+        with self._writer():
+            # Another thread may have loaded it while we waited for the lock
+            if country in self._loaded_countries:
+                return True
+            return bool(self.load_league_pack(country, simulation))
+
+    def get_loaded_countries(self):
+        """Return {country: simulation level} for every country imported into this save."""
+        try:
+            with self._reader() as conn:
+                rows = conn.execute("SELECT name, simulation FROM countries ORDER BY name").fetchall()
+            return {row[0]: row[1] for row in rows}
+        except Error as e:
+            self.logger.error(f"Error retrieving loaded countries: {e}")
+            return {}
+
+    def get_available_countries(self, pack_dir=LEAGUE_PACK_DIR):
+        """Return every country with an installed league pack, loaded or not."""
+        return available_countries(pack_dir)
+
+    def get_country_simulation(self, country):
+        """Return 'full' or 'quick' for a loaded country, or None if it is not loaded."""
+        try:
+            with self._reader() as conn:
+                row = conn.execute("SELECT simulation FROM countries WHERE name = ?", (country,)).fetchone()
+            return row[0] if row else None
+        except Error as e:
+            self.logger.error(f"Error retrieving simulation level for {country}: {e}")
+            return None
+
+    def activate_country(self, country):
+        """Load country if needed and switch it to full simulation, e.g. when the player opens it."""
+        if not self.ensure_country_loaded(country, simulation='full'):
+            return False
+        try:
+            with self._writer() as conn:
+                conn.execute("UPDATE countries SET simulation = 'full' WHERE name = ?", (country,))
+                self._commit()
+            self.logger.info(f"{country} switched to full simulation.")
+            return True
+        except Error as e:
+            self.logger.error(f"Error activating {country}: {e}")
+            self._raise_in_transaction(e)
+            return False
+
+    def get_teams_by_country(self, country):
+        """Get every team of a country, loading its league pack on first use"""
+        if not self.ensure_country_loaded(country):
+            return []
+        try:
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, name, formation, tactics, division, reputation
+                    FROM all_teams
+                    WHERE country = ?
+                    ORDER BY division, id
+                ''', (country,))
+                teams = cursor.fetchall()
             teams_list = [
                 {
                     'id': team[0],
                     'name': team[1],
                     'formation': team[2],
                     'tactics': team[3],
-                    'division': team[4]
+                    'division': team[4],
+                    'reputation': team[5]
                 }
                 for team in teams
             ]
-            self.logger.info(f"Retrieved {len(teams_list)} English teams")
+            self.logger.info(f"Retrieved {len(teams_list)} teams from {country}")
             return teams_list
-        except Exception as e:
-            self.logger.error(f"Error retrieving English teams: {str(e)}")
-            return []
-
-    def initialize_english_teams(self):
-        """Initialize all English teams for a new game"""
-        try:
-            # Delete existing teams first
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM teams")
-            
-            # Premier League teams
-            premier_league = [
-                "Arsenal", "Aston Villa", "Chelsea", "Everton", "Liverpool", 
-                "Manchester City", "Manchester United", "Newcastle United", 
-                "Nottingham Forest", "Tottenham Hotspur", "West Ham United",
-                "Wolves", "Brighton", "Crystal Palace", "Fulham", "Burnley",
-                "Sheffield United", "Bournemouth", "Brentford", "Luton Town"
-            ]
-
-            # Insert Premier League teams with division 1
-            for team in premier_league:
-                cursor.execute("""
-                    INSERT INTO teams (name, formation, tactics, country, division)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (team, "4-4-2", "Balanced", "England", 1))
-
-            # Championship teams
-            championship = [
-                "Leeds United", "Leicester City", "Southampton", "West Bromwich",
-                "Norwich City", "Watford", "Middlesbrough", "Sunderland",
-                "Stoke City", "Hull City", "Swansea City", "Cardiff City",
-                "Blackburn Rovers", "QPR", "Sheffield Wednesday", "Birmingham City",
-                "Millwall", "Preston", "Rotherham", "Coventry City", "Ipswich Town",
-                "Plymouth Argyle", "Huddersfield Town", "Bristol City"
-            ]
-
-            # Insert Championship teams with division 2
-            for team in championship:
-                cursor.execute("""
-                    INSERT INTO teams (name, formation, tactics, country, division)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (team, "4-4-2", "Balanced", "England", 2))
-
-            # League One teams
-            league_one = [
-                "Derby County", "Portsmouth", "Barnsley", "Bolton Wanderers",
-                "Oxford United", "Charlton Athletic", "Peterborough United",
-                "Lincoln City", "Bristol Rovers", "Wycombe Wanderers",
-                "Shrewsbury Town", "Cambridge United", "Port Vale", "Exeter City",
-                "Cheltenham Town", "Carlisle United", "Stevenage", "Fleetwood Town",
-                "Burton Albion", "Reading", "Northampton Town", "Leyton Orient",
-                "Wigan Athletic", "Forest Green Rovers"
-            ]
-
-            # Insert League One teams with division 3
-            for team in league_one:
-                cursor.execute("""
-                    INSERT INTO teams (name, formation, tactics, country, division)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (team, "4-4-2", "Balanced", "England", 3))
-
-            # League Two teams
-            league_two = [
-                "Bradford City", "Mansfield Town", "Stockport County", "Notts County",
-                "Wrexham", "Swindon Town", "Crewe Alexandra", "Gillingham",
-                "AFC Wimbledon", "Doncaster Rovers", "Morecambe", "Grimsby Town",
-                "Harrogate Town", "Salford City", "Tranmere Rovers", "Crawley Town",
-                "Newport County", "Barrow", "Accrington Stanley", "Sutton United",
-                "Colchester United", "MK Dons", "Walsall", "Rochdale"
-            ]
-
-            # Insert League Two teams with division 4
-            for team in league_two:
-                cursor.execute("""
-                    INSERT INTO teams (name, formation, tactics, country, division)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (team, "4-4-2", "Balanced", "England", 4))
-
-            self.conn.commit()
-            self.logger.info("English teams initialized successfully.")
         except Error as e:
-            self.logger.error(f"Error initializing English teams: {e}")
+            self.logger.error(f"Error retrieving teams from {country}: {e}")
+            return []
 
-    def get_teams_by_division(self, division):
-        """Get all teams from a specific division"""
+    def get_teams_by_division(self, division, country='England'):
+        """Get all teams from a specific division of a country"""
+        if not self.ensure_country_loaded(country):
+            return []
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, name, formation, tactics 
-                FROM teams 
-                WHERE division = ? 
-                ORDER BY name
-            ''', (division,))
-            teams = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, name, formation, tactics 
+                    FROM all_teams 
+                    WHERE country = ? AND division = ? 
+                    ORDER BY name
+                ''', (country, division))
+                teams = cursor.fetchall()
             teams_list = [
                 {
                     'id': team[0],
@@ -446,23 +1194,56 @@ class DatabaseManager:
     # Match methods
     def add_match(self, home_team_id, away_team_id, date):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO matches (home_team_id, away_team_id, date)
-                VALUES (?, ?, ?)
-            """, (home_team_id, away_team_id, date))
-            self.conn.commit()
-            match_id = cursor.lastrowid
-            self.logger.info(f"Match between Team ID {home_team_id} and Team ID {away_team_id} on {date} added successfully with ID {match_id}.")
-            return match_id
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', home_team_id)
+                cursor.execute(f"""
+                    INSERT INTO {schema}.matches (home_team_id, away_team_id, date)
+                    VALUES (?, ?, ?)
+                """, (home_team_id, away_team_id, date))
+                self._commit()
+                match_id = cursor.lastrowid
+                self.logger.info(f"Match between Team ID {home_team_id} and Team ID {away_team_id} on {date} added successfully with ID {match_id}.")
+                return match_id
         except Error as e:
             self.logger.error(f"Error adding match: {e}")
+            self._raise_in_transaction(e)
+
+    def add_matches_many(self, matches):
+        """
+        Insert many fixtures at once.
+
+        matches is an iterable of (home_team_id, away_team_id, date) tuples.
+        Returns the new match ids in input order. Fixtures of a sharded
+        country are added to its shard.
+        """
+        try:
+            matches = list(matches)
+            match_ids = [None] * len(matches)
+            with self.transaction():
+                schemas = self._schemas_of(self.conn, 'teams', [match[0] for match in matches])
+                schema_of_team = {team_id: schema for schema, ids in schemas.items() for team_id in ids}
+                for schema in schemas:
+                    indexes = [index for index, match in enumerate(matches) if schema_of_team[match[0]] == schema]
+                    new_ids = self._insert_many(f"""
+                        INSERT INTO {schema}.matches (home_team_id, away_team_id, date)
+                        VALUES (?, ?, ?)
+                    """, [matches[index] for index in indexes])
+                    for index, match_id in zip(indexes, new_ids):
+                        match_ids[index] = match_id
+            self.logger.info(f"Added {len(match_ids)} matches.")
+            return match_ids
+        except Error as e:
+            self.logger.error(f"Error adding matches: {e}")
+            self._raise_in_transaction(e)
+            return []
 
     def get_match_by_id(self, match_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM matches WHERE id = ?", (match_id,))
-            match = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_matches WHERE id = ?", (match_id,))
+                match = cursor.fetchone()
             if match:
                 match_dict = {
                     'id': match['id'],
@@ -483,22 +1264,47 @@ class DatabaseManager:
 
     def update_match_score(self, match_id, home_score, away_score):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE matches
-                SET home_score = ?, away_score = ?
-                WHERE id = ?
-            """, (home_score, away_score, match_id))
-            self.conn.commit()
-            self.logger.info(f"Match ID {match_id} score updated to {home_score}-{away_score}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'matches', match_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.matches
+                    SET home_score = ?, away_score = ?
+                    WHERE id = ?
+                """, (home_score, away_score, match_id))
+                self._commit()
+                self.logger.info(f"Match ID {match_id} score updated to {home_score}-{away_score}.")
         except Error as e:
             self.logger.error(f"Error updating match score: {e}")
+            self._raise_in_transaction(e)
+
+    def update_match_scores_many(self, scores):
+        """
+        Write many results at once.
+
+        scores is an iterable of (match_id, home_score, away_score) tuples.
+        Returns the match ids that were updated.
+        """
+        try:
+            scores = list(scores)
+            with self.transaction():
+                self._update_matches_many("""
+                    SET home_score = ?, away_score = ?
+                    WHERE id = ?
+                """, [(home_score, away_score, match_id) for match_id, home_score, away_score in scores])
+            self.logger.info(f"Updated scores for {len(scores)} matches.")
+            return [match_id for match_id, _, _ in scores]
+        except Error as e:
+            self.logger.error(f"Error updating match scores: {e}")
+            self._raise_in_transaction(e)
+            return []
 
     def get_all_matches(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM matches")
-            matches = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_matches")
+                matches = cursor.fetchall()
             self.logger.info(f"Retrieved {len(matches)} matches.")
             return matches
         except Error as e:
@@ -507,36 +1313,447 @@ class DatabaseManager:
 
     def delete_match(self, match_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM matches
-                WHERE id = ?
-            """, (match_id,))
-            self.conn.commit()
-            self.logger.info(f"Match ID {match_id} deleted successfully.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'matches', match_id)
+                cursor.execute(f"""
+                    DELETE FROM {schema}.matches
+                    WHERE id = ?
+                """, (match_id,))
+                self._commit()
+                self.logger.info(f"Match ID {match_id} deleted successfully.")
         except Error as e:
             self.logger.error(f"Error deleting match: {e}")
+            self._raise_in_transaction(e)
+
+    # Match engine support: squads are read in one query and results written in one transaction
+    def get_squads(self, team_ids):
+        """
+        Return {team_id: (formation, tactics, players)} for the given teams.
+
+        players is a list of (player_id, position, skills, morale) tuples, the
+        shape engine.rate_team expects.
+        """
+        team_ids = list(dict.fromkeys(team_ids))
+        if not team_ids:
+            return {}
+        placeholders = ', '.join('?' * len(team_ids))
+        try:
+            with self._reader() as conn:
+                teams = conn.execute(
+                    f"SELECT id, formation, tactics FROM all_teams WHERE id IN ({placeholders})", team_ids
+                ).fetchall()
+                players = conn.execute(f"""
+                    SELECT tp.team_id, p.id, p.position, p.skills, p.morale
+                    FROM all_team_players tp
+                    JOIN all_players p ON p.id = tp.player_id
+                    WHERE tp.team_id IN ({placeholders})
+                """, team_ids).fetchall()
+            squads = {row[0]: (row[1], row[2], []) for row in teams}
+            for team_id, player_id, position, skills, morale in players:
+                squads[team_id][2].append((player_id, position, skills, morale))
+            return squads
+        except Error as e:
+            self.logger.error(f"Error retrieving squads: {e}")
+            return {}
+
+    def _mark_ratings_dirty(self, conn, team_ids=(), player_id=None):
+        """
+        Flag the stored ratings of the affected teams for recomputation.
+
+        Called by every write that changes a squad, a player's skills or morale,
+        a formation or tactics, on the writer connection before it commits.
+        """
+        team_ids = list(team_ids)
+        if player_id is not None:
+            team_ids += [row[0] for row in conn.execute(
+                "SELECT team_id FROM all_team_players WHERE player_id = ?", (player_id,)
+            )]
+        for team_id in team_ids:
+            self.team_ratings.pop(team_id, None)
+        conn.executemany("UPDATE team_ratings SET dirty = 1 WHERE team_id = ?", [(team_id,) for team_id in team_ids])
+
+    def get_team_ratings(self, team_ids):
+        """
+        Return {team_id: TeamRatings} for the given teams.
+
+        Ratings come from the in-memory mirror when present, then from clean
+        team_ratings rows. Teams with no clean row are rated from their squads
+        and the result is stored, so each team is rated once per change.
+        """
+        team_ids = list(dict.fromkeys(team_ids))
+        ratings = {team_id: self.team_ratings[team_id] for team_id in team_ids if team_id in self.team_ratings}
+        missing = [team_id for team_id in team_ids if team_id not in ratings]
+        if not missing:
+            return ratings
+        placeholders = ', '.join('?' * len(missing))
+        try:
+            # The write lock keeps squads from changing between rating and storing
+            with self._writer() as conn:
+                rows = conn.execute(f"""
+                    SELECT team_id, attack, defence, card_rate, starters, scorer_weights, bench
+                    FROM team_ratings
+                    WHERE dirty = 0 AND version = ? AND team_id IN ({placeholders})
+                """, [RATINGS_VERSION, *missing]).fetchall()
+                for team_id, attack, defence, card_rate, starters, scorer_weights, bench in rows:
+                    ratings[team_id] = TeamRatings(
+                        attack, defence, card_rate,
+                        tuple(json.loads(starters)), tuple(json.loads(scorer_weights)), tuple(json.loads(bench))
+                    )
+                stale = [team_id for team_id in missing if team_id not in ratings]
+                if stale:
+                    squads = self.get_squads(stale)
+                    fresh = {}
+                    for team_id in stale:
+                        formation, tactics, players = squads.get(team_id, ('4-4-2', 'Balanced', []))
+                        fresh[team_id] = rate_team(players, formation, tactics)
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO team_ratings
+                            (team_id, version, attack, defence, card_rate, starters, scorer_weights, bench, dirty)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    """, [
+                        (team_id, RATINGS_VERSION, rating.attack, rating.defence, rating.card_rate,
+                         json.dumps(rating.starters), json.dumps(rating.scorer_weights), json.dumps(rating.bench))
+                        for team_id, rating in fresh.items()
+                    ])
+                    self._commit()
+                    ratings.update(fresh)
+                    self.logger.info(f"Rated {len(stale)} teams.")
+                for team_id in missing:
+                    self.team_ratings[team_id] = ratings[team_id]
+            return ratings
+        except Error as e:
+            self.logger.error(f"Error retrieving team ratings: {e}")
+            return {}
+
+    def _snapshot_id(self, ratings):
+        """Return the rating_snapshots id for ratings, storing them if new; call inside a transaction."""
+        blob = encode_snapshot(ratings)
+        digest = snapshot_digest(blob)
+        self.conn.execute("INSERT OR IGNORE INTO rating_snapshots (digest, ratings) VALUES (?, ?)", (digest, blob))
+        return self.conn.execute("SELECT id FROM rating_snapshots WHERE digest = ?", (digest,)).fetchone()[0]
+
+    def _update_matches_many(self, assignments, rows):
+        """
+        Run UPDATE matches <assignments> for every row, in whichever schema holds each match.
+
+        assignments is the SET ... WHERE id = ? part of the statement; the
+        match id is the last value of each row. Call inside a transaction.
+        """
+        schemas = self._schemas_of(self.conn, 'matches', [row[-1] for row in rows])
+        schema_of_match = {match_id: schema for schema, ids in schemas.items() for match_id in ids}
+        for schema in schemas:
+            self.conn.executemany(
+                f"UPDATE {schema}.matches {assignments}", [row for row in rows if schema_of_match[row[-1]] == schema]
+            )
+
+    def save_match_results_many(self, results, snapshots=None):
+        """
+        Store engine results in one transaction.
+
+        results is an iterable of (match_id, home_score, away_score, events),
+        where events are (minute, side, kind, player_id) tuples packed into the
+        match's events blob. Any earlier event log for the match is replaced.
+        snapshots optionally maps match ids to (engine_version, home_ratings,
+        away_ratings); those matches also keep the keys needed to replay them.
+        Returns the number of matches saved.
+        """
+        results = list(results)
+        snapshots = snapshots or {}
+        try:
+            with self.transaction():
+                snapshot_ids = {}
+                rows = []
+                for match_id, home_score, away_score, events in results:
+                    replay_keys = (None, None, None, None)
+                    if match_id in snapshots:
+                        engine_version, home_ratings, away_ratings = snapshots[match_id]
+                        for ratings in (home_ratings, away_ratings):
+                            if ratings not in snapshot_ids:
+                                snapshot_ids[ratings] = self._snapshot_id(ratings)
+                        replay_keys = (
+                            engine_version, snapshot_ids[home_ratings], snapshot_ids[away_ratings], events_digest(events)
+                        )
+                    rows.append((home_score, away_score, pack_events(events) if events else None, *replay_keys, match_id))
+                self._update_matches_many("""
+                    SET home_score = ?, away_score = ?, events = ?,
+                        engine_version = ?, home_snapshot = ?, away_snapshot = ?, events_digest = ?
+                    WHERE id = ?
+                """, rows)
+            self.logger.info(f"Saved results for {len(results)} matches.")
+            return len(results)
+        except Error as e:
+            self.logger.error(f"Error saving match results: {e}")
+            self._raise_in_transaction(e)
+            return 0
+
+    def save_match_result(self, match_id, home_score, away_score, events=(), snapshot=None):
+        snapshots = {match_id: snapshot} if snapshot else None
+        return self.save_match_results_many([(match_id, home_score, away_score, events)], snapshots) == 1
+
+    def get_match_events(self, match_id):
+        """Return a match's event log as minute, side, kind and player_id dicts in order."""
+        try:
+            with self._reader() as conn:
+                row = conn.execute("SELECT events FROM all_matches WHERE id = ?", (match_id,)).fetchone()
+            return [event._asdict() for event in iter_events(row[0] if row else None)]
+        except Error as e:
+            self.logger.error(f"Error retrieving events for Match ID {match_id}: {e}")
+            return []
+
+    def get_replay_info(self, match_id):
+        """
+        Return what is needed to replay a fully simulated match, or None.
+
+        The dict holds the engine version, the recorded score and events
+        digest, and each side's stored snapshot blob with its digest.
+        """
+        try:
+            with self._reader() as conn:
+                row = conn.execute("""
+                    SELECT m.engine_version, m.home_score, m.away_score, m.events_digest,
+                           h.ratings, h.digest, a.ratings, a.digest
+                    FROM all_matches m
+                    JOIN rating_snapshots h ON h.id = m.home_snapshot
+                    JOIN rating_snapshots a ON a.id = m.away_snapshot
+                    WHERE m.id = ?
+                """, (match_id,)).fetchone()
+            if row is None:
+                return None
+            return {
+                'engine_version': row[0],
+                'home_score': row[1],
+                'away_score': row[2],
+                'events_digest': row[3],
+                'home_snapshot': (row[4], row[5]),
+                'away_snapshot': (row[6], row[7]),
+            }
+        except Error as e:
+            self.logger.error(f"Error retrieving replay info for Match ID {match_id}: {e}")
+            return None
+
+    def prune_event_logs(self, keep_matchdays):
+        """
+        Drop the stored event logs of replayable matches played before the
+        last keep_matchdays matchdays, and rating snapshots no match uses.
+
+        Matches without replay keys keep their logs. Returns the number of
+        logs dropped.
+        """
+        try:
+            with self.transaction():
+                row = self.conn.execute("""
+                    SELECT DISTINCT date FROM all_matches WHERE home_score IS NOT NULL
+                    ORDER BY date DESC LIMIT 1 OFFSET ?
+                """, (keep_matchdays,)).fetchone()
+                if row is None:
+                    return 0
+                pruned = 0
+                for schema in ['main', *self._shard_aliases]:
+                    pruned += self.conn.execute(f"""
+                        UPDATE {schema}.matches SET events = NULL
+                        WHERE events IS NOT NULL AND home_snapshot IS NOT NULL AND date <= ?
+                    """, (row[0],)).rowcount
+                self._delete_unused_snapshots()
+            if pruned:
+                self.logger.info(f"Dropped {pruned} event logs from matches played on or before {row[0]}.")
+            return pruned
+        except Error as e:
+            self.logger.error(f"Error pruning event logs: {e}")
+            self._raise_in_transaction(e)
+            return 0
+
+    def _delete_unused_snapshots(self):
+        self.conn.execute("""
+            DELETE FROM rating_snapshots WHERE id NOT IN (
+                SELECT home_snapshot FROM all_matches WHERE home_snapshot IS NOT NULL
+                UNION
+                SELECT away_snapshot FROM all_matches WHERE away_snapshot IS NOT NULL
+            )
+        """)
+
+    # Season archive: finished seasons leave the hot tables and keep only aggregates
+    def get_standings(self, country=None, division=None):
+        """Return the current league table from matches played so far, best team first."""
+        try:
+            conditions = []
+            params = []
+            if country is not None:
+                conditions.append("t.country = ?")
+                params.append(country)
+            if division is not None:
+                conditions.append("t.division = ?")
+                params.append(division)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            with self._reader() as conn:
+                rows = conn.execute(f"""
+                    SELECT t.name, s.* FROM ({STANDINGS_SQL.format(source='all_matches')}) s
+                    JOIN all_teams t ON t.id = s.team_id
+                    {where}
+                    {STANDINGS_ORDER}
+                """, params).fetchall()
+            return [dict(row) for row in rows]
+        except Error as e:
+            self.logger.error(f"Error computing standings: {e}")
+            return []
+
+    def archive_season(self, season, end_date=None):
+        """
+        Close a season: move its played matches out of the hot tables.
+
+        Played matches (dated on or before end_date, if given) move to
+        archived_matches. The final table is kept in season_standings.
+        Each team's finances are snapshotted into season_finances, and
+        revenue and expenses restart from zero. Unplayed fixtures stay where
+        they are. Runs in one transaction and returns counts of what moved,
+        or None if the season was already archived or the rollover failed.
+        Sharded countries are archived from their own files along with main;
+        the archive itself always lives in main.
+        """
+        try:
+            with self.transaction():
+                conn = self.conn
+                exists = conn.execute(
+                    "SELECT 1 FROM season_standings WHERE season = ? UNION SELECT 1 FROM season_finances WHERE season = ?",
+                    (season, season)
+                ).fetchone()
+                if exists:
+                    self.logger.error(f"Season {season} has already been archived.")
+                    return None
+                condition = "home_score IS NOT NULL AND away_score IS NOT NULL"
+                params = []
+                if end_date is not None:
+                    condition += " AND date <= ?"
+                    params.append(end_date)
+                conn.execute(
+                    f"CREATE TEMP TABLE season_matches AS SELECT * FROM all_matches WHERE {condition}", params
+                )
+                teams = conn.execute(f"""
+                    INSERT INTO season_standings
+                        (season, team_id, country, division, played, won, drawn, lost, goals_for, goals_against, points)
+                    SELECT ?, s.team_id, t.country, t.division, s.played, s.won, s.drawn, s.lost,
+                           s.goals_for, s.goals_against, s.points
+                    FROM ({STANDINGS_SQL.format(source='temp.season_matches')}) s
+                    LEFT JOIN all_teams t ON t.id = s.team_id
+                """, (season,)).rowcount
+                matches = conn.execute("""
+                    INSERT INTO archived_matches (id, season, home_team_id, away_team_id, date, home_score, away_score)
+                    SELECT id, ?, home_team_id, away_team_id, date, home_score, away_score FROM temp.season_matches
+                """, (season,)).rowcount
+                finances = conn.execute("""
+                    INSERT INTO season_finances (season, team_id, budget, revenue, expenses)
+                    SELECT ?, team_id, budget, revenue, expenses FROM all_finances
+                """, (season,)).rowcount
+                for schema in ['main', *self._shard_aliases]:
+                    conn.execute(f"UPDATE {schema}.finances SET revenue = 0, expenses = 0")
+                    conn.execute(f"DELETE FROM {schema}.matches WHERE id IN (SELECT id FROM temp.season_matches)")
+                conn.execute("DROP TABLE temp.season_matches")
+                # Archived matches are not replayable, so their snapshots can go
+                self._delete_unused_snapshots()
+            # Cached finance records still show last season's revenue and expenses
+            self.identity_map.clear()
+            self.team_ratings.clear()
+            self.logger.info(f"Season {season} archived: {matches} matches, {teams} teams, {finances} finance records.")
+            return {'matches': matches, 'teams': teams, 'finances': finances}
+        except Error as e:
+            self.logger.error(f"Error archiving season {season}: {e}")
+            self._raise_in_transaction(e)
+            return None
+
+    def get_archived_seasons(self):
+        try:
+            with self._reader() as conn:
+                rows = conn.execute("""
+                    SELECT season FROM season_standings UNION SELECT season FROM season_finances ORDER BY season
+                """).fetchall()
+            return [row[0] for row in rows]
+        except Error as e:
+            self.logger.error(f"Error retrieving archived seasons: {e}")
+            return []
+
+    def get_season_standings(self, season, country=None, division=None):
+        """
+        Return the final league tables of an archived season.
+
+        Tables are grouped by country and division, each best team first;
+        pass country and division to get a single table.
+        """
+        try:
+            conditions = ["s.season = ?"]
+            params = [season]
+            if country is not None:
+                conditions.append("s.country = ?")
+                params.append(country)
+            if division is not None:
+                conditions.append("s.division = ?")
+                params.append(division)
+            with self._reader() as conn:
+                rows = conn.execute(f"""
+                    SELECT t.name, s.team_id, s.country, s.division, s.played, s.won, s.drawn, s.lost,
+                           s.goals_for, s.goals_against, s.points
+                    FROM season_standings s
+                    LEFT JOIN all_teams t ON t.id = s.team_id
+                    WHERE {' AND '.join(conditions)}
+                    ORDER BY s.country, s.division, points DESC, goals_for - goals_against DESC, goals_for DESC
+                """, params).fetchall()
+            return [dict(row) for row in rows]
+        except Error as e:
+            self.logger.error(f"Error retrieving standings for season {season}: {e}")
+            return []
+
+    def get_finance_history(self, team_id):
+        """Return a team's end-of-season finance snapshots, oldest first."""
+        try:
+            with self._reader() as conn:
+                rows = conn.execute("""
+                    SELECT season, budget, revenue, expenses FROM season_finances
+                    WHERE team_id = ? ORDER BY season
+                """, (team_id,)).fetchall()
+            return [dict(row) for row in rows]
+        except Error as e:
+            self.logger.error(f"Error retrieving finance history for Team ID {team_id}: {e}")
+            return []
+
+    def get_team_match_history(self, team_id):
+        """Return every match a team has played, current and archived, in date order."""
+        try:
+            with self._reader() as conn:
+                # Current matches come from every shard, archived ones from main
+                return conn.execute("""
+                    SELECT id, NULL AS season, home_team_id, away_team_id, date, home_score, away_score
+                    FROM all_matches WHERE home_team_id = ? OR away_team_id = ?
+                    UNION ALL
+                    SELECT id, season, home_team_id, away_team_id, date, home_score, away_score
+                    FROM archived_matches WHERE home_team_id = ? OR away_team_id = ?
+                    ORDER BY date, id
+                """, (team_id, team_id, team_id, team_id)).fetchall()
+        except Error as e:
+            self.logger.error(f"Error retrieving match history for Team ID {team_id}: {e}")
+            return []
 
     # League methods
     def add_league(self, name, season):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO leagues (name, season)
-                VALUES (?, ?)
-            """, (name, season))
-            self.conn.commit()
-            league_id = cursor.lastrowid
-            self.logger.info(f"League '{name}' for season '{season}' added successfully with ID {league_id}.")
-            return league_id
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO leagues (name, season)
+                    VALUES (?, ?)
+                """, (name, season))
+                self._commit()
+                league_id = cursor.lastrowid
+                self.logger.info(f"League '{name}' for season '{season}' added successfully with ID {league_id}.")
+                return league_id
         except Error as e:
             self.logger.error(f"Error adding league: {e}")
+            self._raise_in_transaction(e)
 
     def get_league_by_id(self, league_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM leagues WHERE id = ?", (league_id,))
-            league = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM leagues WHERE id = ?", (league_id,))
+                league = cursor.fetchone()
             if league:
                 league_dict = {
                     'id': league['id'],
@@ -554,9 +1771,10 @@ class DatabaseManager:
 
     def get_all_leagues(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM leagues")
-            leagues = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM leagues")
+                leagues = cursor.fetchall()
             self.logger.info(f"Retrieved {len(leagues)} leagues.")
             return leagues
         except Error as e:
@@ -565,62 +1783,77 @@ class DatabaseManager:
 
     def update_league_name(self, league_id, new_name):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE leagues
-                SET name = ?
-                WHERE id = ?
-            """, (new_name, league_id))
-            self.conn.commit()
-            self.logger.info(f"League ID {league_id} name updated to '{new_name}'.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE leagues
+                    SET name = ?
+                    WHERE id = ?
+                """, (new_name, league_id))
+                self._commit()
+                self.logger.info(f"League ID {league_id} name updated to '{new_name}'.")
         except Error as e:
             self.logger.error(f"Error updating league name: {e}")
+            self._raise_in_transaction(e)
 
     def update_league_season(self, league_id, new_season):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE leagues
-                SET season = ?
-                WHERE id = ?
-            """, (new_season, league_id))
-            self.conn.commit()
-            self.logger.info(f"League ID {league_id} season updated to '{new_season}'.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    UPDATE leagues
+                    SET season = ?
+                    WHERE id = ?
+                """, (new_season, league_id))
+                self._commit()
+                self.logger.info(f"League ID {league_id} season updated to '{new_season}'.")
         except Error as e:
             self.logger.error(f"Error updating league season: {e}")
+            self._raise_in_transaction(e)
 
     def delete_league(self, league_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM leagues
-                WHERE id = ?
-            """, (league_id,))
-            self.conn.commit()
-            self.logger.info(f"League ID {league_id} deleted successfully.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    DELETE FROM leagues
+                    WHERE id = ?
+                """, (league_id,))
+                self._commit()
+                self.logger.info(f"League ID {league_id} deleted successfully.")
         except Error as e:
             self.logger.error(f"Error deleting league: {e}")
+            self._raise_in_transaction(e)
 
     # Finance methods
     def add_finance(self, team_id, budget, revenue=0, expenses=0):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                INSERT INTO finances (team_id, budget, revenue, expenses)
-                VALUES (?, ?, ?, ?)
-            """, (team_id, budget, revenue, expenses))
-            self.conn.commit()
-            finance_id = cursor.lastrowid
-            self.logger.info(f"Finance record for Team ID {team_id} added successfully with ID {finance_id}.")
-            return finance_id
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    INSERT INTO {schema}.finances (team_id, budget, revenue, expenses)
+                    VALUES (?, ?, ?, ?)
+                """, (team_id, budget, revenue, expenses))
+                self._commit()
+                self._cache_invalidate('finance', team_id)
+                finance_id = cursor.lastrowid
+                self.logger.info(f"Finance record for Team ID {team_id} added successfully with ID {finance_id}.")
+                return finance_id
         except Error as e:
             self.logger.error(f"Error adding finance record: {e}")
+            self._raise_in_transaction(e)
 
     def get_finance_by_team_id(self, team_id):
+        cached = self.identity_map.get(('finance', team_id))
+        if cached is not None:
+            return cached
+        generation = self._cache_generation()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM finances WHERE team_id = ?", (team_id,))
-            finance = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_finances WHERE team_id = ?", (team_id,))
+                finance = cursor.fetchone()
             if finance:
                 finance_dict = {
                     'id': finance['id'],
@@ -629,6 +1862,7 @@ class DatabaseManager:
                     'revenue': finance['revenue'],
                     'expenses': finance['expenses']
                 }
+                self._cache_fill(('finance', team_id), finance_dict, generation)
                 self.logger.info(f"Retrieved finance record: {finance_dict}")
                 return finance_dict
             else:
@@ -640,65 +1874,83 @@ class DatabaseManager:
 
     def update_finance_budget(self, team_id, new_budget):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE finances
-                SET budget = ?
-                WHERE team_id = ?
-            """, (new_budget, team_id))
-            self.conn.commit()
-            self.logger.info(f"Finance budget for Team ID {team_id} updated to {new_budget}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.finances
+                    SET budget = ?
+                    WHERE team_id = ?
+                """, (new_budget, team_id))
+                self._commit()
+                self._cache_update('finance', team_id, budget=new_budget)
+                self.logger.info(f"Finance budget for Team ID {team_id} updated to {new_budget}.")
         except Error as e:
             self.logger.error(f"Error updating finance budget: {e}")
+            self._raise_in_transaction(e)
 
     def update_finance_revenue(self, team_id, additional_revenue):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE finances
-                SET revenue = revenue + ?, budget = budget + ?
-                WHERE team_id = ?
-            """, (additional_revenue, additional_revenue, team_id))
-            self.conn.commit()
-            self.logger.info(f"Finance revenue for Team ID {team_id} increased by {additional_revenue}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.finances
+                    SET revenue = revenue + ?, budget = budget + ?
+                    WHERE team_id = ?
+                """, (additional_revenue, additional_revenue, team_id))
+                self._commit()
+                self._cache_invalidate('finance', team_id)
+                self.logger.info(f"Finance revenue for Team ID {team_id} increased by {additional_revenue}.")
         except Error as e:
             self.logger.error(f"Error updating finance revenue: {e}")
+            self._raise_in_transaction(e)
 
     def update_finance_expenses(self, team_id, additional_expenses):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                UPDATE finances
-                SET expenses = expenses + ?, budget = budget - ?
-                WHERE team_id = ?
-            """, (additional_expenses, additional_expenses, team_id))
-            self.conn.commit()
-            self.logger.info(f"Finance expenses for Team ID {team_id} increased by {additional_expenses}.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    UPDATE {schema}.finances
+                    SET expenses = expenses + ?, budget = budget - ?
+                    WHERE team_id = ?
+                """, (additional_expenses, additional_expenses, team_id))
+                self._commit()
+                self._cache_invalidate('finance', team_id)
+                self.logger.info(f"Finance expenses for Team ID {team_id} increased by {additional_expenses}.")
         except Error as e:
             self.logger.error(f"Error updating finance expenses: {e}")
+            self._raise_in_transaction(e)
 
     def delete_finance(self, team_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                DELETE FROM finances
-                WHERE team_id = ?
-            """, (team_id,))
-            self.conn.commit()
-            self.logger.info(f"Finance record for Team ID {team_id} deleted successfully.")
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                schema = self._schema_of(conn, 'teams', team_id)
+                cursor.execute(f"""
+                    DELETE FROM {schema}.finances
+                    WHERE team_id = ?
+                """, (team_id,))
+                self._commit()
+                self._cache_invalidate('finance', team_id)
+                self.logger.info(f"Finance record for Team ID {team_id} deleted successfully.")
         except Error as e:
             self.logger.error(f"Error deleting finance record: {e}")
+            self._raise_in_transaction(e)
 
     # Settings methods
     def get_settings(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM settings WHERE id = 1")
-            settings = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM settings WHERE id = 1")
+                settings = cursor.fetchone()
             if settings:
                 settings_dict = {
                     'difficulty': settings['difficulty'],
-                    'audio': settings['audio']
+                    'audio': settings['audio'],
+                    'performance_profile': settings['performance_profile']
                 }
                 self.logger.info(f"Retrieved settings: {settings_dict}")
                 return settings_dict
@@ -710,33 +1962,289 @@ class DatabaseManager:
             return None
 
     def set_setting(self, key, value):
-        if key not in ['difficulty', 'audio']:
+        if key not in ['difficulty', 'audio', 'performance_profile']:
             self.logger.error(f"Invalid setting key: {key}")
             return False
+        if key == 'performance_profile' and not self.apply_performance_profile(value):
+            return False
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(f"""
-                UPDATE settings
-                SET {key} = ?
-                WHERE id = 1
-            """, (value,))
-            self.conn.commit()
-            self.logger.info(f"Setting '{key}' updated to '{value}'.")
-            return True
+            with self._writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"""
+                    UPDATE settings
+                    SET {key} = ?
+                    WHERE id = 1
+                """, (value,))
+                self._commit()
+                self.logger.info(f"Setting '{key}' updated to '{value}'.")
+                return True
         except Error as e:
             self.logger.error(f"Error setting '{key}': {e}")
+            self._raise_in_transaction(e)
             return False
 
+    def get_save_seed(self):
+        """Return the seed every match seed in this save is derived from."""
+        try:
+            with self._reader() as conn:
+                row = conn.execute("SELECT save_seed FROM settings WHERE id = 1").fetchone()
+            return row[0] if row else None
+        except Error as e:
+            self.logger.error(f"Error retrieving save seed: {e}")
+            return None
+
+    def set_save_seed(self, seed=None):
+        """Store seed, or a fresh random one, as the save seed and return it."""
+        if seed is None:
+            seed = random.getrandbits(31)
+        try:
+            with self._writer() as conn:
+                conn.execute("UPDATE settings SET save_seed = ? WHERE id = 1", (seed,))
+                self._commit()
+            return seed
+        except Error as e:
+            self.logger.error(f"Error setting save seed: {e}")
+            self._raise_in_transaction(e)
+            return None
+
+    def get_managed_team_id(self):
+        """Return the id of the club the player manages, or None."""
+        try:
+            with self._reader() as conn:
+                row = conn.execute("SELECT managed_team_id FROM settings WHERE id = 1").fetchone()
+            return row[0] if row else None
+        except Error as e:
+            self.logger.error(f"Error retrieving managed team: {e}")
+            return None
+
+    def set_managed_team_id(self, team_id):
+        try:
+            with self._writer() as conn:
+                conn.execute("UPDATE settings SET managed_team_id = ? WHERE id = 1", (team_id,))
+                self._commit()
+            self.logger.info(f"Managed team set to Team ID {team_id}.")
+            return True
+        except Error as e:
+            self.logger.error(f"Error setting managed team: {e}")
+            self._raise_in_transaction(e)
+            return False
+
+    def get_unplayed_match_dates(self, until=None):
+        """Return the distinct dates with unplayed matches, up to and including until."""
+        try:
+            query = "SELECT DISTINCT date FROM all_matches WHERE home_score IS NULL"
+            params = []
+            if until is not None:
+                query += " AND date <= ?"
+                params.append(until)
+            with self._reader() as conn:
+                return [row[0] for row in conn.execute(query + " ORDER BY date", params)]
+        except Error as e:
+            self.logger.error(f"Error retrieving fixture dates: {e}")
+            return []
+
+    # Model loaders: rows are materialised directly as model objects
+    def load_player(self, player_id):
+        try:
+            return self._load_cached_model('player', player_id, player_factory,
+                                           f"SELECT {PLAYER_COLUMNS} FROM all_players WHERE id = ?")
+        except Error as e:
+            self.logger.error(f"Error loading player: {e}")
+            return None
+
+    def load_players(self):
+        try:
+            players = self._fetch_models(player_factory, f"SELECT {PLAYER_COLUMNS} FROM all_players")
+            self.logger.info(f"Loaded {len(players)} players.")
+            return players
+        except Error as e:
+            self.logger.error(f"Error loading players: {e}")
+            return []
+
+    def load_available_players(self):
+        try:
+            players = self._fetch_models(player_factory, f"""
+                SELECT {PLAYER_COLUMNS} FROM all_players
+                WHERE id NOT IN (SELECT player_id FROM all_team_players)
+            """)
+            self.logger.info(f"Loaded {len(players)} available players.")
+            return players
+        except Error as e:
+            self.logger.error(f"Error loading available players: {e}")
+            return []
+
+    def load_team(self, team_id):
+        try:
+            return self._load_cached_model('team', team_id, team_factory,
+                                           f"SELECT {TEAM_COLUMNS} FROM all_teams WHERE id = ?")
+        except Error as e:
+            self.logger.error(f"Error loading team: {e}")
+            return None
+
+    def load_teams(self):
+        try:
+            teams = self._fetch_models(team_factory, f"SELECT {TEAM_COLUMNS} FROM all_teams")
+            self.logger.info(f"Loaded {len(teams)} teams.")
+            return teams
+        except Error as e:
+            self.logger.error(f"Error loading teams: {e}")
+            return []
+
+    def load_match(self, match_id):
+        try:
+            return self._fetch_models(match_factory, f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE id = ?",
+                                      (match_id,), one=True)
+        except Error as e:
+            self.logger.error(f"Error loading match: {e}")
+            return None
+
+    def load_matches(self):
+        try:
+            matches = self._fetch_models(match_factory, f"SELECT {MATCH_COLUMNS} FROM all_matches")
+            self.logger.info(f"Loaded {len(matches)} matches.")
+            return matches
+        except Error as e:
+            self.logger.error(f"Error loading matches: {e}")
+            return []
+
+    def load_matches_on(self, date):
+        """Load every match scheduled on date, in id order."""
+        try:
+            return self._fetch_models(
+                match_factory, f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE date = ? ORDER BY id", (date,)
+            )
+        except Error as e:
+            self.logger.error(f"Error loading matches on {date}: {e}")
+            return []
+
+    def load_unplayed_matches_on(self, date):
+        """Load the matches on date that have no result yet, in id order."""
+        try:
+            return self._fetch_models(
+                match_factory,
+                f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE date = ? AND home_score IS NULL ORDER BY id",
+                (date,)
+            )
+        except Error as e:
+            self.logger.error(f"Error loading unplayed matches on {date}: {e}")
+            return []
+
+    def load_matches_by_ids(self, match_ids, chunk_size=900):
+        """Load the given matches as Match objects, querying in chunks to stay under SQLite's variable limit."""
+        match_ids = list(match_ids)
+        try:
+            matches = []
+            for start in range(0, len(match_ids), chunk_size):
+                chunk = match_ids[start:start + chunk_size]
+                matches.extend(self._fetch_models(
+                    match_factory,
+                    f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ))
+            return matches
+        except Error as e:
+            self.logger.error(f"Error loading matches: {e}")
+            return []
+
+    def load_league(self, league_id):
+        try:
+            return self._fetch_models(league_factory, f"SELECT {LEAGUE_COLUMNS} FROM leagues WHERE id = ?",
+                                      (league_id,), one=True)
+        except Error as e:
+            self.logger.error(f"Error loading league: {e}")
+            return None
+
+    def load_leagues(self):
+        try:
+            leagues = self._fetch_models(league_factory, f"SELECT {LEAGUE_COLUMNS} FROM leagues")
+            self.logger.info(f"Loaded {len(leagues)} leagues.")
+            return leagues
+        except Error as e:
+            self.logger.error(f"Error loading leagues: {e}")
+            return []
+
+    def load_finance(self, team_id):
+        try:
+            return self._load_cached_model('finance', team_id, finance_factory,
+                                           f"SELECT {FINANCE_COLUMNS} FROM all_finances WHERE team_id = ?")
+        except Error as e:
+            self.logger.error(f"Error loading finance record: {e}")
+            return None
+
+    # Streaming and keyset pagination: each page is one indexed range scan on id
+    def _page_models(self, factory, select_sql, after_id, limit, params=()):
+        """Return up to limit models with id > after_id, ordered by id."""
+        return self._fetch_models(
+            factory,
+            f"{select_sql} AND id > ? ORDER BY id LIMIT ?",
+            (*params, after_id, limit)
+        )
+
+    def _iter_models(self, factory, select_sql, batch, params=()):
+        """
+        Yield models page by page.
+
+        A connection is only held while a page is fetched, so slow consumers
+        never pin a reader and memory stays bounded by the batch size.
+        """
+        after_id = 0
+        while True:
+            page = self._page_models(factory, select_sql, after_id, batch, params)
+            yield from page
+            if len(page) < batch:
+                return
+            after_id = page[-1].id
+
+    def iter_players(self, batch=500):
+        return self._iter_models(player_factory, f"SELECT {PLAYER_COLUMNS} FROM all_players WHERE 1", batch)
+
+    def iter_available_players(self, batch=500):
+        return self._iter_models(player_factory, f"""
+            SELECT {PLAYER_COLUMNS} FROM all_players
+            WHERE id NOT IN (SELECT player_id FROM all_team_players)
+        """, batch)
+
+    def iter_teams(self, batch=500):
+        return self._iter_models(team_factory, f"SELECT {TEAM_COLUMNS} FROM all_teams WHERE 1", batch)
+
+    def iter_matches(self, batch=500):
+        return self._iter_models(match_factory, f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE 1", batch)
+
+    def page_players(self, after_id=0, limit=50):
+        try:
+            return self._page_models(player_factory, f"SELECT {PLAYER_COLUMNS} FROM all_players WHERE 1", after_id, limit)
+        except Error as e:
+            self.logger.error(f"Error paging players: {e}")
+            return []
+
+    def page_available_players(self, after_id=0, limit=50):
+        try:
+            return self._page_models(player_factory, f"""
+                SELECT {PLAYER_COLUMNS} FROM all_players
+                WHERE id NOT IN (SELECT player_id FROM all_team_players)
+            """, after_id, limit)
+        except Error as e:
+            self.logger.error(f"Error paging available players: {e}")
+            return []
+
+    def page_matches(self, after_id=0, limit=50):
+        try:
+            return self._page_models(match_factory, f"SELECT {MATCH_COLUMNS} FROM all_matches WHERE 1", after_id, limit)
+        except Error as e:
+            self.logger.error(f"Error paging matches: {e}")
+            return []
+
     # Additional methods for teams, finances, etc.
     def get_available_players(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT p.* FROM players p
-                LEFT JOIN team_players tp ON p.id = tp.player_id
-                WHERE tp.player_id IS NULL
-            """)
-            players = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT p.* FROM all_players p
+                    LEFT JOIN all_team_players tp ON p.id = tp.player_id
+                    WHERE tp.player_id IS NULL
+                """)
+                players = cursor.fetchall()
             self.logger.info(f"Retrieved {len(players)} available players.")
             return players
         except Error as e:
@@ -745,11 +2253,12 @@ class DatabaseManager:
 
     def get_team_of_player(self, player_id):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT team_id FROM team_players WHERE player_id = ?
-            """, (player_id,))
-            result = cursor.fetchone()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT team_id FROM all_team_players WHERE player_id = ?
+                """, (player_id,))
+                result = cursor.fetchone()
             if result:
                 team_id = result['team_id']
                 self.logger.info(f"Player ID {player_id} belongs to Team ID {team_id}.")
@@ -763,14 +2272,13 @@ class DatabaseManager:
 
     def get_all_teams(self):
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM teams")
-            teams = cursor.fetchall()
+            with self._reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT * FROM all_teams")
+                teams = cursor.fetchall()
             self.logger.info(f"Retrieved {len(teams)} teams.")
             return teams
         except Error as e:
             self.logger.error(f"Error retrieving teams: {e}")
             return []
     # Add other necessary methods as needed
-
-    # Add other necessary methods as needed
\ No newline at end of file
@@ -0,0 +1,80 @@
+import threading
+from collections import OrderedDict
+
+
+class IdentityMap:
+    """
+    Bounded LRU map from (kind, id) keys to the single in-memory object for that row.
+
+    DatabaseManager reads through it so repeated lookups of the same team,
+    player or finance record return the same object without touching SQLite,
+    and its write methods update or evict the affected entries.
+
+    generation counts writes. A reader takes it before querying and passes it
+    to put(), which drops the row if any write happened in between, so a row
+    read just before a commit never outlives it in the map.
+    """
+
+    def __init__(self, max_size=2048):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached object for key, or None, counting the hit or miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, generation=None):
+        """Cache value for key, unless generation is given and a write has happened since."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def update(self, key, **fields):
+        """Apply fields to the cached object in place, if it is cached."""
+        with self._lock:
+            self.generation += 1
+            value = self._entries.get(key)
+            if value is None:
+                return
+            if isinstance(value, dict):
+                value.update(fields)
+            else:
+                for name, field in fields.items():
+                    setattr(value, name, field)
+
+    def invalidate(self, key):
+        with self._lock:
+            self.generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+            }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,63 @@
+"""
+League packs: one JSON file per country describing its divisions and clubs.
+
+A pack looks like
+
+    {
+      "country": "England",
+      "formation": "4-4-2",
+      "tactics": "Balanced",
+      "divisions": [
+        {"level": 1, "name": "Premier League", "reputation": 80,
+         "clubs": [{"name": "Arsenal"}, {"name": "Chelsea", "reputation": 82}]}
+      ]
+    }
+
+Clubs inherit formation, tactics and reputation from their pack and division
+unless they set their own. Packs are only read when a country is first needed,
+so installing more countries costs nothing until one is used.
+"""
+import json
+import os
+from utils.constants import LEAGUE_PACK_DIR
+
+DEFAULT_REPUTATION = 50
+
+
+def pack_path(country, pack_dir=LEAGUE_PACK_DIR):
+    return os.path.join(pack_dir, f"{country.lower().replace(' ', '_')}.json")
+
+
+def available_countries(pack_dir=LEAGUE_PACK_DIR):
+    """Return the installed countries, named from their pack files without opening them."""
+    if not os.path.isdir(pack_dir):
+        return []
+    return sorted(
+        os.path.splitext(file_name)[0].replace('_', ' ').title()
+        for file_name in os.listdir(pack_dir)
+        if file_name.endswith('.json')
+    )
+
+
+def read_pack(country, pack_dir=LEAGUE_PACK_DIR):
+    """Parse the pack for country and return (division rows, team rows) ready for insertion."""
+    with open(pack_path(country, pack_dir), encoding='utf-8') as pack_file:
+        pack = json.load(pack_file)
+    if pack.get('country') != country:
+        raise ValueError(f"Pack for {country} declares country {pack.get('country')!r}")
+
+    divisions = []
+    teams = []
+    for division in pack['divisions']:
+        level = division['level']
+        divisions.append((country, level, division['name']))
+        for club in division['clubs']:
+            teams.append((
+                club['name'],
+                club.get('formation', pack.get('formation', '4-4-2')),
+                club.get('tactics', pack.get('tactics', 'Balanced')),
+                country,
+                level,
+                club.get('reputation', division.get('reputation', DEFAULT_REPUTATION))
+            ))
+    return divisions, teams
@@ -0,0 +1,370 @@
+"""
+Versioned schema migrations for the savegame database.
+
+Each migration is a (version, description, step) entry in MIGRATIONS, applied in
+order inside its own transaction. The schema_version table records every applied
+version and PRAGMA user_version mirrors the latest one, so opening an up-to-date
+save only costs a single header read.
+
+Migrations never import game code: a step must produce the same schema and
+data however that code changes later.
+"""
+
+
+def _create_base_tables(cursor):
+    # Teams table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS teams (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            formation TEXT,
+            tactics TEXT,
+            country TEXT DEFAULT 'England',
+            division INTEGER DEFAULT 1
+        );
+    """)
+    # Saves created before 'country' and 'division' existed need the columns added
+    cursor.execute("PRAGMA table_info(teams)")
+    columns = {column[1] for column in cursor.fetchall()}
+    if 'country' not in columns:
+        cursor.execute("ALTER TABLE teams ADD COLUMN country TEXT DEFAULT 'England'")
+    if 'division' not in columns:
+        cursor.execute("ALTER TABLE teams ADD COLUMN division INTEGER DEFAULT 1")
+    # Players table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            position TEXT,
+            skills INTEGER,
+            morale INTEGER,
+            contract_end INTEGER
+        );
+    """)
+    # Team_Players join table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS team_players (
+            team_id INTEGER,
+            player_id INTEGER,
+            PRIMARY KEY (team_id, player_id),
+            FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE CASCADE,
+            FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE
+        );
+    """)
+    # Matches table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            home_team_id INTEGER,
+            away_team_id INTEGER,
+            date TEXT,
+            home_score INTEGER,
+            away_score INTEGER,
+            FOREIGN KEY (home_team_id) REFERENCES teams (id),
+            FOREIGN KEY (away_team_id) REFERENCES teams (id)
+        );
+    """)
+    # Leagues table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS leagues (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            season TEXT
+        );
+    """)
+    # Finances table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS finances (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_id INTEGER,
+            budget INTEGER,
+            revenue INTEGER,
+            expenses INTEGER,
+            FOREIGN KEY (team_id) REFERENCES teams (id)
+        );
+    """)
+    # Settings table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS settings (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            difficulty TEXT DEFAULT 'Easy',
+            audio TEXT DEFAULT 'On'
+        );
+    """)
+    cursor.execute("""
+        INSERT OR IGNORE INTO settings (id, difficulty, audio)
+        VALUES (1, 'Easy', 'On')
+    """)
+
+
+def _add_lookup_indexes(cursor):
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_team_players_player ON team_players (player_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_finances_team ON finances (team_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_teams_country_division ON teams (country, division)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_home_date ON matches (home_team_id, date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_away_date ON matches (away_team_id, date)")
+
+
+def _add_performance_profile_setting(cursor):
+    cursor.execute("ALTER TABLE settings ADD COLUMN performance_profile TEXT DEFAULT 'balanced'")
+
+
+def _cascade_team_deletes(cursor):
+    # Drop rows left behind by earlier team deletes, which were never enforced
+    cursor.execute("""
+        DELETE FROM team_players
+        WHERE team_id NOT IN (SELECT id FROM teams)
+           OR player_id NOT IN (SELECT id FROM players)
+    """)
+    cursor.execute("DELETE FROM finances WHERE team_id NOT IN (SELECT id FROM teams)")
+    cursor.execute("""
+        DELETE FROM matches
+        WHERE home_team_id NOT IN (SELECT id FROM teams)
+           OR away_team_id NOT IN (SELECT id FROM teams)
+    """)
+    # SQLite cannot alter a foreign key, so rebuild both tables with ON DELETE CASCADE
+    cursor.execute("""
+        CREATE TABLE matches_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            home_team_id INTEGER,
+            away_team_id INTEGER,
+            date TEXT,
+            home_score INTEGER,
+            away_score INTEGER,
+            FOREIGN KEY (home_team_id) REFERENCES teams (id) ON DELETE CASCADE,
+            FOREIGN KEY (away_team_id) REFERENCES teams (id) ON DELETE CASCADE
+        );
+    """)
+    cursor.execute("""
+        INSERT INTO matches_new (id, home_team_id, away_team_id, date, home_score, away_score)
+        SELECT id, home_team_id, away_team_id, date, home_score, away_score FROM matches
+    """)
+    cursor.execute("DROP TABLE matches")
+    cursor.execute("ALTER TABLE matches_new RENAME TO matches")
+    cursor.execute("""
+        CREATE TABLE finances_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            team_id INTEGER,
+            budget INTEGER,
+            revenue INTEGER,
+            expenses INTEGER,
+            FOREIGN KEY (team_id) REFERENCES teams (id) ON DELETE CASCADE
+        );
+    """)
+    cursor.execute("""
+        INSERT INTO finances_new (id, team_id, budget, revenue, expenses)
+        SELECT id, team_id, budget, revenue, expenses FROM finances
+    """)
+    cursor.execute("DROP TABLE finances")
+    cursor.execute("ALTER TABLE finances_new RENAME TO finances")
+    # Dropping the old tables dropped their indexes too
+    _add_lookup_indexes(cursor)
+
+
+def _add_countries_and_reputation(cursor):
+    cursor.execute("ALTER TABLE teams ADD COLUMN reputation INTEGER DEFAULT 50")
+    # One row per country whose league pack has been imported into this save
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS countries (
+            name TEXT PRIMARY KEY,
+            simulation TEXT NOT NULL DEFAULT 'quick' CHECK (simulation IN ('quick', 'full')),
+            loaded_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS divisions (
+            country TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            PRIMARY KEY (country, level),
+            FOREIGN KEY (country) REFERENCES countries (name) ON DELETE CASCADE
+        );
+    """)
+    # Clubs in saves made before league packs count as already loaded, not yet opened
+    cursor.execute("""
+        INSERT INTO countries (name, simulation)
+        SELECT DISTINCT country, 'quick' FROM teams WHERE country IS NOT NULL
+    """)
+
+
+def _add_shard_registry(cursor):
+    # Countries whose world data lives in an attached per-country file
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS shards (
+            country TEXT PRIMARY KEY,
+            slot INTEGER NOT NULL UNIQUE,
+            path TEXT NOT NULL
+        );
+    """)
+
+
+def _add_season_archive(cursor):
+    # Played matches of finished seasons, moved out of the hot matches table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS archived_matches (
+            id INTEGER PRIMARY KEY,
+            season TEXT NOT NULL,
+            home_team_id INTEGER,
+            away_team_id INTEGER,
+            date TEXT,
+            home_score INTEGER,
+            away_score INTEGER
+        );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_archived_matches_season ON archived_matches (season)")
+    # Final league tables, one per country and division as they stood at the end of
+    # the season, and end-of-season finance snapshots. Sharded countries' teams are
+    # not in main's teams table, so history keeps bare team ids
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS season_standings (
+            season TEXT NOT NULL,
+            team_id INTEGER NOT NULL,
+            country TEXT,
+            division INTEGER,
+            played INTEGER,
+            won INTEGER,
+            drawn INTEGER,
+            lost INTEGER,
+            goals_for INTEGER,
+            goals_against INTEGER,
+            points INTEGER,
+            PRIMARY KEY (season, team_id)
+        );
+    """)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS season_finances (
+            season TEXT NOT NULL,
+            team_id INTEGER NOT NULL,
+            budget INTEGER,
+            revenue INTEGER,
+            expenses INTEGER,
+            PRIMARY KEY (season, team_id)
+        );
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_season_finances_team ON season_finances (team_id)")
+
+
+def _add_match_events(cursor):
+    # Each match's event log is one packed blob (see engine.event_log), read and written whole
+    cursor.execute("ALTER TABLE matches ADD COLUMN events BLOB")
+
+
+def _add_save_seed(cursor):
+    # Root of every match seed, so a save replays identically however it is simulated
+    cursor.execute("ALTER TABLE settings ADD COLUMN save_seed INTEGER")
+    cursor.execute("UPDATE settings SET save_seed = abs(random() % 2147483648)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_matches_date ON matches (date)")
+
+
+def _add_managed_team(cursor):
+    cursor.execute(
+        "ALTER TABLE settings ADD COLUMN managed_team_id INTEGER REFERENCES teams (id) ON DELETE SET NULL"
+    )
+
+
+def _add_team_ratings(cursor):
+    # Precomputed engine ratings; dirty rows are recomputed from the squad on next use
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS team_ratings (
+            team_id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL,
+            attack REAL NOT NULL,
+            defence REAL NOT NULL,
+            card_rate REAL NOT NULL,
+            starters TEXT NOT NULL,
+            scorer_weights TEXT NOT NULL,
+            bench TEXT NOT NULL,
+            dirty INTEGER NOT NULL DEFAULT 0
+        );
+    """)
+
+
+def _add_replay_keys(cursor):
+    # Each distinct TeamRatings is stored once; fully simulated matches point at two of them
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS rating_snapshots (
+            id INTEGER PRIMARY KEY,
+            digest BLOB NOT NULL UNIQUE,
+            ratings BLOB NOT NULL
+        );
+    """)
+    for column in ('engine_version', 'home_snapshot', 'away_snapshot', 'events_digest'):
+        cursor.execute(f"ALTER TABLE matches ADD COLUMN {column} INTEGER")
+
+
+MIGRATIONS = [
+    (1, "Create base tables", _create_base_tables),
+    (2, "Add secondary indexes for team, finance and match lookups", _add_lookup_indexes),
+    (3, "Add performance_profile setting", _add_performance_profile_setting),
+    (4, "Cascade team deletes to matches and finances", _cascade_team_deletes),
+    (5, "Add countries, divisions and team reputation for league packs", _add_countries_and_reputation),
+    (6, "Add registry of per-country shard files", _add_shard_registry),
+    (7, "Add season archive tables", _add_season_archive),
+    (8, "Add packed match event log", _add_match_events),
+    (9, "Add save seed and matchday index", _add_save_seed),
+    (10, "Add managed team setting", _add_managed_team),
+    (11, "Add precomputed team ratings", _add_team_ratings),
+    (12, "Add replay keys and team rating snapshots", _add_replay_keys),
+]
+
+CURRENT_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn):
+    """Return the highest applied migration version, or 0 for an unversioned database."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] == CURRENT_SCHEMA_VERSION:
+        return CURRENT_SCHEMA_VERSION
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn, logger=None):
+    """
+    Apply every pending migration in order.
+
+    Each step and its schema_version row are committed together, so an
+    interrupted upgrade resumes from the last completed version.
+    Foreign keys are switched off while steps run so tables can be rebuilt,
+    and restored afterwards.
+    Returns the list of versions that were applied.
+    """
+    if conn.execute("PRAGMA user_version").fetchone()[0] == CURRENT_SCHEMA_VERSION:
+        return []
+    conn.commit()
+    # Only takes effect on a brand-new file; existing saves switch over when compacted
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    current = get_schema_version(conn)
+    conn.commit()
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+    applied = []
+    try:
+        for version, description, step in MIGRATIONS:
+            if version <= current:
+                continue
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN")
+                step(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (version, description)
+                )
+                cursor.execute(f"PRAGMA user_version = {version}")
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(version)
+            if logger:
+                logger.info(f"Applied schema migration {version}: {description}")
+    finally:
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+    return applied
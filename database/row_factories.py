@@ -0,0 +1,47 @@
+"""
+Row factories that build model objects straight from a cursor.
+
+Each *_COLUMNS string fixes the SELECT order its factory reads positionally,
+so rows never pass through sqlite3.Row or an intermediate dict.
+"""
+from models.player import Player
+from models.team import Team
+from models.match import Match
+from models.league import League
+from models.finance import Finance
+
+PLAYER_COLUMNS = "id, name, position, skills, morale, contract_end"
+TEAM_COLUMNS = "id, name, formation, tactics"
+MATCH_COLUMNS = "id, home_team_id, away_team_id, date, home_score, away_score"
+LEAGUE_COLUMNS = "id, name, season"
+FINANCE_COLUMNS = "id, team_id, budget, revenue, expenses"
+
+
+def player_factory(cursor, row):
+    player = Player(row[1], row[2], row[3], row[4], row[5])
+    player.id = row[0]
+    return player
+
+
+def team_factory(cursor, row):
+    team = Team(row[1], row[2], row[3])
+    team.id = row[0]
+    return team
+
+
+def match_factory(cursor, row):
+    match = Match(row[1], row[2], row[3], row[4], row[5])
+    match.id = row[0]
+    return match
+
+
+def league_factory(cursor, row):
+    league = League(row[1], row[2])
+    league.id = row[0]
+    return league
+
+
+def finance_factory(cursor, row):
+    finance = Finance(row[1], row[2], row[3], row[4])
+    finance.id = row[0]
+    return finance
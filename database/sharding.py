@@ -0,0 +1,98 @@
+"""
+Per-country shard files attached to the main savegame.
+
+A sharded country's teams, players, squad links, matches and finances live in
+their own SQLite file, attached to every connection as shard_<country>. The
+TEMP views all_teams, all_players, all_team_players, all_matches and
+all_finances union main with every attached shard, so cross-country reads see
+one logical table while each shard can be written by its own process without
+contending for the main file's write lock.
+
+Rows created inside a shard take ids from that shard's own block
+(slot * SHARD_ID_SPAN upwards), so ids stay unique across the union. A player
+moves, id and all, into the file of the club that signs them.
+"""
+import re
+import sqlite3
+
+SHARDED_TABLES = ['teams', 'players', 'team_players', 'matches', 'finances']
+SHARD_ID_SPAN = 1 << 40
+
+
+def shard_alias(country):
+    return 'shard_' + re.sub(r'\W+', '_', country.lower()).strip('_')
+
+
+def open_shard(path, timeout=5.0):
+    """Open a shard file directly, e.g. from a worker process simulating that country."""
+    conn = sqlite3.connect(path, timeout=timeout)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def create_shard_schema(conn, alias, slot):
+    """Create the sharded tables and their indexes in an attached shard, mirroring main."""
+    rows = conn.execute(
+        "SELECT type, tbl_name, sql FROM main.sqlite_master WHERE tbl_name IN ({}) AND sql IS NOT NULL".format(
+            ', '.join('?' * len(SHARDED_TABLES))
+        ),
+        SHARDED_TABLES
+    ).fetchall()
+    for kind, table, sql in sorted(rows, key=lambda row: row[0] != 'table'):
+        if kind == 'table':
+            sql = re.sub(r'^CREATE TABLE\s+"?\w+"?', f'CREATE TABLE IF NOT EXISTS {alias}.{table}', sql)
+        else:
+            sql = re.sub(r'^CREATE INDEX\s+(?:IF NOT EXISTS\s+)?(\w+)', rf'CREATE INDEX IF NOT EXISTS {alias}.\1', sql)
+        conn.execute(sql)
+    upgrade_shard_schema(conn, alias)
+    # Start the shard's own AUTOINCREMENT counters at the bottom of its id block
+    for table in SHARDED_TABLES:
+        if conn.execute(f"SELECT 1 FROM {alias}.sqlite_sequence WHERE name = ?", (table,)).fetchone() is None:
+            if table != 'team_players':
+                conn.execute(
+                    f"INSERT INTO {alias}.sqlite_sequence (name, seq) VALUES (?, ?)", (table, slot * SHARD_ID_SPAN)
+                )
+
+
+def upgrade_shard_schema(conn, alias):
+    """Add any columns main has gained since the shard was created."""
+    for table in SHARDED_TABLES:
+        shard_columns = {row[1] for row in conn.execute(f"PRAGMA {alias}.table_info({table})")}
+        for _, name, column_type, _, default, _ in conn.execute(f"PRAGMA main.table_info({table})"):
+            if name not in shard_columns:
+                default_sql = f" DEFAULT {default}" if default is not None else ""
+                conn.execute(f"ALTER TABLE {alias}.{table} ADD COLUMN {name} {column_type}{default_sql}")
+
+
+def drop_views(conn):
+    for table in SHARDED_TABLES:
+        conn.execute(f"DROP VIEW IF EXISTS temp.all_{table}")
+
+
+def sync_connection(conn, shards, read_only=False):
+    """
+    Make conn's attached shards and all_* views match shards, a {alias: path} dict.
+
+    Read-only connections attach shards with mode=ro and briefly lift
+    query_only, which would otherwise forbid creating the TEMP views.
+    """
+    if read_only:
+        conn.execute("PRAGMA query_only = OFF")
+    try:
+        drop_views(conn)
+        attached = {row[1] for row in conn.execute("PRAGMA database_list")} - {'main', 'temp'}
+        for alias in attached - set(shards):
+            conn.execute(f"DETACH DATABASE {alias}")
+        for alias, path in shards.items():
+            if alias not in attached:
+                target = f"file:{path}?mode=ro" if read_only else path
+                conn.execute(f"ATTACH DATABASE ? AS {alias}", (target,))
+        for table in SHARDED_TABLES:
+            columns = ', '.join(row[1] for row in conn.execute(f"PRAGMA main.table_info({table})"))
+            selects = [f"SELECT {columns} FROM main.{table}"]
+            selects += [f"SELECT {columns} FROM {alias}.{table}" for alias in shards]
+            conn.execute(f"CREATE TEMP VIEW all_{table} AS {' UNION ALL '.join(selects)}")
+    finally:
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
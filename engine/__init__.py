@@ -0,0 +1,4 @@
+from engine.ratings import TeamRatings, rate_team
+from engine.match_engine import (
+    ENGINE_VERSION, MatchEngine, MatchEvent, MatchResult, expected_goals, final_score, goal_probabilities
+)
@@ -0,0 +1,88 @@
+"""
+Packed binary storage for match event logs.
+
+A log is one blob per match: a format byte followed by fixed-width records of
+(minute, kind and side, player id). Player ids are usually stored as 32-bit
+offsets from a base id in the header; the wide format with full 64-bit ids is
+only used when a match's ids are too far apart for that. Commentary is
+rendered from the decoded events when a match is viewed, so no text is stored.
+"""
+import struct
+import zlib
+from engine.match_engine import CHANCE, GOAL, RED, SHOT, SUBSTITUTION, YELLOW, MatchEvent
+
+WIDE = 1
+NARROW = 2
+# Records: minute, kind code << 1 | side, player id. 0 means no player.
+WIDE_RECORD = struct.Struct('<BBq')
+# Narrow logs start with the lowest player id less one; records hold offsets from it
+NARROW_HEADER = struct.Struct('<q')
+NARROW_RECORD = struct.Struct('<BBI')
+
+KINDS = (CHANCE, SHOT, GOAL, YELLOW, RED, SUBSTITUTION)
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+COMMENTARY = {
+    CHANCE: "{player} ({team}) drags a shot wide.",
+    SHOT: "{player} ({team}) forces a save.",
+    GOAL: "GOAL! {player} scores for {team}.",
+    YELLOW: "{player} ({team}) is booked.",
+    RED: "{player} ({team}) is sent off!",
+    SUBSTITUTION: "{player} comes on for {team}.",
+}
+
+
+def pack_events(events):
+    """Encode (minute, side, kind, player_id) events as one blob."""
+    events = list(events)
+    player_ids = [event[3] for event in events if event[3]]
+    base = min(player_ids, default=1) - 1
+    if max(player_ids, default=base) - base <= 0xFFFFFFFF:
+        records = bytearray([NARROW]) + NARROW_HEADER.pack(base)
+        for minute, side, kind, player_id in events:
+            records += NARROW_RECORD.pack(minute, KIND_CODES[kind] << 1 | side, player_id - base if player_id else 0)
+    else:
+        records = bytearray([WIDE])
+        for minute, side, kind, player_id in events:
+            records += WIDE_RECORD.pack(minute, KIND_CODES[kind] << 1 | side, player_id or 0)
+    return bytes(records)
+
+
+def iter_events(blob):
+    """Decode a blob lazily into MatchEvents; an empty or missing blob has no events."""
+    if not blob:
+        return
+    if blob[0] == NARROW:
+        base, = NARROW_HEADER.unpack_from(blob, 1)
+        for minute, code, offset in NARROW_RECORD.iter_unpack(blob[1 + NARROW_HEADER.size:]):
+            yield MatchEvent(minute, code & 1, KINDS[code >> 1], base + offset if offset else None)
+    elif blob[0] == WIDE:
+        for minute, code, player_id in WIDE_RECORD.iter_unpack(blob[1:]):
+            yield MatchEvent(minute, code & 1, KINDS[code >> 1], player_id or None)
+    else:
+        raise ValueError(f"Unknown event log format {blob[0]}")
+
+
+def unpack_events(blob):
+    return list(iter_events(blob))
+
+
+def events_digest(events):
+    """Return a CRC-32 of the packed events, kept per match to check replays."""
+    return zlib.crc32(pack_events(events))
+
+
+def describe(event, team_names, player_names):
+    """Return the commentary line for one event; see commentary()."""
+    player = player_names.get(event.player_id, "A player")
+    return f"{event.minute}' " + COMMENTARY[event.kind].format(player=player, team=team_names[event.side])
+
+
+def commentary(events, team_names, player_names):
+    """
+    Yield one line of commentary per event.
+
+    team_names is (home, away); player_names maps player ids to names.
+    """
+    for event in events:
+        yield describe(event, team_names, player_names)
@@ -0,0 +1,134 @@
+"""
+Minute-by-minute match engine.
+
+Each side gets one draw per minute that decides whether it creates a chance
+and whether that chance is missed, saved or scored. The per-minute goal
+probability is fixed before kick-off by goal_probabilities(), so the final
+score depends only on the two ratings and the random stream. Cards and
+substitutions are flavour and never change the scoring odds.
+"""
+import random
+from collections import namedtuple
+
+# Bump when the same seed and ratings can produce different events
+ENGINE_VERSION = 2
+
+MINUTES = 90
+HOME_GOALS = 1.45        # League-average goals for the home side
+AWAY_GOALS = 1.15        # League-average goals for the away side
+STRENGTH_EXPONENT = 1.5  # How sharply rating gaps turn into goal gaps
+CONVERSION = 0.3         # Share of chances that end up as goals
+ON_TARGET = 0.35         # Share of chances that are saved rather than missed
+YELLOWS_PER_MATCH = 1.8  # League-average bookings per side
+SUBSTITUTIONS = 3
+
+# Event kinds
+CHANCE = 'chance'
+SHOT = 'shot'
+GOAL = 'goal'
+YELLOW = 'yellow'
+RED = 'red'
+SUBSTITUTION = 'sub'
+
+MatchEvent = namedtuple('MatchEvent', ['minute', 'side', 'kind', 'player_id'])
+MatchResult = namedtuple('MatchResult', ['home_score', 'away_score', 'events'])
+
+
+def expected_goals(home, away):
+    """Return the (home, away) expected goals for two TeamRatings."""
+    return (
+        HOME_GOALS * (home.attack / away.defence) ** STRENGTH_EXPONENT,
+        AWAY_GOALS * (away.attack / home.defence) ** STRENGTH_EXPONENT,
+    )
+
+
+def goal_probabilities(home, away):
+    """Return the per-minute (home, away) probability of scoring."""
+    home_xg, away_xg = expected_goals(home, away)
+    # A side cannot convert more often than it creates chances
+    return min(home_xg / MINUTES, CONVERSION), min(away_xg / MINUTES, CONVERSION)
+
+
+def final_score(events):
+    """Return the (home, away) score from a match's events."""
+    scores = [0, 0]
+    for event in events:
+        if event.kind == GOAL:
+            scores[event.side] += 1
+    return tuple(scores)
+
+
+def _scorer_weights(ratings):
+    """Per-player scoring weights for the starters, from the cumulative ratings weights."""
+    cumulative = ratings.scorer_weights
+    return [weight - (cumulative[i - 1] if i else 0.0) for i, weight in enumerate(cumulative)]
+
+
+def _pick_scorer(rng, players, weights):
+    if not players:
+        return None
+    return rng.choices(players, weights=weights)[0]
+
+
+class MatchEngine:
+    """Simulates one match from two TeamRatings, with no database access."""
+
+    def simulate(self, home, away, seed=None, rng=None):
+        """
+        Play a match and return a MatchResult.
+
+        Pass seed, or a random.Random as rng, to make the match reproducible.
+        """
+        events = list(self.iter_events(home, away, seed=seed, rng=rng))
+        return MatchResult(*final_score(events), events)
+
+    def iter_events(self, home, away, seed=None, rng=None):
+        """
+        Play a match lazily, yielding each MatchEvent as soon as its minute is played.
+
+        The random stream is consumed exactly as simulate() does, so a fully
+        drained generator gives the same events for the same seed.
+        """
+        if rng is None:
+            rng = random.Random(seed)
+        goal_odds = goal_probabilities(home, away)
+        sides = (home, away)
+        # Thresholds on a single uniform draw: below goal -> goal, below saved -> shot, below chance -> miss
+        thresholds = []
+        for p_goal in goal_odds:
+            p_chance = p_goal / CONVERSION
+            thresholds.append((p_goal, p_goal + (p_chance - p_goal) * ON_TARGET, p_chance))
+        card_odds = [YELLOWS_PER_MATCH / MINUTES * ratings.card_rate for ratings in sides]
+        sub_minutes = [sorted(rng.sample(range(55, 86), SUBSTITUTIONS)) for _ in sides]
+
+        booked = (set(), set())
+        on_pitch = [list(ratings.starters) for ratings in sides]
+        # Scoring weights aligned with on_pitch; a substitute takes over the weight of the player replaced
+        weights = [_scorer_weights(ratings) for ratings in sides]
+        bench = [list(ratings.bench) for ratings in sides]
+        random_draw = rng.random
+        for minute in range(1, MINUTES + 1):
+            for side in (0, 1):
+                p_goal, p_saved, p_chance = thresholds[side]
+                draw = random_draw()
+                if draw < p_chance:
+                    if draw < p_goal:
+                        yield MatchEvent(minute, side, GOAL, _pick_scorer(rng, on_pitch[side], weights[side]))
+                    else:
+                        kind = SHOT if draw < p_saved else CHANCE
+                        yield MatchEvent(minute, side, kind, _pick_scorer(rng, on_pitch[side], weights[side]))
+                if random_draw() < card_odds[side] and on_pitch[side]:
+                    player_id = rng.choice(on_pitch[side])
+                    if player_id in booked[side]:
+                        yield MatchEvent(minute, side, RED, player_id)
+                        index = on_pitch[side].index(player_id)
+                        del on_pitch[side][index]
+                        del weights[side][index]
+                    else:
+                        booked[side].add(player_id)
+                        yield MatchEvent(minute, side, YELLOW, player_id)
+                if minute in sub_minutes[side] and bench[side] and on_pitch[side]:
+                    player_off = rng.choice(on_pitch[side])
+                    player_on = bench[side].pop(0)
+                    on_pitch[side][on_pitch[side].index(player_off)] = player_on
+                    yield MatchEvent(minute, side, SUBSTITUTION, player_on)
@@ -0,0 +1,100 @@
+"""
+Parallel full-engine simulation over a process pool.
+
+Workers receive only picklable snapshots (TeamRatings and per-match seeds) and
+return plain result tuples, so no database handle ever crosses a process
+boundary. Every match is seeded from (save seed, match id), which makes the
+results identical whatever the number of workers or how fixtures are chunked.
+
+Starting worker processes costs more than simulating a small batch, so a
+SimulationPool is created once, e.g. per season, and reused by every call;
+batches too small to split run in this process.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from engine.match_engine import MatchEngine
+
+CHUNKS_PER_WORKER = 4
+# Fewer fixtures than this per chunk cost more to ship to a worker than to play here
+MIN_FIXTURES_PER_CHUNK = 25
+
+
+def match_seed(save_seed, match_id):
+    """Derive a match's engine seed from the save's seed and the match id."""
+    return (save_seed << 64) | match_id
+
+
+def _simulate_chunk(chunk):
+    """Worker entry point: play every fixture in a chunk."""
+    ratings, fixtures = chunk
+    engine = MatchEngine()
+    results = []
+    for match_id, seed, home_id, away_id in fixtures:
+        result = engine.simulate(ratings[home_id], ratings[away_id], seed=seed)
+        results.append((match_id, result.home_score, result.away_score, result.events))
+    return results
+
+
+class SimulationPool:
+    """
+    A process pool shared by many simulate_fixtures calls.
+
+    Workers start on the first batch large enough to need them and stop on
+    close() or when the with block exits.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    def map(self, fn, iterable):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor.map(fn, iterable)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _chunks(fixtures, ratings, count):
+    size = max(1, -(-len(fixtures) // count))
+    for start in range(0, len(fixtures), size):
+        part = fixtures[start:start + size]
+        # Ship only the ratings this chunk needs
+        team_ids = {team_id for fixture in part for team_id in fixture[2:]}
+        yield {team_id: ratings[team_id] for team_id in team_ids}, part
+
+
+def simulate_fixtures(fixtures, ratings, workers=None, pool=None):
+    """
+    Simulate fixtures and return (match_id, home_score, away_score, events) in input order.
+
+    fixtures is a sequence of (match_id, seed, home_team_id, away_team_id) and
+    ratings maps team ids to TeamRatings. Fixtures are split across pool, a
+    SimulationPool, or a pool of workers processes created for this call,
+    defaulting to one per CPU. workers=1, or a batch too small to split, runs
+    in this process.
+    """
+    fixtures = list(fixtures)
+    if pool is not None:
+        workers = pool.workers
+    elif workers is None:
+        workers = os.cpu_count() or 1
+    chunks = min(workers * CHUNKS_PER_WORKER, len(fixtures) // MIN_FIXTURES_PER_CHUNK)
+    if workers <= 1 or chunks < 2:
+        return _simulate_chunk((ratings, fixtures))
+    if pool is None:
+        with SimulationPool(workers) as pool:
+            return simulate_fixtures(fixtures, ratings, pool=pool)
+    results = []
+    for chunk_results in pool.map(_simulate_chunk, _chunks(fixtures, ratings, chunks)):
+        results.extend(chunk_results)
+    return results
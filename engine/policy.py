@@ -0,0 +1,24 @@
+"""Choice between the full event engine and quick statistical scoring, per fixture."""
+
+FULL = 'full'
+QUICK = 'quick'
+
+
+class SimulationPolicy:
+    """
+    Decides how each fixture is simulated.
+
+    Fixtures involving the managed club, or any team in full_team_ids, get the
+    full event engine so they can be watched and replayed; everything else is
+    quick-simmed from the two teams' expected goals.
+    """
+
+    def __init__(self, managed_team_id=None, full_team_ids=()):
+        self.full_team_ids = set(full_team_ids)
+        if managed_team_id is not None:
+            self.full_team_ids.add(managed_team_id)
+
+    def mode_for(self, home_team_id, away_team_id):
+        if home_team_id in self.full_team_ids or away_team_id in self.full_team_ids:
+            return FULL
+        return QUICK
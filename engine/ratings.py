@@ -0,0 +1,102 @@
+"""
+Per-team ratings computed once before kick-off.
+
+The engine never looks at individual players while a match is running; it only
+reads the numbers precomputed here from the squad, formation and tactics.
+"""
+from collections import namedtuple
+
+# (attack, defence) contribution of each position
+POSITION_WEIGHTS = {
+    'Goalkeeper': (0.0, 1.0),
+    'Defender': (0.1, 0.9),
+    'Midfielder': (0.5, 0.5),
+    'Winger': (0.8, 0.2),
+    'Forward': (1.0, 0.1),
+}
+NEUTRAL_WEIGHTS = (0.5, 0.5)
+
+# (attack, defence, cards) multipliers
+TACTIC_MODIFIERS = {
+    'Attacking': (1.08, 0.95, 1.1),
+    'Offensive': (1.08, 0.95, 1.1),
+    'Aggressive': (1.05, 0.98, 1.4),
+    'Balanced': (1.0, 1.0, 1.0),
+    'Defensive': (0.92, 1.08, 0.9),
+}
+
+STARTERS = 11
+DEFAULT_RATING = 50.0
+# Bump when rate_team changes so stored ratings are recomputed
+RATINGS_VERSION = 1
+
+TeamRatings = namedtuple('TeamRatings', [
+    'attack',          # Effective attacking strength, around 50 for an average side
+    'defence',         # Effective defensive strength
+    'card_rate',       # Multiplier on the league-average booking rate
+    'starters',        # Player ids of the starting eleven
+    'scorer_weights',  # Cumulative scoring weights, aligned with starters
+    'bench',           # Player ids available as substitutes
+])
+
+
+def effective_skill(skills, morale):
+    """Skill adjusted for morale: 50 morale is neutral, 100 adds 15%, 0 takes 15% off."""
+    return skills * (0.85 + 0.3 * morale / 100)
+
+
+def _formation_modifiers(formation):
+    try:
+        defenders, midfielders, forwards = (int(part) for part in formation.split('-'))
+    except (AttributeError, ValueError):
+        return 1.0, 1.0
+    attack = 1 + 0.04 * (forwards - 2) + 0.01 * (midfielders - 4)
+    defence = 1 + 0.04 * (defenders - 4) + 0.01 * (midfielders - 4)
+    return attack, defence
+
+
+def rate_team(players, formation='4-4-2', tactics='Balanced'):
+    """
+    Build TeamRatings from a squad.
+
+    players is a sequence of (player_id, position, skills, morale). The best
+    eleven by effective skill start; the rest form the bench. A team without
+    players is rated as an average side.
+    """
+    ranked = sorted(
+        ((effective_skill(skills or 0, morale if morale is not None else 50), player_id, position)
+         for player_id, position, skills, morale in players),
+        reverse=True
+    )
+    starters = ranked[:STARTERS]
+    bench = tuple(player_id for _, player_id, _ in ranked[STARTERS:])
+
+    attack = defence = DEFAULT_RATING
+    cumulative = []
+    if starters:
+        attack_total = attack_weight = defence_total = defence_weight = 0.0
+        running = 0.0
+        for skill, _, position in starters:
+            attack_share, defence_share = POSITION_WEIGHTS.get(position, NEUTRAL_WEIGHTS)
+            attack_total += attack_share * skill
+            attack_weight += attack_share
+            defence_total += defence_share * skill
+            defence_weight += defence_share
+            # Goalkeepers can still score, just very rarely
+            running += attack_share + 0.02
+            cumulative.append(running)
+        if attack_weight:
+            attack = attack_total / attack_weight
+        if defence_weight:
+            defence = defence_total / defence_weight
+
+    formation_attack, formation_defence = _formation_modifiers(formation)
+    tactic_attack, tactic_defence, tactic_cards = TACTIC_MODIFIERS.get(tactics, TACTIC_MODIFIERS['Balanced'])
+    return TeamRatings(
+        attack=attack * formation_attack * tactic_attack,
+        defence=defence * formation_defence * tactic_defence,
+        card_rate=tactic_cards,
+        starters=tuple(player_id for _, player_id, _ in starters),
+        scorer_weights=tuple(cumulative),
+        bench=bench,
+    )
@@ -0,0 +1,58 @@
+"""
+Regenerate a match's event stream instead of storing it.
+
+A fully simulated match is reproducible from the engine version, its seed and
+the two TeamRatings it was played with. Ratings are stored once per distinct
+snapshot and found by digest, so a match only keeps small references to them
+and a checksum of its event log. replay() refuses to run on a different engine
+version and raises if the regenerated events do not match the checksum.
+"""
+import hashlib
+import json
+from engine.event_log import events_digest
+from engine.match_engine import ENGINE_VERSION, MatchEngine
+from engine.ratings import TeamRatings
+
+
+class ReplayError(Exception):
+    """A stored match cannot be reproduced by this engine."""
+
+
+def encode_snapshot(ratings):
+    """Serialise TeamRatings canonically; floats round-trip exactly through repr."""
+    return json.dumps(list(ratings), separators=(',', ':')).encode()
+
+
+def decode_snapshot(blob):
+    attack, defence, card_rate, starters, scorer_weights, bench = json.loads(blob)
+    return TeamRatings(attack, defence, card_rate, tuple(starters), tuple(scorer_weights), tuple(bench))
+
+
+def snapshot_digest(blob):
+    """Return the 8-byte content digest of an encoded snapshot."""
+    return hashlib.blake2b(blob, digest_size=8).digest()
+
+
+def load_snapshot(blob, digest):
+    """Decode a stored snapshot after checking it still matches its digest."""
+    if snapshot_digest(blob) != digest:
+        raise ReplayError("Team snapshot does not match its digest")
+    return decode_snapshot(blob)
+
+
+def replay(home, away, seed, engine_version, expected_digest=None, expected_score=None):
+    """
+    Re-run a match and return its MatchResult.
+
+    expected_digest is the events_digest and expected_score the (home, away)
+    score recorded when the match was first played; a mismatch means replay
+    is not deterministic for these inputs and raises ReplayError.
+    """
+    if engine_version != ENGINE_VERSION:
+        raise ReplayError(f"Match was played on engine version {engine_version}, this is {ENGINE_VERSION}")
+    result = MatchEngine().simulate(home, away, seed=seed)
+    if expected_score is not None and (result.home_score, result.away_score) != tuple(expected_score):
+        raise ReplayError(f"Replay scored {result.home_score}-{result.away_score}, expected {expected_score}")
+    if expected_digest is not None and events_digest(result.events) != expected_digest:
+        raise ReplayError("Replayed events differ from the recorded match")
+    return result
@@ -0,0 +1,83 @@
+import unittest
+import os
+import threading
+import time
+from database.db_manager import DatabaseManager
+from database.async_db import AsyncDatabase
+
+class TestAsyncDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Use a separate test database
+        cls.test_db_path = 'savegames/test_game.db'
+        # Ensure the test database does not already exist
+        if os.path.exists(cls.test_db_path):
+            os.remove(cls.test_db_path)
+        cls.db_manager = DatabaseManager(db_path=cls.test_db_path)
+        cls.db_manager.add_team(name="Async Albion", formation="4-4-2", tactics="Balanced")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db_manager.close()
+        # Remove the test database after tests
+        if os.path.exists(cls.test_db_path):
+            os.remove(cls.test_db_path)
+
+    def setUp(self):
+        self.async_db = AsyncDatabase(self.db_manager)
+
+    def tearDown(self):
+        self.async_db.close()
+
+    def pump_until(self, condition, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            self.async_db.pump()
+            time.sleep(0.001)
+
+    def test_latest_returns_default_until_query_completes(self):
+        teams = self.async_db.latest('teams', self.db_manager.get_all_teams, default=[])
+        self.assertEqual(teams, [], "No result should be available before the first pump.")
+        self.pump_until(lambda: not self.async_db.is_loading('teams'))
+        teams = self.async_db.latest('teams', self.db_manager.get_all_teams, default=[])
+        self.assertEqual([team['name'] for team in teams], ["Async Albion"])
+
+    def test_slow_query_does_not_block_frame(self):
+        release = threading.Event()
+
+        def slow_query():
+            release.wait(5)
+            return "done"
+
+        start = time.monotonic()
+        self.assertIsNone(self.async_db.latest('slow', slow_query))
+        self.async_db.pump()
+        self.assertLess(time.monotonic() - start, 0.5, "Frame should not wait for the query.")
+        self.assertTrue(self.async_db.is_loading('slow'))
+
+        release.set()
+        self.pump_until(lambda: not self.async_db.is_loading('slow'))
+        self.assertEqual(self.async_db.latest('slow', slow_query), "done")
+
+    def test_await_call(self):
+        task = self.async_db.submit(self.db_manager.get_settings)
+        self.pump_until(task.done)
+        self.assertEqual(task.result()['difficulty'], 'Easy')
+
+    def test_invalidate_triggers_refresh(self):
+        calls = []
+
+        def counting_query():
+            calls.append(1)
+            return len(calls)
+
+        self.async_db.latest('count', counting_query, max_age=60)
+        self.pump_until(lambda: not self.async_db.is_loading('count'))
+        self.assertEqual(self.async_db.latest('count', counting_query, max_age=60), 1)
+        self.async_db.invalidate('count')
+        self.async_db.latest('count', counting_query, max_age=60)
+        self.pump_until(lambda: not self.async_db.is_loading('count'))
+        self.assertEqual(self.async_db.latest('count', counting_query, max_age=60), 2)
+
+if __name__ == '__main__':
+    unittest.main()
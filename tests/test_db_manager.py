@@ -1,7 +1,13 @@
 import unittest
 import os
-from database.db_manager import DatabaseManager
+import shutil
+import sqlite3
+import threading
+from database.db_manager import DatabaseManager, get_database_manager
+from database.migrations import CURRENT_SCHEMA_VERSION, migrate
+from database.sharding import SHARD_ID_SPAN, open_shard
 from models.player import Player
+from tools.build_template import build_template
 from models.team import Team
 
 class TestDatabaseManager(unittest.TestCase):
@@ -160,5 +166,571 @@ class TestDatabaseManager(unittest.TestCase):
         association = cursor.fetchone()
         self.assertIsNone(association, "Player should be removed from the team.")
 
+    def test_transaction_commits_once(self):
+        # Writes inside a transaction are only visible to other connections after it closes
+        with self.db_manager.transaction():
+            player_id = self.db_manager.add_player(
+                name="Chris Green",
+                position="Defender",
+                skills=71,
+                morale=77,
+                contract_end=2025
+            )
+            self.assertTrue(self.db_manager.in_transaction())
+            self.assertTrue(self.db_manager.conn.in_transaction, "Write should not be committed yet.")
+        self.assertFalse(self.db_manager.in_transaction())
+        self.assertFalse(self.db_manager.conn.in_transaction)
+        self.assertIsNotNone(self.db_manager.get_player_by_id(player_id))
+
+    def test_transaction_rolls_back_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.transaction():
+                player_id = self.db_manager.add_player(
+                    name="Rolled Back",
+                    position="Forward",
+                    skills=60,
+                    morale=60,
+                    contract_end=2025
+                )
+                raise RuntimeError("abort")
+        self.assertIsNone(self.db_manager.get_player_by_id(player_id))
+
+    def test_failed_write_rolls_back_transaction(self):
+        team_id = self.db_manager.add_team(name="Owners FC", formation="4-4-2", tactics="Balanced")
+        player_id = self.db_manager.add_player(name="Owned Player", position="Forward", skills=70, morale=70, contract_end=2026)
+        self.db_manager.add_finance(team_id, budget=1000)
+        self.db_manager.add_player_to_team(team_id, player_id)
+        # Adding the same player again breaks the UNIQUE key and must undo the budget change
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.db_manager.transaction():
+                self.db_manager.update_finance_budget(team_id, 800)
+                self.db_manager.add_player_to_team(team_id, player_id)
+        self.assertEqual(self.db_manager.get_finance_by_team_id(team_id)['budget'], 1000)
+
+    def test_nested_transaction_uses_savepoint(self):
+        with self.db_manager.transaction():
+            outer_id = self.db_manager.add_player(
+                name="Outer Player",
+                position="Midfielder",
+                skills=65,
+                morale=70,
+                contract_end=2025
+            )
+            with self.assertRaises(RuntimeError):
+                with self.db_manager.transaction():
+                    inner_id = self.db_manager.add_player(
+                        name="Inner Player",
+                        position="Midfielder",
+                        skills=65,
+                        morale=70,
+                        contract_end=2025
+                    )
+                    raise RuntimeError("abort inner")
+        # Only the inner block should have been undone
+        self.assertIsNotNone(self.db_manager.get_player_by_id(outer_id))
+        self.assertIsNone(self.db_manager.get_player_by_id(inner_id))
+
+    def test_bulk_world_creation(self):
+        team_ids = self.db_manager.add_teams_many([
+            ("Bulk United", "4-4-2", "Balanced", "England", 1),
+            ("Bulk City", "4-3-3", "Offensive", "England", 1),
+        ])
+        self.assertEqual(len(team_ids), 2)
+        self.assertEqual(self.db_manager.get_team_by_id(team_ids[1])['name'], "Bulk City")
+
+        player_ids = self.db_manager.add_players_many(
+            (f"Bulk Player {i}", "Midfielder", 60 + i, 70, 2026) for i in range(25)
+        )
+        self.assertEqual(len(player_ids), 25)
+        self.assertEqual(self.db_manager.get_player_by_id(player_ids[-1])['skills'], 84)
+
+        assigned = self.db_manager.assign_players_many((team_ids[0], player_id) for player_id in player_ids)
+        self.assertEqual(assigned, 25)
+        self.assertEqual(self.db_manager.get_team_of_player(player_ids[0]), team_ids[0])
+
+        match_ids = self.db_manager.add_matches_many([
+            (team_ids[0], team_ids[1], "2024-08-10"),
+            (team_ids[1], team_ids[0], "2024-08-17"),
+        ])
+        self.assertEqual(len(match_ids), 2)
+        self.db_manager.update_match_scores_many([(match_ids[0], 2, 1), (match_ids[1], 0, 0)])
+        match = self.db_manager.get_match_by_id(match_ids[0])
+        self.assertEqual((match['home_score'], match['away_score']), (2, 1))
+
+    def test_schema_is_versioned(self):
+        self.assertEqual(self.db_manager.get_schema_version(), CURRENT_SCHEMA_VERSION)
+        # Re-running the migrations on a current schema is a no-op
+        self.db_manager.setup_tables()
+        cursor = self.db_manager.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM schema_version")
+        self.assertEqual(cursor.fetchone()[0], CURRENT_SCHEMA_VERSION)
+
+    def test_deleting_team_cascades(self):
+        team_id = self.db_manager.add_team(name="Cascade City", formation="4-4-2", tactics="Balanced")
+        other_id = self.db_manager.add_team(name="Cascade Rovers", formation="4-4-2", tactics="Balanced")
+        player_id = self.db_manager.add_player(
+            name="Cascade Player", position="Defender", skills=60, morale=60, contract_end=2025
+        )
+        self.db_manager.add_player_to_team(team_id, player_id)
+        self.db_manager.add_finance(team_id, 1000000, 0, 0)
+        match_id = self.db_manager.add_match(team_id, other_id, "2024-08-10")
+
+        self.db_manager.conn.execute("DELETE FROM teams WHERE id = ?", (team_id,))
+        self.db_manager.conn.commit()
+        self.assertIsNone(self.db_manager.get_team_of_player(player_id))
+        self.assertIsNone(self.db_manager.get_match_by_id(match_id))
+        self.assertIsNone(self.db_manager.get_finance_by_team_id(team_id))
+        self.assertIsNotNone(self.db_manager.get_player_by_id(player_id), "Players outlive their team.")
+
+    def test_upgrade_removes_orphans(self):
+        path = 'savegames/test_upgrade.db'
+        if os.path.exists(path):
+            os.remove(path)
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE teams (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, formation TEXT, tactics TEXT);
+            CREATE TABLE finances (id INTEGER PRIMARY KEY AUTOINCREMENT, team_id INTEGER, budget INTEGER,
+                                   revenue INTEGER, expenses INTEGER, FOREIGN KEY (team_id) REFERENCES teams (id));
+            INSERT INTO teams (id, name) VALUES (1, 'Survivors');
+            INSERT INTO finances (team_id, budget, revenue, expenses) VALUES (1, 100, 0, 0), (99, 100, 0, 0);
+        """)
+        conn.close()
+        db_manager = DatabaseManager(db_path=path, read_connections=0)
+        try:
+            self.assertEqual(db_manager.get_schema_version(), CURRENT_SCHEMA_VERSION)
+            rows = db_manager.conn.execute("SELECT team_id FROM finances").fetchall()
+            self.assertEqual([row[0] for row in rows], [1], "Finances of deleted teams should be dropped.")
+            self.assertEqual(db_manager.conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        finally:
+            db_manager.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_reset_world_and_compact(self):
+        path = 'savegames/test_reset.db'
+        db_manager = DatabaseManager(db_path=path)
+        try:
+            team_ids = db_manager.add_teams_many(
+                (f"Reset Team {i}", "4-4-2", "Balanced", "England", 1) for i in range(200)
+            )
+            player_ids = db_manager.add_players_many(
+                (f"Reset Player {i}", "Forward", 50, 50, 2025) for i in range(2000)
+            )
+            db_manager.assign_players_many(zip(team_ids * 10, player_ids))
+            db_manager.set_setting('difficulty', 'Hard')
+
+            db_manager.reset_world()
+            for table in ('teams', 'players', 'team_players', 'matches', 'finances'):
+                count = db_manager.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                self.assertEqual(count, 0, f"{table} should be empty after a reset.")
+            self.assertEqual(db_manager.get_settings()['difficulty'], 'Hard', "Settings survive a reset.")
+            self.assertEqual(db_manager.add_team(name="Fresh", formation="4-4-2", tactics="Balanced"), 1)
+
+            self.assertGreater(db_manager.compact(), 0, "Deleted rows should leave pages to reclaim.")
+            self.assertEqual(db_manager.conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        finally:
+            db_manager.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_new_game_from_template(self):
+        template_path = 'savegames/test_template.db'
+        build_template(template_path)
+        template = sqlite3.connect(template_path)
+        template_seed = template.execute("SELECT save_seed FROM settings").fetchone()[0]
+        template.close()
+        for in_memory in (False, True):
+            path = 'savegames/test_new_game.db'
+            db_manager = DatabaseManager(db_path=path, in_memory=in_memory)
+            try:
+                db_manager.set_setting('difficulty', 'Hard')
+                db_manager.add_player(name="Old Save", position="Goalkeeper", skills=50, morale=50, contract_end=2024)
+
+                self.assertTrue(db_manager.new_game_from_template(template_path))
+                self.assertEqual(len(db_manager.get_english_teams()), 92)
+                self.assertEqual(len(db_manager.get_teams_by_division(4)), 24)
+                self.assertEqual(db_manager.get_all_players(), [], "The previous world should be gone.")
+                self.assertEqual(db_manager.get_settings()['difficulty'], 'Hard', "Settings survive a new game.")
+                self.assertNotEqual(db_manager.get_save_seed(), template_seed, "Each new game needs its own seed.")
+                self.assertEqual(db_manager.get_performance_profile()['journal_mode'], 'memory' if in_memory else 'wal')
+            finally:
+                db_manager.close()
+                for suffix in ('', '-wal', '-shm'):
+                    if os.path.exists(path + suffix):
+                        os.remove(path + suffix)
+        os.remove(template_path)
+
+    def test_league_packs_load_lazily(self):
+        self.assertIn('Scotland', self.db_manager.get_available_countries())
+        self.assertNotIn('Scotland', self.db_manager.get_loaded_countries())
+
+        premiership = self.db_manager.get_teams_by_division(1, country='Scotland')
+        self.assertEqual(len(premiership), 12, "Opening a country should import its pack.")
+        self.assertEqual(self.db_manager.get_loaded_countries()['Scotland'], 'quick')
+        teams = {team['name']: team for team in self.db_manager.get_teams_by_country('Scotland')}
+        self.assertEqual(len(teams), 22, "The pack should only be imported once.")
+        self.assertEqual(teams['Celtic']['reputation'], 74)
+        self.assertEqual(teams['Falkirk']['division'], 2)
+
+        self.assertTrue(self.db_manager.activate_country('Scotland'))
+        self.assertEqual(self.db_manager.get_country_simulation('Scotland'), 'full')
+        self.assertEqual(self.db_manager.get_teams_by_country('Atlantis'), [], "Missing packs load nothing.")
+
+    def test_shard_country(self):
+        path = 'savegames/test_shards.db'
+        db_manager = DatabaseManager(db_path=path)
+        try:
+            scottish = db_manager.get_teams_by_country('Scotland')
+            celtic, rangers = scottish[0]['id'], scottish[1]['id']
+            player_id = db_manager.add_player(name="Shard Player", position="Forward", skills=70, morale=70, contract_end=2026)
+            db_manager.add_player_to_team(celtic, player_id)
+            match_id = db_manager.add_match(celtic, rangers, "2024-08-03")
+
+            self.assertTrue(db_manager.shard_country('Scotland'))
+            shard_path = db_manager.get_sharded_countries()['Scotland']
+            self.assertTrue(os.path.exists(shard_path))
+            main_count = db_manager.conn.execute("SELECT COUNT(*) FROM main.teams WHERE country = 'Scotland'").fetchone()[0]
+            self.assertEqual(main_count, 0, "Sharded clubs should leave the main file.")
+
+            # Reads go through the union views, from this thread and from pooled readers
+            self.assertEqual(len(db_manager.get_teams_by_country('Scotland')), 22)
+            self.assertEqual(db_manager.get_team_of_player(player_id), celtic)
+            self.assertEqual(db_manager.get_match_by_id(match_id)['home_team_id'], celtic)
+            results = []
+            worker = threading.Thread(target=lambda: results.append(db_manager.get_all_teams()))
+            worker.start()
+            worker.join()
+            self.assertEqual(len(results[0]), 22)
+            with db_manager.transaction():
+                self.assertEqual(db_manager.get_team_by_id(rangers)['name'], "Rangers")
+
+            # Writes to the country's rows land in the shard and read back
+            db_manager.update_team_formation(celtic, '3-5-2')
+            db_manager.update_player_skills(player_id, 81)
+            self.assertTrue(db_manager.save_match_result(match_id, 2, 1))
+            fixture_id, = db_manager.add_matches_many([(rangers, celtic, "2024-08-17")])
+            db_manager.identity_map.clear()
+            self.assertEqual(db_manager.get_team_by_id(celtic)['formation'], '3-5-2')
+            self.assertEqual(db_manager.get_player_by_id(player_id)['skills'], 81)
+            self.assertEqual(db_manager.get_match_by_id(match_id)['home_score'], 2)
+            self.assertEqual(db_manager.get_match_by_id(fixture_id)['home_team_id'], rangers)
+            main_matches = db_manager.conn.execute("SELECT COUNT(*) FROM main.matches").fetchone()[0]
+            self.assertEqual(main_matches, 0)
+
+            # Another process would write the shard directly, with ids from the shard's own block
+            shard = open_shard(shard_path)
+            try:
+                cursor = shard.execute(
+                    "INSERT INTO matches (home_team_id, away_team_id, date) VALUES (?, ?, '2024-08-10')", (rangers, celtic)
+                )
+                shard.commit()
+                new_match_id = cursor.lastrowid
+            finally:
+                shard.close()
+            self.assertGreaterEqual(new_match_id, SHARD_ID_SPAN)
+            self.assertIn(new_match_id, [match['id'] for match in db_manager.get_all_matches()])
+
+            # Signing takes the player's row into the club's file, in either direction
+            english = db_manager.get_teams_by_country('England')[0]['id']
+            free_agent = db_manager.add_player(name="Free Agent", position="Midfielder", skills=60, morale=60, contract_end=2026)
+            db_manager.add_player_to_team(celtic, free_agent)
+            self.assertEqual(db_manager.get_team_of_player(free_agent), celtic)
+            db_manager.remove_player_from_team(celtic, free_agent)
+            db_manager.assign_players_many([(english, free_agent)])
+            self.assertEqual(db_manager.get_team_of_player(free_agent), english)
+            self.assertEqual(db_manager.get_player_by_id(free_agent)['name'], "Free Agent")
+            next_id = db_manager.add_player(name="Main Player", position="Defender", skills=50, morale=50, contract_end=2026)
+            self.assertLess(next_id, SHARD_ID_SPAN, "Moved players should not advance main's id counter.")
+
+            # Archiving reads and clears the shard's played matches too
+            self.assertEqual(db_manager.archive_season("2024/25")['matches'], 1)
+            self.assertIn(celtic, [row['team_id'] for row in db_manager.get_season_standings("2024/25")])
+            self.assertEqual(db_manager.get_match_by_id(match_id), None)
+            self.assertEqual(len(db_manager.get_team_match_history(celtic)), 3)
+        finally:
+            db_manager.close()
+        reopened = DatabaseManager(db_path=path)
+        try:
+            self.assertEqual(list(reopened.get_sharded_countries()), ['Scotland'])
+            self.assertEqual(len(reopened.get_teams_by_division(1, country='Scotland')), 12)
+        finally:
+            reopened.close()
+            shutil.rmtree('savegames/test_shards_shards', ignore_errors=True)
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_archive_season(self):
+        path = 'savegames/test_archive.db'
+        db_manager = DatabaseManager(db_path=path)
+        try:
+            home, away, third = db_manager.add_teams_many(
+                (name, "4-4-2", "Balanced", "England", 1) for name in ("Archive A", "Archive B", "Archive C")
+            )
+            db_manager.add_finance(home, 500000, 0, 0)
+            db_manager.update_finance_revenue(home, 1000)
+            played = db_manager.add_matches_many([
+                (home, away, "2024-05-01"), (away, third, "2024-05-08"), (third, home, "2024-05-15")
+            ])
+            db_manager.update_match_scores_many([(played[0], 2, 0), (played[1], 1, 1), (played[2], 0, 3)])
+            second_home, second_away = db_manager.add_teams_many(
+                (name, "4-4-2", "Balanced", "England", 2) for name in ("Archive D", "Archive E")
+            )
+            second_match = db_manager.add_match(second_home, second_away, "2024-05-01")
+            db_manager.update_match_score(second_match, 1, 0)
+            fixture = db_manager.add_match(home, away, "2024-08-17")
+            self.assertEqual(db_manager.get_standings()[0]['team_id'], home)
+
+            summary = db_manager.archive_season("2023/24", end_date="2024-06-30")
+            self.assertEqual(summary, {'matches': 4, 'teams': 5, 'finances': 1})
+            self.assertEqual([m['id'] for m in db_manager.get_all_matches()], [fixture],
+                             "Only the next season's fixture should stay in the hot table.")
+            table = db_manager.get_season_standings("2023/24", country="England", division=1)
+            self.assertEqual([(row['name'], row['points']) for row in table],
+                             [("Archive A", 6), ("Archive B", 1), ("Archive C", 1)])
+            tables = db_manager.get_season_standings("2023/24")
+            self.assertEqual([(row['division'], row['name']) for row in tables],
+                             [(1, "Archive A"), (1, "Archive B"), (1, "Archive C"), (2, "Archive D"), (2, "Archive E")],
+                             "Divisions should be kept apart rather than merged into one table.")
+            self.assertEqual(db_manager.get_finance_history(home)[0]['revenue'], 1000)
+            self.assertEqual(db_manager.get_finance_by_team_id(home)['revenue'], 0)
+            self.assertEqual(len(db_manager.get_team_match_history(home)), 3)
+            self.assertEqual(db_manager.get_archived_seasons(), ["2023/24"])
+            self.assertIsNone(db_manager.archive_season("2023/24"), "A season can only be archived once.")
+        finally:
+            db_manager.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_lookups_use_secondary_indexes(self):
+        cursor = self.db_manager.conn.cursor()
+        queries = {
+            "idx_team_players_player": "SELECT team_id FROM team_players WHERE player_id = 1",
+            "idx_finances_team": "SELECT * FROM finances WHERE team_id = 1",
+            "idx_teams_country_division": "SELECT * FROM teams WHERE country = 'England' AND division = 1",
+            "idx_matches_home_date": "SELECT * FROM matches WHERE home_team_id = 1 ORDER BY date",
+        }
+        for index_name, query in queries.items():
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+            plan = " ".join(row[3] for row in cursor.fetchall())
+            self.assertIn(index_name, plan, f"Query should use {index_name}: {plan}")
+
+    def test_performance_profile(self):
+        self.assertTrue(self.db_manager.set_setting('performance_profile', 'fast-sim'))
+        profile = self.db_manager.get_performance_profile()
+        self.assertEqual(profile['name'], 'fast-sim')
+        self.assertEqual(profile['journal_mode'], 'wal')
+        self.assertEqual(profile['synchronous'], 0)
+        self.assertEqual(self.db_manager.get_settings()['performance_profile'], 'fast-sim')
+
+        self.assertFalse(self.db_manager.apply_performance_profile('turbo'), "Unknown profiles should be rejected.")
+        self.assertTrue(self.db_manager.set_setting('performance_profile', 'balanced'))
+        self.assertEqual(self.db_manager.get_performance_profile()['synchronous'], 1)
+
+    def test_in_memory_mode_snapshots_to_disk(self):
+        def player_on_disk(player_id):
+            # Read straight from the file, bypassing this manager's identity map
+            cursor = self.db_manager.conn.cursor()
+            cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
+            return cursor.fetchone()
+
+        memory_db = DatabaseManager(db_path=self.test_db_path, in_memory=True)
+        try:
+            player_id = memory_db.add_player(
+                name="Memory Man",
+                position="Forward",
+                skills=79,
+                morale=81,
+                contract_end=2027
+            )
+            # The on-disk save does not see the write until the snapshot is taken
+            self.assertIsNone(player_on_disk(player_id))
+            self.assertTrue(memory_db.save())
+            self.assertEqual(player_on_disk(player_id)['name'], "Memory Man")
+
+            memory_db.update_player_skills(player_id, 90)
+            memory_db.autosave_interval = 0
+            self.assertTrue(memory_db.maybe_autosave())
+            self.assertEqual(player_on_disk(player_id)['skills'], 90)
+
+            memory_db.update_player_morale(player_id, 50)
+        finally:
+            # Closing flushes the final state
+            memory_db.close()
+        self.assertEqual(player_on_disk(player_id)['morale'], 50)
+
+    def test_identity_map_caches_lookups(self):
+        team_id = self.db_manager.add_team(name="Cache Rovers", formation="4-4-2", tactics="Balanced")
+        stats_before = self.db_manager.get_cache_stats()
+        first = self.db_manager.get_team_by_id(team_id)
+        second = self.db_manager.get_team_by_id(team_id)
+        self.assertIs(first, second, "Repeated lookups should return the same object.")
+        stats_after = self.db_manager.get_cache_stats()
+        self.assertEqual(stats_after['misses'] - stats_before['misses'], 1)
+        self.assertEqual(stats_after['hits'] - stats_before['hits'], 1)
+
+        # Writes keep the cached object current
+        self.db_manager.update_team_formation(team_id, "3-5-2")
+        self.assertEqual(first['formation'], "3-5-2")
+
+        # A rolled back transaction drops the cache so stale values are never served
+        with self.assertRaises(RuntimeError):
+            with self.db_manager.transaction():
+                self.db_manager.update_team_tactics(team_id, "Offensive")
+                raise RuntimeError("abort")
+        self.assertEqual(self.db_manager.get_team_by_id(team_id)['tactics'], "Balanced")
+
+    def test_identity_map_is_bounded(self):
+        small_db = DatabaseManager(db_path=self.test_db_path, cache_size=2)
+        try:
+            player_ids = small_db.add_players_many(
+                (f"LRU Player {i}", "Defender", 60, 60, 2025) for i in range(3)
+            )
+            for player_id in player_ids:
+                small_db.get_player_by_id(player_id)
+            self.assertEqual(small_db.get_cache_stats()['size'], 2)
+            # The least recently used entry was evicted
+            small_db.get_player_by_id(player_ids[0])
+            self.assertEqual(small_db.get_cache_stats()['misses'], 4)
+        finally:
+            small_db.close()
+
+    def test_reads_racing_a_commit_are_not_cached(self):
+        player_id = self.db_manager.add_player(name="Racing Player", position="Forward", skills=60, morale=60, contract_end=2026)
+        self.db_manager.identity_map.clear()
+        with self.db_manager.transaction():
+            self.db_manager.update_player_skills(player_id, 90)
+            results = []
+            worker = threading.Thread(target=lambda: results.append(self.db_manager.get_player_by_id(player_id)))
+            worker.start()
+            worker.join()
+            self.assertEqual(results[0]['skills'], 60, "Pooled readers see the last committed row.")
+        self.assertEqual(self.db_manager.get_player_by_id(player_id)['skills'], 90)
+
+        # A row read before a write is dropped rather than cached after it
+        generation = self.db_manager.identity_map.generation
+        self.db_manager.update_player_skills(player_id, 95)
+        self.db_manager.identity_map.put(('player', player_id), {'skills': 90}, generation)
+        self.assertEqual(self.db_manager.get_player_by_id(player_id)['skills'], 95)
+
+    def test_shared_manager_is_reused(self):
+        shared = get_database_manager(self.test_db_path)
+        try:
+            self.assertIs(get_database_manager(self.test_db_path), shared)
+            # A current schema is detected from the header and no migration runs
+            self.assertEqual(migrate(shared.conn), [])
+        finally:
+            shared.close()
+        self.assertIsNot(get_database_manager(self.test_db_path), shared, "Closed managers should be replaced.")
+        get_database_manager(self.test_db_path).close()
+
+    def test_worker_threads_read_while_writer_is_busy(self):
+        committed_id = self.db_manager.add_player(
+            name="Committed Player",
+            position="Forward",
+            skills=70,
+            morale=70,
+            contract_end=2026
+        )
+        results = {}
+
+        def read_from_worker():
+            results['names'] = {player['name'] for player in self.db_manager.get_all_players()}
+            results['team_of_player'] = self.db_manager.get_team_of_player(committed_id)
+
+        with self.db_manager.transaction():
+            self.db_manager.add_player(
+                name="Uncommitted Player",
+                position="Forward",
+                skills=70,
+                morale=70,
+                contract_end=2026
+            )
+            # The worker must not wait for the open write transaction
+            worker = threading.Thread(target=read_from_worker)
+            worker.start()
+            worker.join(timeout=5)
+            self.assertFalse(worker.is_alive(), "Worker read should not block on the writer.")
+
+        self.assertIn("Committed Player", results['names'])
+        self.assertNotIn("Uncommitted Player", results['names'])
+        self.assertIsNone(results['team_of_player'])
+
+    def test_worker_threads_can_write(self):
+        errors = []
+
+        def write_from_worker(index):
+            try:
+                self.db_manager.add_player(
+                    name=f"Threaded Player {index}",
+                    position="Defender",
+                    skills=60,
+                    morale=60,
+                    contract_end=2026
+                )
+            except Exception as e:
+                errors.append(e)
+
+        workers = [threading.Thread(target=write_from_worker, args=(i,)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=5)
+        self.assertEqual(errors, [])
+        names = {player['name'] for player in self.db_manager.get_all_players()}
+        self.assertTrue({f"Threaded Player {i}" for i in range(4)} <= names)
+
+    def test_loaders_return_model_objects(self):
+        team_id = self.db_manager.add_team(name="Model Town", formation="4-4-2", tactics="Balanced")
+        player_id = self.db_manager.add_player(
+            name="Model Player",
+            position="Winger",
+            skills=74,
+            morale=76,
+            contract_end=2026
+        )
+        team = self.db_manager.load_team(team_id)
+        self.assertIsInstance(team, Team)
+        self.assertEqual((team.id, team.name, team.formation), (team_id, "Model Town", "4-4-2"))
+        self.assertIs(self.db_manager.load_team(team_id), team, "Loaded teams should come from the identity map.")
+
+        player = self.db_manager.load_player(player_id)
+        self.assertIsInstance(player, Player)
+        self.assertEqual((player.id, player.skills), (player_id, 74))
+        # Writes update the cached model object
+        self.db_manager.update_player_skills(player_id, 81)
+        self.assertEqual(player.skills, 81)
+
+        players = self.db_manager.load_players()
+        self.assertTrue(all(isinstance(p, Player) for p in players))
+        self.assertIn(player_id, [p.id for p in self.db_manager.load_available_players()])
+        self.assertIsNone(self.db_manager.load_team(-1))
+
+    def test_iter_and_page_players(self):
+        self.db_manager.add_players_many(
+            (f"Paged Player {i}", "Midfielder", 60, 70, 2025) for i in range(7)
+        )
+        all_ids = [p.id for p in self.db_manager.load_players()]
+        # Small batches force several keyset pages to be stitched together
+        self.assertEqual([p.id for p in self.db_manager.iter_players(batch=3)], all_ids)
+
+        first = self.db_manager.page_players(limit=4)
+        second = self.db_manager.page_players(after_id=first[-1].id, limit=4)
+        self.assertEqual([p.id for p in first + second], all_ids[:8])
+        self.assertEqual(self.db_manager.page_players(after_id=all_ids[-1]), [])
+
+    def test_page_matches(self):
+        home = self.db_manager.add_team(name="Page Home", formation="4-4-2", tactics="Balanced")
+        away = self.db_manager.add_team(name="Page Away", formation="4-4-2", tactics="Balanced")
+        match_ids = self.db_manager.add_matches_many(
+            (home, away, f"2024-09-{day:02d}") for day in range(1, 6)
+        )
+        page = self.db_manager.page_matches(after_id=match_ids[1], limit=2)
+        self.assertEqual([m.id for m in page], match_ids[2:4])
+        self.assertIn(match_ids[-1], [m.id for m in self.db_manager.iter_matches(batch=2)])
+
 if __name__ == '__main__':
     unittest.main()
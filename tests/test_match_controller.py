@@ -1,8 +1,10 @@
 import unittest
 import os
+import pygame
 from database.db_manager import DatabaseManager
 from controllers.match_controller import MatchController
 from models.match import Match
+from views.match_view import MatchView
 
 class TestMatchController(unittest.TestCase):
     @classmethod
@@ -101,5 +103,26 @@ class TestMatchController(unittest.TestCase):
         matches = self.match_controller.list_all_matches()
         self.assertEqual(len(matches), initial_count + 2, "Should retrieve two additional matches.")
 
+    def test_page_through_matches(self):
+        match_ids = [
+            self.match_controller.create_match(self.team1_id, self.team2_id, f"2024-10-{day:02d}").id
+            for day in range(1, 6)
+        ]
+        after_id = match_ids[0] - 1
+        first = self.match_controller.list_all_matches(after_id, limit=3)
+        second = self.match_controller.list_all_matches(first[-1].id, limit=3)
+        self.assertEqual([match.id for match in first], match_ids[:3])
+        self.assertEqual([match.id for match in second][:2], match_ids[3:])
+
+        # Moving the cursor off either end of a page asks for the adjoining page
+        pygame.font.init()
+        view = MatchView(pygame.Surface((800, 600)))
+        view.matches = first
+        self.assertEqual(view.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT)), "Previous Page")
+        for _ in range(2):
+            self.assertIsNone(view.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)))
+        self.assertEqual(view.selected_match.id, match_ids[2])
+        self.assertEqual(view.handle_input(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT)), "Next Page")
+
 if __name__ == '__main__':
     unittest.main()
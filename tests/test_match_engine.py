@@ -0,0 +1,425 @@
+import unittest
+import os
+import sqlite3
+from unittest import mock
+from database import migrations
+from database.db_manager import DatabaseManager
+from controllers.match_controller import MatchController
+from engine import MatchEngine, rate_team, expected_goals, goal_probabilities
+from engine.match_engine import ENGINE_VERSION, GOAL, MINUTES
+from engine.batch import quick_scores, simulate_scores
+from engine.parallel import MIN_FIXTURES_PER_CHUNK, SimulationPool, match_seed, simulate_fixtures
+from engine.event_log import NARROW, WIDE, events_digest, pack_events, unpack_events
+from engine.replay import ReplayError, encode_snapshot, load_snapshot, replay, snapshot_digest
+from engine.policy import FULL, QUICK, SimulationPolicy
+from utils.constants import EVENT_LOG_MATCHDAYS
+from views.match_view import LivePlayback
+
+
+def squad(skills, first_id=1):
+    positions = ['Goalkeeper'] + ['Defender'] * 4 + ['Midfielder'] * 4 + ['Forward'] * 2 + ['Midfielder'] * 5
+    return [(first_id + i, position, skills, 60) for i, position in enumerate(positions)]
+
+
+class TestMatchEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = MatchEngine()
+        self.strong = rate_team(squad(85), '4-3-3', 'Offensive')
+        self.weak = rate_team(squad(55, first_id=100), '4-4-2', 'Balanced')
+
+    def test_same_seed_replays_the_same_match(self):
+        first = self.engine.simulate(self.strong, self.weak, seed=42)
+        second = self.engine.simulate(self.strong, self.weak, seed=42)
+        self.assertEqual(first, second)
+
+    def test_events_match_the_score(self):
+        for seed in range(50):
+            result = self.engine.simulate(self.strong, self.weak, seed=seed)
+            goals = [event for event in result.events if event.kind == GOAL]
+            self.assertEqual(sum(1 for event in goals if event.side == 0), result.home_score)
+            self.assertEqual(sum(1 for event in goals if event.side == 1), result.away_score)
+            minutes = [event.minute for event in result.events]
+            self.assertEqual(minutes, sorted(minutes), "Events should be in time order.")
+            self.assertTrue(all(1 <= minute <= MINUTES for minute in minutes))
+
+    def test_players_leave_the_event_log_when_they_leave_the_pitch(self):
+        # One starter and three substitutes: each substitution takes off whoever is on
+        lone = rate_team([(1, 'Forward', 80, 60), (2, 'Forward', 40, 60),
+                          (3, 'Forward', 40, 60), (4, 'Forward', 40, 60)])
+        lone = lone._replace(starters=lone.starters[:1], scorer_weights=lone.scorer_weights[:1],
+                             bench=(2, 3, 4), card_rate=2.0)
+        reds = subs = 0
+        for seed in range(200):
+            on_pitch, gone = 1, set()
+            for event in self.engine.simulate(lone, self.weak, seed=seed).events:
+                if event.side != 0:
+                    continue
+                self.assertNotIn(event.player_id, gone, f"Seed {seed}: {event} names a player who has left")
+                if event.kind == 'red':
+                    gone.add(event.player_id)
+                    on_pitch = None
+                    reds += 1
+                elif event.kind == 'sub':
+                    gone.add(on_pitch)
+                    on_pitch = event.player_id
+                    subs += 1
+                elif event.player_id is not None:
+                    self.assertEqual(event.player_id, on_pitch)
+        self.assertGreater(reds, 0)
+        self.assertGreater(subs, 0)
+
+    def test_stronger_team_scores_more(self):
+        home_goals = away_goals = 0
+        for seed in range(500):
+            result = self.engine.simulate(self.strong, self.weak, seed=seed)
+            home_goals += result.home_score
+            away_goals += result.away_score
+        self.assertGreater(home_goals, away_goals * 2)
+        p_home, p_away = goal_probabilities(self.strong, self.weak)
+        # Average goals should sit close to the fixed per-minute probability times 90
+        self.assertAlmostEqual(home_goals / 500, p_home * MINUTES, delta=0.25)
+        self.assertAlmostEqual(away_goals / 500, p_away * MINUTES, delta=0.15)
+
+    def test_batch_matches_single_match_distribution(self):
+        samples = 4000
+        single = [self.engine.simulate(self.strong, self.weak, seed=seed) for seed in range(samples)]
+        batch_home, batch_away = simulate_scores([self.strong] * samples, [self.weak] * samples, seed=1)
+        for side, batch in ((0, batch_home), (1, batch_away)):
+            single_goals = [result[side] for result in single]
+            self.assertAlmostEqual(sum(single_goals) / samples, batch.mean(), delta=0.1)
+            # Every scoreline frequency from 0 to 5 goals should agree to within 3 percentage points
+            for goals in range(6):
+                single_share = single_goals.count(goals) / samples
+                batch_share = (batch == goals).mean()
+                self.assertAlmostEqual(single_share, batch_share, delta=0.03,
+                                       msg=f"Side {side}, {goals} goals: {single_share:.3f} vs {batch_share:.3f}")
+
+    def test_quick_scores_follow_expected_goals(self):
+        samples = 20000
+        home_scores, away_scores = quick_scores([self.strong] * samples, [self.weak] * samples, seed=5)
+        home_xg, away_xg = expected_goals(self.strong, self.weak)
+        self.assertAlmostEqual(home_scores.mean(), home_xg, delta=0.05)
+        self.assertAlmostEqual(away_scores.mean(), away_xg, delta=0.05)
+
+    def test_policy_gives_managed_club_full_sim(self):
+        policy = SimulationPolicy(managed_team_id=7)
+        self.assertEqual(policy.mode_for(7, 8), FULL)
+        self.assertEqual(policy.mode_for(8, 7), FULL)
+        self.assertEqual(policy.mode_for(8, 9), QUICK)
+
+    def test_shared_pool_matches_single_process(self):
+        ratings = {1: self.strong, 2: self.weak}
+        fixtures = [(match_id, match_seed(3, match_id), 1, 2) for match_id in range(1, 4 * MIN_FIXTURES_PER_CHUNK + 1)]
+        single_process = simulate_fixtures(fixtures, ratings, workers=1)
+        with SimulationPool(2) as pool:
+            self.assertEqual(simulate_fixtures(fixtures[:3], ratings, pool=pool), single_process[:3])
+            self.assertIsNone(pool._executor, "Small batches run in this process.")
+            self.assertEqual(simulate_fixtures(fixtures, ratings, pool=pool), single_process)
+            executor = pool._executor
+            self.assertIsNotNone(executor)
+            simulate_fixtures(fixtures, ratings, pool=pool)
+            self.assertIs(pool._executor, executor, "Workers are reused across batches.")
+        self.assertIsNone(pool._executor)
+
+    def test_event_log_round_trip(self):
+        events = self.engine.simulate(self.strong, self.weak, seed=11).events
+        blob = pack_events(events)
+        self.assertEqual(blob[0], NARROW)
+        self.assertEqual(unpack_events(blob), events)
+        # Ids too far apart for 32-bit offsets fall back to full-width records
+        spread = [(1, 0, GOAL, 5), (2, 1, GOAL, 5 + (1 << 40)), (3, 1, GOAL, None)]
+        blob = pack_events(spread)
+        self.assertEqual(blob[0], WIDE)
+        self.assertEqual([tuple(event) for event in unpack_events(blob)], spread)
+        self.assertEqual(unpack_events(None), [])
+
+    def test_replay_checks_determinism(self):
+        original = self.engine.simulate(self.strong, self.weak, seed=21)
+        blob = encode_snapshot(self.strong)
+        strong = load_snapshot(blob, snapshot_digest(blob))
+        self.assertEqual(strong, self.strong)
+        replayed = replay(strong, self.weak, 21, ENGINE_VERSION, events_digest(original.events),
+                          (original.home_score, original.away_score))
+        self.assertEqual(replayed, original)
+
+        with self.assertRaises(ReplayError):
+            replay(self.strong, self.weak, 22, ENGINE_VERSION, events_digest(original.events))
+        with self.assertRaises(ReplayError):
+            replay(self.strong, self.weak, 21, ENGINE_VERSION + 1)
+        with self.assertRaises(ReplayError):
+            load_snapshot(encode_snapshot(self.weak), snapshot_digest(blob))
+
+    def test_event_generator_is_lazy_and_matches_simulate(self):
+        result = self.engine.simulate(self.strong, self.weak, seed=31)
+        stream = self.engine.iter_events(self.strong, self.weak, seed=31)
+        self.assertEqual(next(stream), result.events[0])
+        self.assertEqual([result.events[0], *stream], result.events)
+
+    def test_playback_pulls_events_only_as_the_clock_reaches_them(self):
+        result = self.engine.simulate(self.strong, self.weak, seed=41)
+        pulled = []
+
+        def stream():
+            for event in result.events:
+                pulled.append(event)
+                yield event, f"{event.minute}' {event.kind}"
+
+        playback = LivePlayback(stream())
+        playback.advance(30)
+        due = [event for event in result.events if event.minute <= 30]
+        self.assertEqual(len(playback.lines), len(due))
+        self.assertLessEqual(len(pulled), len(due) + 1, "At most one event is computed ahead of the clock.")
+        playback.speed = '4x'
+        playback.advance(5)
+        self.assertEqual(playback.minute, 50)
+        self.assertFalse(playback.finished)
+
+        playback.skip_to_end()
+        self.assertTrue(playback.finished)
+        self.assertEqual(len(playback.lines), len(result.events))
+        self.assertEqual(tuple(playback.score), (result.home_score, result.away_score))
+
+    def test_empty_squad_is_average(self):
+        ratings = rate_team([], '4-4-2', 'Balanced')
+        self.assertEqual((ratings.attack, ratings.defence), (50.0, 50.0))
+        result = self.engine.simulate(ratings, ratings, seed=1)
+        self.assertTrue(all(event.player_id is None for event in result.events if event.kind == GOAL))
+
+
+class TestMatchSimulationStorage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.test_db_path = 'savegames/test_engine.db'
+        if os.path.exists(cls.test_db_path):
+            os.remove(cls.test_db_path)
+        cls.db_manager = DatabaseManager(db_path=cls.test_db_path)
+        cls.match_controller = MatchController(cls.db_manager)
+        cls.home_id, cls.away_id = cls.db_manager.add_teams_many([
+            ("Engine United", "4-3-3", "Offensive", "England", 1),
+            ("Engine Rovers", "5-4-1", "Defensive", "England", 1),
+        ])
+        player_ids = cls.db_manager.add_players_many(
+            (f"Engine Player {player_id}", position, skills, morale, 2026)
+            for player_id, position, skills, morale in squad(80) + squad(60)
+        )
+        cls.db_manager.assign_players_many(
+            [(cls.home_id, player_id) for player_id in player_ids[:16]]
+            + [(cls.away_id, player_id) for player_id in player_ids[16:]]
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db_manager.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(cls.test_db_path + suffix):
+                os.remove(cls.test_db_path + suffix)
+
+    def test_old_event_logs_are_dropped_and_replayed(self):
+        policy = SimulationPolicy(full_team_ids=[self.home_id])
+        dates = ["2030-11-02", "2030-11-09", "2030-11-16"]  # Later than any other test's matches
+        match_ids = self.db_manager.add_matches_many([(self.home_id, self.away_id, date) for date in dates])
+        self.match_controller.event_log_matchdays = None
+        try:
+            for date in dates:
+                self.match_controller.simulate_matchday(date, policy=policy)
+            recorded = [self.match_controller.get_match_events(match_id) for match_id in match_ids]
+            self.assertTrue(all(recorded))
+
+            self.assertGreaterEqual(self.db_manager.prune_event_logs(1), 2)
+            self.assertEqual(self.db_manager.get_match_events(match_ids[0]), [], "Older logs are dropped.")
+            self.assertTrue(self.db_manager.get_match_events(match_ids[2]), "The latest matchday keeps its log.")
+            self.assertEqual([self.match_controller.get_match_events(match_id) for match_id in match_ids], recorded)
+            self.assertEqual(len(self.match_controller.get_match_commentary(match_ids[0])), len(recorded[0]))
+
+            # A squad change after the match does not affect its replay
+            player_id = self.db_manager.get_squads([self.home_id])[self.home_id][2][0][0]
+            self.db_manager.update_player_skills(player_id, 1)
+            self.assertEqual(self.match_controller.get_match_events(match_ids[0]), recorded[0])
+            self.db_manager.update_player_skills(player_id, 80)
+        finally:
+            self.match_controller.event_log_matchdays = EVENT_LOG_MATCHDAYS
+
+    def test_live_match_is_saved_at_full_time(self):
+        match_id = self.db_manager.add_match(self.home_id, self.away_id, "2024-12-07")
+        playback = LivePlayback(self.match_controller.play_match(match_id), speed='Instant')
+        playback.advance(0)
+        self.assertTrue(playback.finished)
+        stored = self.db_manager.get_match_by_id(match_id)
+        self.assertEqual((stored['home_score'], stored['away_score']), tuple(playback.score))
+        self.assertEqual(len(self.match_controller.get_match_events(match_id)), len(playback.lines))
+        self.assertEqual(playback.lines, self.match_controller.get_match_commentary(match_id))
+        self.assertEqual(self.match_controller.replay_match(match_id).events, self.match_controller.get_match_events(match_id))
+        self.assertIsNone(self.match_controller.play_match(10 ** 9))
+
+    def test_simulate_match_writes_score_and_events(self):
+        match_id = self.db_manager.add_match(self.home_id, self.away_id, "2024-08-17")
+        match = self.match_controller.simulate_match(match_id, seed=7)
+
+        stored = self.db_manager.get_match_by_id(match_id)
+        self.assertEqual((stored['home_score'], stored['away_score']), (match.home_score, match.away_score))
+        events = self.db_manager.get_match_events(match_id)
+        self.assertEqual(sum(1 for event in events if event['kind'] == GOAL), match.home_score + match.away_score)
+        home_squad = {player[0] for player in self.db_manager.get_squads([self.home_id])[self.home_id][2]}
+        home_scorers = {event['player_id'] for event in events if event['kind'] == GOAL and event['side'] == 0}
+        self.assertTrue(home_scorers <= home_squad, "Home goals should be credited to home players.")
+
+        # Re-simulating with the same seed replaces the log rather than appending to it
+        self.match_controller.simulate_match(match_id, seed=7)
+        self.assertEqual(self.db_manager.get_match_events(match_id), events)
+
+        lines = self.match_controller.get_match_commentary(match_id)
+        self.assertEqual(len(lines), len(events))
+        goal_lines = [line for line in lines if 'GOAL!' in line]
+        self.assertEqual(len(goal_lines), match.home_score + match.away_score)
+        self.assertTrue(all('Engine Player' in line for line in goal_lines))
+
+    def test_upgrade_stores_event_logs_as_blobs(self):
+        path = 'savegames/test_event_upgrade.db'
+        if os.path.exists(path):
+            os.remove(path)
+        conn = sqlite3.connect(path)
+        with mock.patch.object(migrations, 'MIGRATIONS', migrations.MIGRATIONS[:7]), \
+                mock.patch.object(migrations, 'CURRENT_SCHEMA_VERSION', 7):
+            migrations.migrate(conn)
+        conn.executescript("""
+            INSERT INTO teams (id, name) VALUES (1, 'Old Home'), (2, 'Old Away');
+            INSERT INTO matches (id, home_team_id, away_team_id, date) VALUES (1, 1, 2, '2024-08-01');
+        """)
+        conn.commit()
+        conn.close()
+        db_manager = DatabaseManager(db_path=path, read_connections=0)
+        try:
+            self.assertEqual(db_manager.get_match_events(1), [])
+            events = [(12, 0, 'yellow', 4), (30, 0, 'goal', 9), (61, 1, 'sub', None)]
+            self.assertTrue(db_manager.save_match_result(1, 1, 0, events))
+            self.assertEqual([tuple(event.values()) for event in db_manager.get_match_events(1)], events)
+            tables = {row[0] for row in db_manager.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            self.assertNotIn('match_events', tables, "Event logs never get a row-per-event table.")
+        finally:
+            db_manager.close()
+            for suffix in ('', '-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+
+    def test_simulate_matches_in_batch(self):
+        match_ids = self.db_manager.add_matches_many(
+            [(self.home_id, self.away_id, "2024-09-01"), (self.away_id, self.home_id, "2024-09-08")] * 50
+        )
+        matches = self.match_controller.simulate_matches(match_ids, seed=3)
+        self.assertEqual([match.id for match in matches], match_ids)
+        stored = {match.id: (match.home_score, match.away_score) for match in self.db_manager.load_matches_by_ids(match_ids)}
+        self.assertEqual(stored, {match.id: (match.home_score, match.away_score) for match in matches})
+        self.assertEqual(self.db_manager.get_match_events(match_ids[0]), [], "Batch results carry no event log.")
+        home_wins = sum(match.home_score > match.away_score for match in matches[::2])
+        self.assertGreater(home_wins, 25, "The stronger side should win most of its home games.")
+
+    def test_team_ratings_are_stored_until_the_squad_changes(self):
+        team_id = self.db_manager.add_team(name="Ratings Town", formation="4-4-2", tactics="Balanced")
+        player_ids = self.db_manager.add_players_many(
+            (f"Ratings Player {player_id}", position, skills, morale, 2026)
+            for player_id, position, skills, morale in squad(70)
+        )
+        self.db_manager.assign_players_many((team_id, player_id) for player_id in player_ids)
+
+        def stored_dirty_flag():
+            row = self.db_manager.conn.execute("SELECT dirty FROM team_ratings WHERE team_id = ?", (team_id,)).fetchone()
+            return row[0] if row else None
+
+        ratings = self.db_manager.get_team_ratings([team_id])[team_id]
+        self.assertIs(self.db_manager.get_team_ratings([team_id])[team_id], ratings, "Repeat reads hit the mirror.")
+        self.assertEqual(stored_dirty_flag(), 0)
+        reopened = DatabaseManager(db_path=self.test_db_path)
+        self.assertEqual(reopened.get_team_ratings([team_id])[team_id], ratings)
+        reopened.close()
+
+        self.db_manager.update_team_tactics(team_id, "Attacking")
+        self.assertEqual(stored_dirty_flag(), 1)
+        attacking = self.db_manager.get_team_ratings([team_id])[team_id]
+        self.assertGreater(attacking.attack, ratings.attack)
+        self.assertEqual(stored_dirty_flag(), 0)
+
+        self.db_manager.update_player_morale(player_ids[0], 0)
+        self.assertEqual(stored_dirty_flag(), 1)
+        self.db_manager.remove_player_from_team(team_id, player_ids[1])
+        updated = self.db_manager.get_team_ratings([team_id])[team_id]
+        formation, tactics, players = self.db_manager.get_squads([team_id])[team_id]
+        self.assertEqual(updated, rate_team(players, formation, tactics))
+        self.assertNotIn(player_ids[1], updated.starters + updated.bench)
+
+    def test_matchday_is_deterministic_across_workers(self):
+        date = "2024-10-05"
+        match_ids = self.db_manager.add_matches_many([(self.home_id, self.away_id, date)] * 12)
+        self.assertIsNotNone(self.db_manager.get_save_seed())
+
+        def played():
+            return [(match.id, match.home_score, match.away_score) for match in self.db_manager.load_matches_by_ids(match_ids)]
+
+        policy = SimulationPolicy(full_team_ids=[self.home_id])
+        single_process = [
+            (m.id, m.home_score, m.away_score) for m in self.match_controller.simulate_matchday(date, workers=1, policy=policy)
+        ]
+        events = self.db_manager.get_match_events(match_ids[0])
+        self.assertTrue(events)
+        self.assertEqual(played(), single_process)
+        self.db_manager.update_match_scores_many([(match_id, None, None) for match_id in match_ids])
+        self.match_controller.simulate_matchday(date, workers=3, policy=policy)
+        self.assertEqual(played(), single_process, "Worker count must not change results.")
+        self.assertEqual(self.db_manager.get_match_events(match_ids[0]), events)
+        # The single-match path uses the same derived seed
+        self.match_controller.simulate_match(match_ids[5])
+        self.assertEqual(played(), single_process)
+
+    def test_matchday_leaves_played_matches_alone(self):
+        date = "2024-10-12"
+        watched, other = self.db_manager.add_matches_many([(self.home_id, self.away_id, date)] * 2)
+        result = self.match_controller.simulate_match(watched, seed=123)
+        events = self.db_manager.get_match_events(watched)
+        played = self.match_controller.simulate_matchday(date, policy=SimulationPolicy(full_team_ids=[self.home_id]))
+        self.assertEqual([match.id for match in played], [other])
+        match = self.db_manager.get_match_by_id(watched)
+        self.assertEqual((match['home_score'], match['away_score']), (result.home_score, result.away_score))
+        self.assertEqual(self.db_manager.get_match_events(watched), events)
+
+    def test_season_uses_full_sim_only_for_managed_club(self):
+        other_id = self.db_manager.add_team(name="Engine Athletic", formation="4-4-2", tactics="Balanced")
+        self.db_manager.set_managed_team_id(self.home_id)
+        managed_match, background_match = self.db_manager.add_matches_many([
+            (self.home_id, other_id, "2025-01-04"), (self.away_id, other_id, "2025-01-04")
+        ])
+        later_match = self.db_manager.add_match(other_id, self.away_id, "2025-01-11")
+
+        played = self.match_controller.simulate_season(until="2025-01-04")
+        self.assertEqual({match.id for match in played}, {managed_match, background_match})
+        self.assertTrue(self.db_manager.get_match_events(managed_match), "The managed club's match is fully simulated.")
+        self.assertEqual(self.db_manager.get_match_events(background_match), [], "Background fixtures are quick-simmed.")
+        self.assertIsNone(self.db_manager.get_match_by_id(later_match)['home_score'])
+        self.assertNotIn("2025-01-04", self.db_manager.get_unplayed_match_dates())
+        self.db_manager.set_managed_team_id(None)
+
+    def test_default_policy_quick_sims_a_new_world(self):
+        db_manager = DatabaseManager(db_path=':memory:')
+        try:
+            db_manager.initialize_english_teams()
+            teams = [team['id'] for team in db_manager.get_teams_by_country('England')]
+            db_manager.set_managed_team_id(teams[0])
+            policy = MatchController(db_manager).simulation_policy()
+            self.assertEqual(policy.mode_for(teams[1], teams[0]), FULL, "The managed club's opponents play it in full.")
+            self.assertEqual(policy.mode_for(teams[1], teams[2]), QUICK, "Everyone else is quick-simmed.")
+        finally:
+            db_manager.close()
+
+    def test_default_policy_follows_country_simulation_level(self):
+        scottish = [team['id'] for team in self.db_manager.get_teams_by_country('Scotland')]
+        self.assertEqual(self.db_manager.get_country_simulation('Scotland'), 'quick')
+        quick_match = self.db_manager.add_match(scottish[0], scottish[1], "2020-02-01")
+        self.match_controller.simulate_matchday("2020-02-01")
+        self.assertIsNone(self.db_manager.get_replay_info(quick_match), "Quick countries are quick-simmed.")
+
+        self.assertTrue(self.db_manager.activate_country('Scotland'))
+        full_match = self.db_manager.add_match(scottish[2], scottish[3], "2020-02-08")
+        self.match_controller.simulate_matchday("2020-02-08")
+        self.assertIsNotNone(self.db_manager.get_replay_info(full_match), "Full countries use the event engine.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import os
+import pygame
 from database.db_manager import DatabaseManager
 from controllers.settings_controller import SettingsController
 from views.settings_view import SettingsView
@@ -13,6 +14,7 @@ class TestSettingsController(unittest.TestCase):
         if os.path.exists(cls.test_db_path):
             os.remove(cls.test_db_path)
         cls.db_manager = DatabaseManager(db_path=cls.test_db_path)
+        pygame.font.init()  # SettingsView loads its fonts on creation
         cls.settings_view = SettingsView(screen=None)  # Mock screen as None for testing
         cls.settings_controller = SettingsController(cls.db_manager, cls.settings_view)
 
@@ -50,6 +52,14 @@ class TestSettingsController(unittest.TestCase):
         except Exception as e:
             self.fail(f"Updating settings raised an exception: {e}")
 
+    def test_apply_keeps_saved_performance_profile(self):
+        self.db_manager.set_setting('performance_profile', 'fast-sim')
+        self.settings_controller.load_settings()
+        self.assertEqual(self.settings_view.menu_options[3], "Performance: fast-sim")
+        # Applying without touching the profile must not reset it to the default
+        self.settings_controller.apply_settings()
+        self.assertEqual(self.db_manager.get_settings()['performance_profile'], 'fast-sim')
+
     def test_handle_settings_loop(self):
         # Testing handle_settings would require simulating Pygame events
         # This is complex and typically done with integration tests
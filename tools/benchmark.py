@@ -0,0 +1,252 @@
+"""
+Benchmark match simulation throughput and print the results as JSON.
+
+Runs headless against a synthetic world built from fixed seeds:
+
+- full: the minute-by-minute engine, one match at a time
+- batch: vectorised binomial scores for many matches in one NumPy call
+- quick: Poisson quick-sim scores
+- season: a 92-club, four-division season played through MatchController in a
+  scratch database, with the default policy and with every match on the full engine
+- parallel: full-engine throughput per worker count, on a pool whose workers have
+  already started
+
+Every stage also reports a checksum of the scores it produced. Runs with the
+same seed and the same engine give the same checksums, so two JSON files from
+different commits show both speed and behaviour changes.
+
+Usage:
+    python -m tools.benchmark [--seed 2024] [--repeat 3] [--output results.json]
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zlib
+
+# Importing the controllers package pulls in pygame; keep its banner out of the JSON
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+from controllers.match_controller import MatchController
+from database.db_manager import DatabaseManager
+from engine import ENGINE_VERSION, MatchEngine
+from engine.batch import quick_scores, simulate_scores
+from engine.parallel import SimulationPool, simulate_fixtures
+from engine.policy import SimulationPolicy
+from tools.scaling_report import POSITIONS, synthetic_world
+
+BENCHMARK_VERSION = 1
+# The English pyramid: Premier League, Championship, League One, League Two
+DIVISION_SIZES = (20, 24, 24, 24)
+SEASON_START = datetime.date(2025, 8, 2)
+
+
+def _checksum(scores):
+    return zlib.crc32(json.dumps([[int(home), int(away)] for home, away in scores]).encode())
+
+
+def _best_of(repeat, fn):
+    """Run fn repeat times and return (fastest seconds, last result)."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _throughput(matches, seconds, scores):
+    return {
+        'matches': matches,
+        'seconds': round(seconds, 6),
+        'matches_per_sec': round(matches / seconds, 1),
+        'checksum': _checksum(scores),
+    }
+
+
+def bench_full(fixtures, ratings, repeat):
+    engine = MatchEngine()
+
+    def run():
+        results = [
+            engine.simulate(ratings[home_id], ratings[away_id], seed=seed) for _, seed, home_id, away_id in fixtures
+        ]
+        return [(result.home_score, result.away_score) for result in results]
+
+    seconds, scores = _best_of(repeat, run)
+    return _throughput(len(fixtures), seconds, scores)
+
+
+def bench_vectorised(scorer, fixtures, ratings, repeat, seed):
+    home_ratings = [ratings[home_id] for _, _, home_id, _ in fixtures]
+    away_ratings = [ratings[away_id] for _, _, _, away_id in fixtures]
+
+    def run():
+        home_scores, away_scores = scorer(home_ratings, away_ratings, seed=seed)
+        return list(zip(home_scores.tolist(), away_scores.tolist()))
+
+    seconds, scores = _best_of(repeat, run)
+    return _throughput(len(fixtures), seconds, scores)
+
+
+def season_fixtures(team_ids):
+    """Double round robin by the circle method: a list of rounds of (home, away) pairs."""
+    teams = list(team_ids)
+    if len(teams) % 2:
+        teams.append(None)
+    rounds = []
+    for _ in range(len(teams) - 1):
+        pairs = [(teams[i], teams[-1 - i]) for i in range(len(teams) // 2)]
+        rounds.append([pair for pair in pairs if None not in pair])
+        teams.insert(1, teams.pop())
+    return rounds + [[(away, home) for home, away in fixtures] for fixtures in rounds]
+
+
+def build_season(path, seed):
+    """Create a 92-club world with squads and a full fixture list; return (db_manager, team_ids)."""
+    rng = random.Random(seed)
+    db_manager = DatabaseManager(db_path=path, read_connections=0)
+    db_manager.set_save_seed(seed)
+    teams = [
+        (f"Club {division}-{number}", rng.choice(['4-4-2', '4-3-3', '3-5-2', '5-3-2']),
+         rng.choice(['Balanced', 'Offensive', 'Defensive']), 'England', division)
+        for division, size in enumerate(DIVISION_SIZES, start=1)
+        for number in range(1, size + 1)
+    ]
+    team_ids = db_manager.add_teams_many(teams)
+    player_ids = db_manager.add_players_many(
+        (f"Player {team_id}-{number}", position, rng.randint(40, 90), rng.randint(30, 90), 2026)
+        for team_id in team_ids
+        for number, position in enumerate(POSITIONS)
+    )
+    db_manager.assign_players_many(
+        (team_ids[index // len(POSITIONS)], player_id) for index, player_id in enumerate(player_ids)
+    )
+    matches = []
+    first = 0
+    for size in DIVISION_SIZES:
+        for round_index, fixtures in enumerate(season_fixtures(team_ids[first:first + size])):
+            date = (SEASON_START + datetime.timedelta(weeks=round_index)).isoformat()
+            matches += [(home_id, away_id, date) for home_id, away_id in fixtures]
+        first += size
+    db_manager.add_matches_many(matches)
+    return db_manager, team_ids
+
+
+def bench_season(seed, workers, full_engine):
+    """Play a whole season through MatchController and return its wall time and results."""
+    scratch = tempfile.mkdtemp(prefix='benchmark_')
+    db_manager, team_ids = build_season(os.path.join(scratch, 'season.db'), seed)
+    try:
+        controller = MatchController(db_manager)
+        if full_engine:
+            policy = SimulationPolicy(full_team_ids=team_ids)
+        else:
+            # The game's own default policy, managing the first club
+            db_manager.set_managed_team_id(team_ids[0])
+            policy = controller.simulation_policy()
+        start = time.perf_counter()
+        played = controller.simulate_season(workers=workers, policy=policy)
+        seconds = time.perf_counter() - start
+        result = _throughput(len(played), seconds, [(match.home_score, match.away_score) for match in played])
+        result['clubs'] = len(team_ids)
+        result['matchdays'] = len({match.date for match in played})
+        return result
+    finally:
+        db_manager.close()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def bench_parallel(fixtures, ratings, max_workers):
+    runs = []
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        with SimulationPool(workers) as pool:
+            # Start the workers first; a season pays that once, not per batch
+            simulate_fixtures(fixtures, ratings, pool=pool)
+            start = time.perf_counter()
+            results = simulate_fixtures(fixtures, ratings, pool=pool)
+            seconds = time.perf_counter() - start
+        scores = [(home_score, away_score) for _, home_score, away_score, _ in results]
+        if baseline is None:
+            baseline = seconds
+        run = _throughput(len(fixtures), seconds, scores)
+        run['workers'] = workers
+        run['speedup'] = round(baseline / seconds, 3)
+        runs.append(run)
+    return {
+        'runs': runs,
+        'identical': len({run['checksum'] for run in runs}) == 1,
+    }
+
+
+def run_benchmarks(seed=2024, matches=2000, batch_matches=200000, repeat=3, max_workers=None, workers=None,
+                   stages=('full', 'batch', 'quick', 'season', 'parallel')):
+    """Run the selected stages and return the results as a JSON-serialisable dict."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    report = {
+        'benchmark_version': BENCHMARK_VERSION,
+        'engine_version': ENGINE_VERSION,
+        'seed': seed,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'results': {},
+    }
+    results = report['results']
+    fixtures, ratings = synthetic_world(matches, seed=seed)
+    if 'full' in stages:
+        results['full'] = bench_full(fixtures, ratings, repeat)
+    if 'batch' in stages or 'quick' in stages:
+        batch_fixtures, batch_ratings = synthetic_world(batch_matches, seed=seed)
+        if 'batch' in stages:
+            results['batch'] = bench_vectorised(simulate_scores, batch_fixtures, batch_ratings, repeat, seed)
+        if 'quick' in stages:
+            results['quick'] = bench_vectorised(quick_scores, batch_fixtures, batch_ratings, repeat, seed)
+    if 'season' in stages:
+        results['season'] = bench_season(seed, workers, full_engine=False)
+        results['season_full_engine'] = bench_season(seed, workers, full_engine=True)
+    if 'parallel' in stages:
+        results['parallel'] = bench_parallel(fixtures, ratings, max_workers)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark match simulation and print JSON results.")
+    parser.add_argument('--seed', type=int, default=2024, help="Seed for the synthetic world and every simulation")
+    parser.add_argument('--matches', type=int, default=2000, help="Fixtures for the full-engine and parallel stages")
+    parser.add_argument('--batch-matches', type=int, default=200000, help="Fixtures for the batch and quick stages")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per micro-benchmark; the fastest is reported")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help="Highest worker count to try")
+    parser.add_argument('--workers', type=int, help="Worker processes for the season stages (default: one per CPU)")
+    parser.add_argument('--stages', default='full,batch,quick,season,parallel', help="Comma-separated stages to run")
+    parser.add_argument('--output', help="Write the JSON here instead of standard output")
+    args = parser.parse_args(argv)
+
+    # Controller progress messages go to stderr so stdout stays valid JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_benchmarks(
+            seed=args.seed, matches=args.matches, batch_matches=args.batch_matches, repeat=args.repeat,
+            max_workers=args.max_workers, workers=args.workers, stages=args.stages.split(',')
+        )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(text + '\n')
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
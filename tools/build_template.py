@@ -0,0 +1,51 @@
+"""
+Rebuild the template database that new games are cloned from.
+
+Usage:
+    python -m tools.build_template [path]
+"""
+import argparse
+import os
+import sqlite3
+from database.db_manager import DatabaseManager
+from utils.constants import TEMPLATE_DB_PATH
+
+
+def build_template(path=TEMPLATE_DB_PATH):
+    """Build the starting world in a scratch file and write a compacted copy to path."""
+    scratch_path = f"{path}.build"
+    for stale in (path, scratch_path):
+        if os.path.exists(stale):
+            os.remove(stale)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+    db_manager = DatabaseManager(db_path=scratch_path, read_connections=0)
+    try:
+        db_manager.initialize_english_teams()
+        db_manager.compact_into(path)
+    finally:
+        db_manager.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(scratch_path + suffix):
+                os.remove(scratch_path + suffix)
+
+    # A single self-contained file, so a plain copy or backup is a complete clone
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        conn.close()
+    return os.path.getsize(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild the new-game template database.")
+    parser.add_argument('path', nargs='?', default=TEMPLATE_DB_PATH, help="Where to write the template")
+    args = parser.parse_args(argv)
+    size = build_template(args.path)
+    print(f"Template written to {args.path} ({size} bytes).")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
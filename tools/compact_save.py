@@ -0,0 +1,40 @@
+"""
+Compact a savegame and report how much space was reclaimed.
+
+Usage:
+    python -m tools.compact_save [path] [--into copy.db]
+"""
+import argparse
+import os
+from database.db_manager import DatabaseManager
+from utils.constants import SAVE_GAME_PATH
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact a savegame database.")
+    parser.add_argument('path', nargs='?', default=SAVE_GAME_PATH, help="Savegame to compact")
+    parser.add_argument('--into', help="Write a compacted copy here instead of compacting in place")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"No savegame at {args.path}")
+
+    db_manager = DatabaseManager(db_path=args.path, read_connections=0)
+    try:
+        if args.into:
+            reclaimed = db_manager.compact_into(args.into)
+        else:
+            reclaimed = db_manager.compact()
+    finally:
+        db_manager.close()
+
+    if reclaimed is None:
+        print(f"Could not compact {args.path}; see logs/db_manager.log.")
+        return 1
+    target = args.into or args.path
+    print(f"{target}: {reclaimed} bytes reclaimed, {os.path.getsize(target)} bytes on disk.")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+"""
+Report how much space packed event blobs save against a row-per-event table.
+
+Event logs come from a savegame's matches, or from synthetic full-engine
+matches when no save is given. Each layout is written to a scratch in-memory
+database and measured in pages, so the figures include SQLite's own overhead.
+The replay-key layout is what a match keeps once its log has been pruned.
+
+Usage:
+    python -m tools.event_log_report [path] [--matches 2000]
+"""
+import argparse
+import os
+import sqlite3
+from engine import ENGINE_VERSION, MatchEngine
+from engine.event_log import events_digest, pack_events, unpack_events
+from tools.scaling_report import synthetic_world
+
+ROW_LAYOUT = """
+    CREATE TABLE match_events (
+        match_id INTEGER NOT NULL,
+        seq INTEGER NOT NULL,
+        minute INTEGER NOT NULL,
+        side INTEGER NOT NULL,
+        kind TEXT NOT NULL,
+        player_id INTEGER,
+        PRIMARY KEY (match_id, seq)
+    ) WITHOUT ROWID
+"""
+BLOB_LAYOUT = "CREATE TABLE match_logs (match_id INTEGER PRIMARY KEY, events BLOB)"
+REPLAY_LAYOUT = """
+    CREATE TABLE match_replays (
+        match_id INTEGER PRIMARY KEY,
+        engine_version INTEGER,
+        home_snapshot INTEGER,
+        away_snapshot INTEGER,
+        events_digest INTEGER
+    )
+"""
+
+
+def saved_logs(path):
+    """
+    Return {match_id: (events, snapshot ids)} for every match in a save with an event log.
+
+    Matches simulated without replay keys report None snapshot ids. Sharded
+    countries' matches are read from their shard files.
+    """
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        shard_paths = [row[0] for row in conn.execute("SELECT path FROM shards ORDER BY slot")]
+    finally:
+        conn.close()
+    rows = []
+    for db_path in [path, *(shard for shard in shard_paths if os.path.exists(shard))]:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            rows += conn.execute(
+                "SELECT id, events, home_snapshot, away_snapshot FROM matches WHERE events IS NOT NULL"
+            ).fetchall()
+        finally:
+            conn.close()
+    return {match_id: (unpack_events(blob), (home, away)) for match_id, blob, home, away in rows}
+
+
+def synthetic_logs(matches):
+    # Squads do not change here, so each team has one snapshot and its id stands in for it
+    fixtures, ratings = synthetic_world(matches)
+    engine = MatchEngine()
+    return {
+        match_id: (engine.simulate(ratings[home_id], ratings[away_id], seed=seed).events, (home_id, away_id))
+        for match_id, seed, home_id, away_id in fixtures
+    }
+
+
+def _database_size(schema, sql, rows):
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.execute(schema)
+        conn.executemany(sql, rows)
+        conn.commit()
+        return conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def measure(logs):
+    """Return the (row per event, packed blob, replay keys) layout sizes in bytes for the same logs."""
+    row_bytes = _database_size(
+        ROW_LAYOUT, "INSERT INTO match_events VALUES (?, ?, ?, ?, ?, ?)",
+        ((match_id, seq, *event) for match_id, (events, _) in logs.items() for seq, event in enumerate(events))
+    )
+    blob_bytes = _database_size(
+        BLOB_LAYOUT, "INSERT INTO match_logs VALUES (?, ?)",
+        ((match_id, pack_events(events)) for match_id, (events, _) in logs.items())
+    )
+    replay_bytes = _database_size(
+        REPLAY_LAYOUT, "INSERT INTO match_replays VALUES (?, ?, ?, ?, ?)",
+        ((match_id, ENGINE_VERSION, *snapshots, events_digest(events))
+         for match_id, (events, snapshots) in logs.items())
+    )
+    return row_bytes, blob_bytes, replay_bytes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare packed event blobs with a row-per-event layout.")
+    parser.add_argument('path', nargs='?', help="Savegame to read event logs from (default: synthetic matches)")
+    parser.add_argument('--matches', type=int, default=2000, help="Number of synthetic matches without a save")
+    args = parser.parse_args(argv)
+
+    if args.path:
+        if not os.path.exists(args.path):
+            parser.error(f"No savegame at {args.path}")
+        logs = saved_logs(args.path)
+    else:
+        logs = synthetic_logs(args.matches)
+    if not logs:
+        print("No match event logs to measure.")
+        return 1
+
+    events = sum(len(match_events) for match_events, _ in logs.values())
+    row_bytes, blob_bytes, replay_bytes = measure(logs)
+    print(f"{len(logs)} matches, {events} events ({events / len(logs):.1f} per match)")
+    print(f"{'layout':<14} {'bytes':>10} {'per match':>10}")
+    print(f"{'row per event':<14} {row_bytes:>10} {row_bytes / len(logs):>10.0f}")
+    print(f"{'packed blob':<14} {blob_bytes:>10} {blob_bytes / len(logs):>10.0f}")
+    print(f"{'replay keys':<14} {replay_bytes:>10} {replay_bytes / len(logs):>10.0f}")
+    print(f"Packed blobs save {row_bytes - blob_bytes} bytes ({1 - blob_bytes / row_bytes:.0%}).")
+    print(f"Replay keys alone save {row_bytes - replay_bytes} bytes ({1 - replay_bytes / row_bytes:.0%}).")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
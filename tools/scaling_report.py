@@ -0,0 +1,76 @@
+"""
+Measure how full-engine matchday simulation scales with worker processes.
+
+Runs the same synthetic fixtures with 1..N workers, checks that every run
+produces identical results, and prints wall time and speed-up per worker count.
+Each worker count is timed on a pool whose workers have already started.
+
+Usage:
+    python -m tools.scaling_report [--matches 2000] [--max-workers N]
+"""
+import argparse
+import os
+import random
+import time
+from engine import rate_team
+from engine.parallel import SimulationPool, match_seed, simulate_fixtures
+
+POSITIONS = ['Goalkeeper'] + ['Defender'] * 5 + ['Midfielder'] * 5 + ['Forward'] * 3 + ['Winger'] * 2
+
+
+def synthetic_world(matches, teams=92, seed=2024):
+    """Build random team ratings and a fixture list without touching the database."""
+    rng = random.Random(seed)
+    ratings = {}
+    for team_id in range(1, teams + 1):
+        players = [
+            (team_id * 100 + number, position, rng.randint(40, 90), rng.randint(30, 90))
+            for number, position in enumerate(POSITIONS)
+        ]
+        ratings[team_id] = rate_team(players, rng.choice(['4-4-2', '4-3-3', '3-5-2', '5-3-2']),
+                                     rng.choice(['Balanced', 'Offensive', 'Defensive']))
+    fixtures = []
+    for match_id in range(1, matches + 1):
+        home_id, away_id = rng.sample(range(1, teams + 1), 2)
+        fixtures.append((match_id, match_seed(seed, match_id), home_id, away_id))
+    return fixtures, ratings
+
+
+def measure(fixtures, ratings, max_workers):
+    """Return [(workers, seconds)] and whether every run matched the single-process results."""
+    timings = []
+    baseline = None
+    identical = True
+    for workers in range(1, max_workers + 1):
+        with SimulationPool(workers) as pool:
+            # Start the workers first; a season pays that once, not per matchday
+            simulate_fixtures(fixtures, ratings, pool=pool)
+            start = time.perf_counter()
+            results = simulate_fixtures(fixtures, ratings, pool=pool)
+            timings.append((workers, time.perf_counter() - start))
+        if baseline is None:
+            baseline = results
+        elif results != baseline:
+            identical = False
+    return timings, identical
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report matchday simulation scaling across worker processes.")
+    parser.add_argument('--matches', type=int, default=2000, help="Number of synthetic fixtures")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1, help="Highest worker count to try")
+    args = parser.parse_args(argv)
+
+    fixtures, ratings = synthetic_world(args.matches)
+    timings, identical = measure(fixtures, ratings, args.max_workers)
+    single = timings[0][1]
+    print(f"{args.matches} matches, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7} {'seconds':>9} {'matches/s':>10} {'speed-up':>9}")
+    for workers, seconds in timings:
+        print(f"{workers:>7} {seconds:>9.3f} {args.matches / seconds:>10.0f} {single / seconds:>8.2f}x")
+    print("Results identical across worker counts." if identical else "WARNING: results differ between worker counts!")
+    return 0 if identical else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -22,5 +22,23 @@ FPS = 60
 # Menu settings
 MENU_OPTIONS_SPACING = 60
 
+# One JSON league pack per country, loaded the first time that country is needed
+LEAGUE_PACK_DIR = 'data/leagues'
+
 # Save game path
 SAVE_GAME_PATH = 'savegames/game.db'
+
+# Prebuilt starting world cloned for every new game (rebuild with tools/build_template.py)
+TEMPLATE_DB_PATH = 'data/template.db'
+
+# Seconds between autosaves of the in-memory working database
+AUTOSAVE_INTERVAL = 300
+
+# Seconds before on-screen data is re-queried in the background
+DATA_REFRESH_INTERVAL = 1.0
+
+# Rows fetched per page by the list screens
+LIST_PAGE_SIZE = 15
+
+# Matchdays whose event logs are kept; older fully simulated matches are replayed from their seed
+EVENT_LOG_MATCHDAYS = 5
@@ -8,6 +8,10 @@ def setup_logger(name, log_file, level=logging.INFO):
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    # Already configured; avoid opening another log file handle
+    if logger.handlers:
+        return logger
+
     # Create log directory if it doesn't exist
     log_dir = os.path.dirname(log_file)
     if log_dir and not os.path.exists(log_dir):
@@ -27,9 +31,8 @@ def setup_logger(name, log_file, level=logging.INFO):
     ch.setFormatter(formatter)
 
     # Add the handlers to the logger
-    if not logger.handlers:
-        logger.addHandler(fh)
-        logger.addHandler(ch)
+    logger.addHandler(fh)
+    logger.addHandler(ch)
 
     return logger
 
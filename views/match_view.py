@@ -1,17 +1,151 @@
 import pygame
+from engine.match_engine import GOAL, MINUTES
+
+# Match minutes played per second of playback; None plays the rest of the match at once
+PLAYBACK_SPEEDS = {'1x': 1.0, '4x': 4.0, 'Instant': None}
+SPEED_KEYS = {pygame.K_1: '1x', pygame.K_4: '4x', pygame.K_i: 'Instant'}
+VISIBLE_LINES = 18
+
+
+class LivePlayback:
+    """
+    Paces a live match against the clock.
+
+    events is an iterator of (event, commentary line) pairs. An event is only
+    pulled once the match clock reaches the previous one, so the engine never
+    runs ahead of the screen by more than one event.
+    """
+
+    def __init__(self, events, speed='1x'):
+        self.events = iter(events)
+        self.speed = speed
+        self.minute = 0.0
+        self.score = [0, 0]
+        self.lines = []
+        self.finished = False
+        self._pending = None
+
+    def advance(self, seconds):
+        """Run the clock on by seconds of playback and return the newly due commentary lines."""
+        rate = PLAYBACK_SPEEDS[self.speed]
+        if rate is None:
+            return self.skip_to_end()
+        self.minute = min(self.minute + seconds * rate, MINUTES)
+        return self._pull(self.minute)
+
+    def skip_to_end(self):
+        """Drain the rest of the match in one go, with no frames drawn in between."""
+        self.minute = MINUTES
+        return self._pull(None)
+
+    def _pull(self, until):
+        new_lines = []
+        while not self.finished:
+            if self._pending is None:
+                try:
+                    self._pending = next(self.events)
+                except StopIteration:
+                    self.finished = True
+                    break
+            event, line = self._pending
+            if until is not None and event.minute > until:
+                break
+            self._pending = None
+            if event.kind == GOAL:
+                self.score[event.side] += 1
+            new_lines.append(line)
+        self.lines.extend(new_lines)
+        return new_lines
+
 
 class MatchView:
     def __init__(self, screen):
         self.screen = screen
         try:
             self.font = pygame.font.Font('assets/fonts/c64_font.ttf', 24)
+            self.small_font = pygame.font.Font('assets/fonts/c64_font.ttf', 16)
         except FileNotFoundError:
             self.font = pygame.font.SysFont('Arial', 24)
+            self.small_font = pygame.font.SysFont('Arial', 16)
             print("Custom font not found. Using default font.")
         self.menu_options = ["Back to Main Menu", "View Match Details", "Simulate Match", "Delete Match"]
         self.selected_index = 0
         self.matches = []
-        self.selected_match = None
+        self.match_index = 0  # Position of the selected match in the page shown, moved with Left/Right
+        self.details = None  # (title, commentary lines) while a match's details are shown
+        self.playback = None  # LivePlayback while a match is being played live
+        self.playback_teams = None
+        self._line_surfaces = {}  # Commentary line index -> rendered text, so each line is drawn once
+        self._header = (None, None)
+
+    @property
+    def selected_match(self):
+        """The match the list cursor is on, or None while there are no matches."""
+        if not self.matches:
+            return None
+        return self.matches[min(self.match_index, len(self.matches) - 1)]
+
+    def select_match(self, step):
+        """
+        Move the cursor by step within the page shown.
+
+        Returns "Next Page" or "Previous Page" when the cursor would leave the
+        page, so the controller can fetch the adjoining page of matches.
+        """
+        if not self.matches:
+            return None
+        index = min(self.match_index, len(self.matches) - 1) + step
+        if index >= len(self.matches):
+            return "Next Page"
+        if index < 0:
+            return "Previous Page"
+        self.match_index = index
+        return None
+
+    def show_details(self, match, lines):
+        self.details = (f"Team {match.home_team} {match.home_score} - {match.away_score} Team {match.away_team}", lines)
+
+    def close_details(self):
+        """Leave the details or live playback screen."""
+        self.details = None
+        self.playback = None
+        self._line_surfaces = {}
+
+    def start_playback(self, match, events, speed='1x'):
+        self.close_details()
+        self.playback = LivePlayback(events, speed)
+        self.playback_teams = (f"Team {match.home_team}", f"Team {match.away_team}")
+
+    def advance_playback(self, seconds):
+        if self.playback is not None:
+            self.playback.advance(seconds)
+
+    def display_playback(self):
+        playback = self.playback
+        self.screen.fill((0, 0, 0))
+        home, away = self.playback_teams
+        clock = "FT" if playback.finished and playback.minute >= MINUTES else f"{int(playback.minute)}'"
+        header = f"{home} {playback.score[0]} - {playback.score[1]} {away}  {clock}"
+        if self._header[0] != header:
+            self._header = (header, self.font.render(header, True, (255, 255, 255)))
+        self.screen.blit(self._header[1], (400 - self._header[1].get_width() // 2, 30))
+
+        # Only lines that have not been drawn before are rendered
+        first = max(0, len(playback.lines) - VISIBLE_LINES)
+        self._line_surfaces = {i: surface for i, surface in self._line_surfaces.items() if i >= first}
+        for row, i in enumerate(range(first, len(playback.lines))):
+            surface = self._line_surfaces.get(i)
+            if surface is None:
+                surface = self._line_surfaces[i] = self.small_font.render(playback.lines[i], True, (200, 200, 200))
+            self.screen.blit(surface, (40, 80 + row * 24))
+
+        if playback.finished:
+            footer = "Full time - press Enter to go back"
+        else:
+            footer = f"Speed {playback.speed}   1 / 4 / I: 1x, 4x, instant   Enter: skip to end"
+        text = self.small_font.render(footer, True, (100, 100, 100))
+        self.screen.blit(text, (400 - text.get_width() // 2, 560))
+        pygame.display.flip()
 
     def display_matches(self, matches):
         self.matches = matches
@@ -23,8 +157,9 @@ class MatchView:
         self.screen.blit(title, (400 - title.get_width() // 2, y_offset))
         y_offset += 40
 
+        selected_match = self.selected_match
         for i, match in enumerate(self.matches):
-            if i == self.selected_index:
+            if match is selected_match:
                 color = (255, 255, 255)  # White for selected
             else:
                 color = (100, 100, 100)  # Gray for others
@@ -46,12 +181,48 @@ class MatchView:
 
         pygame.display.flip()
 
+    def display_match_details(self):
+        title, lines = self.details
+        self.screen.fill((0, 0, 0))
+        text = self.font.render(title, True, (255, 255, 255))
+        self.screen.blit(text, (400 - text.get_width() // 2, 30))
+        if not lines:
+            lines = ["No commentary for this match."]
+        # Only as many lines as fit above the footer
+        for i, line in enumerate(lines[:20]):
+            text = self.small_font.render(line, True, (200, 200, 200))
+            self.screen.blit(text, (40, 80 + i * 22))
+        footer = self.small_font.render("Press Enter to go back", True, (100, 100, 100))
+        self.screen.blit(footer, (400 - footer.get_width() // 2, 560))
+        pygame.display.flip()
+
     def handle_input(self, event):
+        if self.playback is not None:
+            if event.type == pygame.KEYDOWN:
+                if event.key in SPEED_KEYS:
+                    self.playback.speed = SPEED_KEYS[event.key]
+                elif event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
+                    if self.playback.finished:
+                        return "Back to Matches"
+                    self.playback.skip_to_end()
+            return None
+        if self.details is not None:
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_ESCAPE):
+                return "Back to Matches"
+            return None
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP:
                 self.selected_index = (self.selected_index - 1) % len(self.menu_options)
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.menu_options)
+            elif event.key == pygame.K_LEFT:
+                return self.select_match(-1)
+            elif event.key == pygame.K_RIGHT:
+                return self.select_match(1)
+            elif event.key == pygame.K_PAGEDOWN:
+                return "Next Page"
+            elif event.key == pygame.K_PAGEUP:
+                return "Previous Page"
             elif event.key == pygame.K_RETURN:
                 return self.menu_options[self.selected_index]
         return None
@@ -51,6 +51,10 @@ class PlayerView:
                 self.selected_index = (self.selected_index - 1) % len(self.menu_options)
             elif event.key == pygame.K_DOWN:
                 self.selected_index = (self.selected_index + 1) % len(self.menu_options)
+            elif event.key == pygame.K_PAGEDOWN:
+                return "Next Page"
+            elif event.key == pygame.K_PAGEUP:
+                return "Previous Page"
             elif event.key == pygame.K_RETURN:
                 return self.menu_options[self.selected_index]
         return None
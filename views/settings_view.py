@@ -8,12 +8,27 @@ class SettingsView:
         except FileNotFoundError:
             self.font = pygame.font.SysFont('Arial', 24)
             print("Custom font not found. Using default font.")
-        self.menu_options = ["Back to Main Menu", "Difficulty: Easy", "Audio: On", "Controls", "Apply Settings"]
+        self.menu_options = ["Back to Main Menu", "Difficulty: Easy", "Audio: On", "Performance: balanced", "Controls", "Apply Settings"]
         self.selected_index = 0
         self.difficulty_levels = ["Easy", "Medium", "Hard"]
         self.audio_settings = ["On", "Off"]
         self.current_difficulty = 0  # Index of difficulty_levels
         self.current_audio = 0       # Index of audio_settings
+        self.performance_profiles = ["safe", "balanced", "fast-sim"]
+        self.current_performance = 1  # Index of performance_profiles
+
+    def load_settings(self, settings):
+        """Select the saved settings, so applying keeps whatever the player leaves unchanged."""
+        settings = settings or {}
+        if settings.get('difficulty') in self.difficulty_levels:
+            self.current_difficulty = self.difficulty_levels.index(settings['difficulty'])
+        if settings.get('audio') in self.audio_settings:
+            self.current_audio = self.audio_settings.index(settings['audio'])
+        if settings.get('performance_profile') in self.performance_profiles:
+            self.current_performance = self.performance_profiles.index(settings['performance_profile'])
+        self.menu_options[1] = f"Difficulty: {self.difficulty_levels[self.current_difficulty]}"
+        self.menu_options[2] = f"Audio: {self.audio_settings[self.current_audio]}"
+        self.menu_options[3] = f"Performance: {self.performance_profiles[self.current_performance]}"
 
     def display_settings(self):
         self.screen.fill((0, 0, 0))  # Clear screen with black
@@ -27,12 +42,15 @@ class SettingsView:
         # Display Current Settings
         difficulty = self.font.render(f"Difficulty: {self.difficulty_levels[self.current_difficulty]}", True, (255, 255, 255))
         audio = self.font.render(f"Audio: {self.audio_settings[self.current_audio]}", True, (255, 255, 255))
+        performance = self.font.render(f"Performance: {self.performance_profiles[self.current_performance]}", True, (255, 255, 255))
         controls = self.font.render("Controls: WASD or Arrow Keys", True, (255, 255, 255))
 
         self.screen.blit(difficulty, (400 - difficulty.get_width() // 2, y_offset))
         y_offset += 30
         self.screen.blit(audio, (400 - audio.get_width() // 2, y_offset))
         y_offset += 30
+        self.screen.blit(performance, (400 - performance.get_width() // 2, y_offset))
+        y_offset += 30
         self.screen.blit(controls, (400 - controls.get_width() // 2, y_offset))
         y_offset += 50
 
@@ -71,3 +89,7 @@ class SettingsView:
         elif self.selected_index == 2:
             self.current_audio = (self.current_audio + direction) % len(self.audio_settings)
             self.menu_options[2] = f"Audio: {self.audio_settings[self.current_audio]}"
+        # Adjust Performance profile
+        elif self.selected_index == 3:
+            self.current_performance = (self.current_performance + direction) % len(self.performance_profiles)
+            self.menu_options[3] = f"Performance: {self.performance_profiles[self.current_performance]}"
@@ -1,12 +1,12 @@
 import pygame
-from database.db_manager import DatabaseManager
+from database.db_manager import get_database_manager
 from views.team_view import TeamView  # Import TeamView
 
 class TeamSelectionView:
-    def __init__(self, screen, game_state):
+    def __init__(self, screen, game_state=None, db_manager=None):
         self.screen = screen
         self.game_state = game_state
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or get_database_manager()
         self.font = pygame.font.Font(None, 36)
         self.selected_team_index = 0
         self.teams = []
@@ -44,8 +44,8 @@ class TeamSelectionView:
             elif event.key == pygame.K_DOWN:
                 self.selected_team_index = (self.selected_team_index + 1) % len(self.teams)
             elif event.key == pygame.K_RETURN:
-                if self.teams:
+                if self.teams and self.game_state is not None:
                     selected_team = self.teams[self.selected_team_index]
                     self.game_state.selected_team_id = selected_team['id']
                     # Transition to the team view
-                    self.game_state.current_view = TeamView(self.screen, self.game_state)
\ No newline at end of file
+                    self.game_state.current_view = TeamView(self.screen, self.game_state, self.db_manager)
\ No newline at end of file
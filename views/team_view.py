@@ -1,14 +1,15 @@
 import pygame
-from database.db_manager import DatabaseManager
+from database.db_manager import get_database_manager
 
 class TeamView:
-    def __init__(self, screen, game_state):
+    def __init__(self, screen, game_state=None, db_manager=None):
         self.screen = screen
         self.game_state = game_state
-        self.db_manager = DatabaseManager()
+        self.db_manager = db_manager or get_database_manager()
         self.font = pygame.font.Font(None, 36)
         # Load the selected team from the game state
-        self.team = self.db_manager.get_team_by_id(self.game_state.selected_team_id)
+        if self.game_state is not None:
+            self.team = self.db_manager.get_team_by_id(self.game_state.selected_team_id)
         try:
             self.font = pygame.font.Font('assets/fonts/c64_font.ttf', 24)
         except FileNotFoundError: